@@ -44,30 +44,65 @@ class PatternExtractor:
             "categorized_complaints": categorized
         }
     
-    def _categorize_complaints(self, reviews: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
-        """Categorize complaints by keyword type"""
-        categorized = {
+    def extract_patterns_with_sentiment(self, reviews: List[Dict[str, Any]], sentiment_analyzer) -> Dict[str, Any]:
+        """
+        Score sentiment and extract pain patterns in a single pass over reviews
+        
+        Each review is lowercased once and the result is shared between the
+        sentiment scorer and the keyword categorizer. Reviews are annotated in
+        place, same as SentimentAnalyzer.analyze_sentiment.
+        """
+        if not reviews:
+            return self.extract_patterns(reviews)
+        
+        if sentiment_analyzer.use_embeddings:
+            # Embedding model encodes the whole batch at once, so it can't be fused per review
+            sentiment_analyzer.analyze_sentiment(reviews)
+            return self.extract_patterns(reviews)
+        
+        categorized = self._empty_categories()
+        for review in reviews:
+            text_lower = review["text"].lower()
+            sentiment_analyzer.score_review(review, text_lower)
+            self._categorize_review(review, text_lower, categorized)
+        
+        patterns = self._cluster_patterns(reviews)
+        filtered_patterns = self._filter_by_frequency(patterns, len(reviews))
+        
+        return {
+            "patterns": filtered_patterns,
+            "total_reviews": len(reviews),
+            "categorized_complaints": categorized
+        }
+    
+    @staticmethod
+    def _empty_categories() -> Dict[str, List[Dict[str, Any]]]:
+        return {
             "missing_feature": [],
             "wish_desire": [],
             "cant_blocks": []
         }
+    
+    def _categorize_complaints(self, reviews: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+        """Categorize complaints by keyword type"""
+        categorized = self._empty_categories()
         
         for review in reviews:
-            text_lower = review["text"].lower()
-            
-            for category, keywords in self.keywords.items():
-                for keyword in keywords:
-                    if keyword.lower() in text_lower:
-                        categorized[category].append({
-                            "text": review["text"],
-                            "rating": review.get("rating"),
-                            "source": review.get("source"),
-                            "matched_keyword": keyword
-                        })
-                        break  # Only count once per review
+            self._categorize_review(review, review["text"].lower(), categorized)
         
         return categorized
     
+    def _categorize_review(self, review: Dict[str, Any], text_lower: str,
+                           categorized: Dict[str, List[Dict[str, Any]]]) -> None:
+        """Append a review to each keyword category it matches"""
+        for category, keyword in config.first_pain_match_per_category(text_lower, lowered=True).items():
+            categorized[category].append({
+                "text": review["text"],
+                "rating": review.get("rating"),
+                "source": review.get("source"),
+                "matched_keyword": keyword
+            })
+    
     def _cluster_patterns(self, reviews: List[Dict]) -> List[Dict]:
         """Cluster similar complaints to identify patterns"""
         if len(reviews) < 3:
@@ -144,13 +179,8 @@ class PatternExtractor:
         patterns = defaultdict(list)
         
         for review in reviews:
-            text_lower = review["text"].lower()
-            # Find matching keywords
-            for category, keywords in self.keywords.items():
-                for keyword in keywords:
-                    if keyword.lower() in text_lower:
-                        patterns[f"{category}: {keyword}"].append(review)
-                        break
+            for category, keyword in config.first_pain_match_per_category(review["text"]).items():
+                patterns[f"{category}: {keyword}"].append(review)
         
         result = []
         for pattern_name, pattern_reviews in patterns.items():
@@ -275,18 +275,13 @@ class PatternExtractorV2:
         }
         
         for review in reviews:
-            text_lower = review["text"].lower()
-            
-            for category, keywords in self.keywords.items():
-                for keyword in keywords:
-                    if keyword.lower() in text_lower:
-                        categorized[category].append({
-                            "text": review["text"],
-                            "rating": review.get("rating"),
-                            "source": review.get("source"),
-                            "matched_keyword": keyword
-                        })
-                        break
+            for category, keyword in config.first_pain_match_per_category(review["text"]).items():
+                categorized[category].append({
+                    "text": review["text"],
+                    "rating": review.get("rating"),
+                    "source": review.get("source"),
+                    "matched_keyword": keyword
+                })
         
         return categorized
     
@@ -295,12 +290,8 @@ class PatternExtractorV2:
         patterns = defaultdict(list)
         
         for review in reviews:
-            text_lower = review["text"].lower()
-            for category, keywords in self.keywords.items():
-                for keyword in keywords:
-                    if keyword.lower() in text_lower:
-                        patterns[f"{category}: {keyword}"].append(review)
-                        break
+            for category, keyword in config.first_pain_match_per_category(review["text"]).items():
+                patterns[f"{category}: {keyword}"].append(review)
         
         result = []
         for pattern_name, pattern_reviews in patterns.items():
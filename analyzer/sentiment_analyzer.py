@@ -16,6 +16,12 @@ except ImportError:
     SENTENCE_TRANSFORMERS_AVAILABLE = False
     logger.warning("sentence-transformers not available, using simple sentiment analysis")
 
+# Keyword lists for the simple (non-embedding) sentiment score
+SIMPLE_NEGATIVE_WORDS = ('terrible', 'awful', 'worst', 'hate', 'disappointed',
+                         'frustrated', 'broken', 'problem', 'issue', 'bug', 'missing',
+                         'doesn\'t', 'cannot', 'unable', 'failed', 'error')
+SIMPLE_POSITIVE_WORDS = ('good', 'great', 'excellent', 'love', 'amazing', 'perfect', 'works')
+
 
 class SentimentAnalyzer:
     """Analyze sentiment and cluster similar complaints"""
@@ -100,24 +106,32 @@ class SentimentAnalyzer:
     
     def _analyze_simple(self, reviews: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Simple sentiment analysis without embeddings"""
-        negative_words = ['terrible', 'awful', 'worst', 'hate', 'disappointed', 
-                        'frustrated', 'broken', 'problem', 'issue', 'bug', 'missing',
-                        'doesn\'t', 'cannot', 'unable', 'failed', 'error']
-        positive_words = ['good', 'great', 'excellent', 'love', 'amazing', 'perfect', 'works']
-        
         for review in reviews:
-            text_lower = review.get('text', '').lower()
-            negative_count = sum(1 for word in negative_words if word in text_lower)
-            positive_count = sum(1 for word in positive_words if word in text_lower)
-            
-            sentiment_score = (positive_count - negative_count) / max(len(text_lower.split()), 1)
-            review['sentiment_score'] = float(sentiment_score)
-            review['sentiment_label'] = 'very_negative' if sentiment_score < -0.1 else 'negative' if sentiment_score < 0 else 'neutral'
-            review['sentiment_cluster'] = None
-            review['cluster_similarity'] = None
+            self.score_review(review, review.get('text', '').lower())
         
         return reviews
     
+    def score_review(self, review: Dict[str, Any], text_lower: str) -> Dict[str, Any]:
+        """
+        Add simple keyword sentiment fields to a single review in place
+        
+        Args:
+            review: Review dictionary to annotate
+            text_lower: Lowercased review text (shared with other passes)
+            
+        Returns:
+            The same review dictionary
+        """
+        negative_count = sum(1 for word in SIMPLE_NEGATIVE_WORDS if word in text_lower)
+        positive_count = sum(1 for word in SIMPLE_POSITIVE_WORDS if word in text_lower)
+        
+        sentiment_score = (positive_count - negative_count) / max(len(text_lower.split()), 1)
+        review['sentiment_score'] = float(sentiment_score)
+        review['sentiment_label'] = 'very_negative' if sentiment_score < -0.1 else 'negative' if sentiment_score < 0 else 'neutral'
+        review['sentiment_cluster'] = None
+        review['cluster_similarity'] = None
+        return review
+    
     def cluster_by_sentiment(self, reviews: List[Dict[str, Any]], n_clusters: int = 5) -> List[List[Dict[str, Any]]]:
         """
         Cluster reviews by sentiment similarity
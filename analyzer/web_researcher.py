@@ -49,7 +49,7 @@ class WebResearcher:
                 logger.warning("Web search failed", status=response.status_code)
                 return []
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml')
             results = []
             
             # Parse DuckDuckGo results (structure may vary)
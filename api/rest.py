@@ -173,10 +173,7 @@ def run_analysis_background(
         all_results: TypingDict[str, Any] = {}
         
         for tool_name in tools:
-            tool_config = next(
-                (t for t in config.B2B_TOOLS if t["name"] == tool_name),
-                None
-            )
+            tool_config = config.B2B_TOOLS_BY_NAME.get(tool_name)
             if not tool_config:
                 continue
             
@@ -260,7 +257,7 @@ async def list_tools(api_key: str = Depends(check_rate_limit)):
         List of available tools
     """
     return [
-        {"name": tool["name"], "category": tool["category"]}
+        {"name": tool.name, "category": tool.category}
         for tool in config.B2B_TOOLS
     ]
 
@@ -2,17 +2,66 @@
 
 import streamlit as st
 import pandas as pd
-from typing import List, Dict, Optional
-import json
+from pathlib import Path
+from typing import Callable, List, Dict, Optional, Tuple, Union
+import csv
+import gzip
+import hashlib
+import heapq
+import io
+import os
 import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from functools import lru_cache
 
 from scraper import G2Scraper, CapterraScraper
 from analyzer import PatternExtractor, XAIClient
 import config
 from utils.logging import get_logger
+from utils.serialization import dumps_json, loads_json
+
+# PDF export is optional
+try:
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+    REPORTLAB_AVAILABLE = True
+except ImportError:
+    REPORTLAB_AVAILABLE = False
 
 logger = get_logger(__name__)
 
+# On-disk cache for scraped reviews (gzipped JSON, keyed on tool + date range)
+REVIEW_CACHE_DIR = Path(".cache/reviews")
+REVIEW_CACHE_TTL_SECONDS = 6 * 3600
+
+# Upper bound on tools scraped and analyzed concurrently
+MAX_PARALLEL_TOOLS = 4
+
+# Max seconds to wait for all roadmap generation calls together
+ROADMAP_TIMEOUT_SECONDS = 60
+
+# Pre-configured tools table for the instructions page (B2B_TOOLS is static)
+_TOOLS_DF = pd.DataFrame({
+    "Tool": [tool.name for tool in config.B2B_TOOLS],
+    "Category": [tool.category for tool in config.B2B_TOOLS],
+})
+
+# Column order for the opportunities CSV export
+CSV_HEADER = (
+    "Tool", "Pattern", "Idea Name", "Value Prop", "Target", "MVP Scope",
+    "Monetization", "Type", "Feasibility Score", "Market Size Score", "Estimated TAM",
+)
+
+# Upload file suffix -> (pandas reader, display label)
+UPLOAD_READERS = {
+    '.csv': (pd.read_csv, "CSV"),
+    '.xlsx': (pd.read_excel, "Excel"),
+    '.xls': (pd.read_excel, "Excel"),
+}
+
 # Page config
 st.set_page_config(
     page_title="B2B Complaint Analyzer",
@@ -76,7 +125,7 @@ def main():
         
         # Tool selection
         st.header("📊 Select Tools")
-        tool_names = [tool["name"] for tool in config.B2B_TOOLS]
+        tool_names = [tool.name for tool in config.B2B_TOOLS]
         selected_tools = st.multiselect(
             "Choose B2B tools to analyze",
             tool_names,
@@ -115,22 +164,15 @@ def main():
                 if "uploaded_data" in st.session_state:
                     del st.session_state.uploaded_data
                 
-                if uploaded_file.name.endswith('.csv'):
-                    import pandas as pd
-                    df = pd.read_csv(uploaded_file)
-                    if len(df) > 0:
-                        st.success(f"✅ Loaded {len(df)} rows from CSV")
-                        st.session_state.uploaded_data = df.to_dict('records')
-                    else:
-                        st.warning("⚠️ CSV file is empty")
-                elif uploaded_file.name.endswith(('.xlsx', '.xls')):
-                    import pandas as pd
-                    df = pd.read_excel(uploaded_file)
+                suffix = Path(uploaded_file.name).suffix.lower()
+                reader, label = UPLOAD_READERS.get(suffix, (None, None))
+                if reader is not None:
+                    df = reader(uploaded_file)
                     if len(df) > 0:
-                        st.success(f"✅ Loaded {len(df)} rows from Excel")
+                        st.success(f"✅ Loaded {len(df)} rows from {label}")
                         st.session_state.uploaded_data = df.to_dict('records')
                     else:
-                        st.warning("⚠️ Excel file is empty")
+                        st.warning(f"⚠️ {label} file is empty")
             except Exception as e:
                 st.error(f"❌ Error loading file: {str(e)}")
                 # Clear invalid data
@@ -211,11 +253,180 @@ def show_instructions():
     The following B2B tools are pre-configured:
     """)
     
-    tools_df = pd.DataFrame([
-        {"Tool": tool["name"], "Category": tool["category"]}
-        for tool in config.B2B_TOOLS
-    ])
-    st.dataframe(tools_df, width='stretch', hide_index=True)
+    st.dataframe(_TOOLS_DF, width='stretch', hide_index=True)
+
+
+def _review_cache_path(tool_name: str, date_from: Optional[str], date_to: Optional[str]) -> Path:
+    """Build the cache path for a (tool, date range) scrape"""
+    fingerprint = f"{tool_name}|{date_from}|{date_to}|{config.MAX_REVIEWS_PER_TOOL}"
+    key = hashlib.sha1(fingerprint.encode()).hexdigest()[:16]
+    return REVIEW_CACHE_DIR / f"{key}.json.gz"
+
+
+def load_cached_reviews(path: Path) -> Optional[Tuple[List[Dict], List[str]]]:
+    """Load reviews and their source labels from the on-disk cache if present and fresh"""
+    try:
+        if not path.exists() or time.time() - path.stat().st_mtime >= REVIEW_CACHE_TTL_SECONDS:
+            return None
+        with gzip.open(path, 'rb') as f:
+            cached = loads_json(f.read())
+        return cached["reviews"], cached["sources_succeeded"]
+    except Exception as e:
+        logger.warning("Could not read review cache", path=str(path), error=str(e))
+        return None
+
+
+def save_cached_reviews(path: Path, reviews: List[Dict], sources_succeeded: List[str]) -> None:
+    """
+    Persist scraped reviews to the on-disk cache (gzipped JSON)
+    
+    JSON keeps each review dict exactly as scraped: sources emit different
+    keys, and a columnar format would fill the gaps with NaN/None.
+    """
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = dumps_json({"reviews": reviews, "sources_succeeded": sources_succeeded})
+        tmp_path = path.with_name(f"{path.name}.tmp")
+        with gzip.open(tmp_path, 'wb', compresslevel=6) as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+    except Exception as e:
+        logger.warning("Could not write review cache", path=str(path), error=str(e))
+
+
+def _analyze_tool(
+    tool_name: str,
+    tool_config: config.B2BTool,
+    multi_scraper,
+    pattern_extractor: PatternExtractor,
+    sentiment_analyzer,
+    xai_client: Optional[XAIClient],
+    uploaded_data: Optional[List[Dict]],
+    text_key: Optional[str],
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None
+) -> Tuple[Optional[Dict], List[Tuple[str, str]]]:
+    """
+    Scrape and analyze a single tool (runs in a worker thread)
+    
+    Streamlit elements can only be written from the script thread, so
+    user-facing messages are collected as (level, text) pairs and rendered
+    by the caller.
+    
+    Returns:
+        Tuple of (tool results or None if skipped, messages)
+    """
+    messages = []
+    
+    # Scrape from all sources with intelligent fallbacks (reuse a fresh on-disk copy if any)
+    try:
+        cache_path = _review_cache_path(tool_name, date_from, date_to)
+        cached = load_cached_reviews(cache_path)
+        if cached:
+            reviews, sources_succeeded = cached
+            logger.info("Using cached reviews from disk", tool_name=tool_name, count=len(reviews))
+        else:
+            reviews, sources_succeeded = multi_scraper.scrape_all_sources(
+                tool_name=tool_name,
+                tool_slug=tool_config.get("g2_slug"),
+                tool_id=tool_config.get("capterra_id"),
+                product_slug=tool_config.get("ph_slug"),
+                max_per_source=config.MAX_REVIEWS_PER_TOOL,
+                date_from=date_from,
+                date_to=date_to
+            )
+            if reviews:
+                save_cached_reviews(cache_path, reviews, sources_succeeded)
+        
+        if reviews:
+            messages.append(("success", f"✓ Found {len(reviews)} reviews from: {', '.join(sources_succeeded)}"))
+        else:
+            messages.append(("warning", f"⚠️ No reviews found from any source for {tool_name}"))
+    except Exception as e:
+        messages.append(("error", f"❌ Error scraping {tool_name}: {str(e)}"))
+        reviews = []
+    
+    if not reviews:
+        messages.append(("error", f"❌ No reviews found for {tool_name}. Skipping..."))
+        return None, messages
+    
+    # Merge uploaded data if available (Phase 2 enhancement)
+    if uploaded_data and text_key:
+        uploaded_reviews = [
+            {
+                'text': row[text_key],
+                'rating': row.get('rating', 1),
+                'source': 'Internal Upload',
+                'date': row.get('date', ''),
+                'tool': tool_name
+            }
+            for row in uploaded_data
+            if isinstance(row, dict) and row.get(text_key)
+        ]
+        if uploaded_reviews:
+            reviews.extend(uploaded_reviews)
+            messages.append(("info", f"📤 Added {len(uploaded_reviews)} reviews from uploaded data"))
+    
+    # Validate and filter reviews for quality (Phase 2 enhancement)
+    if xai_client:
+        from analyzer.data_validator import DataValidator
+        validator = DataValidator(xai_client)
+        
+        # Filter by relevance
+        reviews = validator.filter_reviews_by_relevance(reviews, tool_name, min_score=5)
+        
+        # Detect bias patterns
+        bias_results = validator.detect_bias_patterns(reviews)
+        if bias_results.get('bias_flags'):
+            messages.append(("warning", f"⚠️ Bias detected: {bias_results['recommendation']}"))
+    
+    # Extract patterns with sentiment analysis
+    pattern_results = pattern_extractor.extract_patterns_with_sentiment(reviews, sentiment_analyzer)
+    
+    # AI analysis with market validation
+    if xai_client:
+        try:
+            ai_analysis = xai_client.analyze_patterns(
+                tool_name,
+                pattern_results.get("patterns", []),
+                reviews
+            )
+            
+            # Generate product ideas
+            if ai_analysis.get("top_patterns"):
+                ideas = xai_client.generate_product_ideas(
+                    tool_name,
+                    ai_analysis["top_patterns"]
+                )
+                ai_analysis["product_ideas"] = ideas
+                
+                # Validate idea novelty (Phase 2 enhancement)
+                from analyzer.web_researcher import WebResearcher
+                researcher = WebResearcher()
+                
+                for idea_group in ideas:
+                    for idea in idea_group.get("ideas", []):
+                        idea_name = idea.get("name", "")
+                        idea_desc = idea.get("value_prop", "")
+                        
+                        if idea_name:
+                            novelty = researcher.validate_idea_novelty(idea_name, idea_desc)
+                            idea["novelty_validation"] = novelty
+                            idea["novelty_score"] = novelty.get("novelty_score", 5)
+                        
+                        score_idea_quality(idea)
+                
+        except Exception as e:
+            messages.append(("error", f"Error in AI analysis: {str(e)}"))
+            ai_analysis = {}
+    else:
+        ai_analysis = {}
+    
+    return {
+        "reviews": reviews,
+        "pattern_results": pattern_results,
+        "ai_analysis": ai_analysis
+    }, messages
 
 
 def run_full_analysis(selected_tools: List[str], date_from: Optional[str] = None, date_to: Optional[str] = None):
@@ -224,152 +435,78 @@ def run_full_analysis(selected_tools: List[str], date_from: Optional[str] = None
     status_text = st.empty()
     
     all_results = {}
-    total_steps = len(selected_tools) * 3 + 2  # 3 steps per tool + 2 final steps
+    total_steps = len(selected_tools) + 1  # one progress update per tool + opportunities
     current_step = 0
     
     try:
         # Initialize multi-source scraper
         from scraper.multi_source_scraper import MultiSourceScraper
+        from analyzer.sentiment_analyzer import SentimentAnalyzer
         multi_scraper = MultiSourceScraper()
         pattern_extractor = PatternExtractor()
+        sentiment_analyzer = SentimentAnalyzer()
+        xai_client = st.session_state.xai_client
         
-        # Process each tool
+        # Uploaded rows share one schema, so resolve the text column once per run
+        uploaded_data = st.session_state.get("uploaded_data")
+        text_key = None
+        if uploaded_data and isinstance(uploaded_data, list):
+            sample = next((r for r in uploaded_data if isinstance(r, dict)), {})
+            text_key = next((k for k in ('text', 'complaint', 'review') if k in sample), None)
+        
+        jobs = []
         for tool_name in selected_tools:
-            tool_config = next((t for t in config.B2B_TOOLS if t["name"] == tool_name), None)
-            if not tool_config:
-                continue
-            
-            status_text.text(f"📥 Scraping reviews for {tool_name} from multiple sources...")
-            current_step += 1
-            progress_bar.progress(current_step / total_steps)
-            
-            # Scrape from all sources with intelligent fallbacks
-            try:
-                reviews, sources_succeeded = multi_scraper.scrape_all_sources(
-                    tool_name=tool_name,
-                    tool_slug=tool_config.get("g2_slug"),
-                    tool_id=tool_config.get("capterra_id"),
-                    product_slug=tool_config.get("ph_slug"),
-                    max_per_source=config.MAX_REVIEWS_PER_TOOL,
-                    date_from=date_from,
-                    date_to=date_to
-                )
-                
-                if reviews:
-                    st.success(f"✓ Found {len(reviews)} reviews from: {', '.join(sources_succeeded)}")
-                else:
-                    st.warning(f"⚠️ No reviews found from any source for {tool_name}")
-            except Exception as e:
-                st.error(f"❌ Error scraping {tool_name}: {str(e)}")
-                reviews = []
-            
-            if not reviews:
-                st.error(f"❌ No reviews found for {tool_name}. Skipping...")
-                continue
-            
-            # Merge uploaded data if available (Phase 2 enhancement)
-            uploaded_data = st.session_state.get("uploaded_data")
-            if uploaded_data and isinstance(uploaded_data, list) and len(uploaded_data) > 0:
-                uploaded_reviews = [
-                    {
-                        'text': row.get('text', row.get('complaint', row.get('review', ''))),
-                        'rating': row.get('rating', 1),
-                        'source': 'Internal Upload',
-                        'date': row.get('date', ''),
-                        'tool': tool_name
-                    }
-                    for row in uploaded_data
-                    if isinstance(row, dict) and (row.get('text') or row.get('complaint') or row.get('review'))
-                ]
-                if uploaded_reviews:
-                    reviews.extend(uploaded_reviews)
-                    st.info(f"📤 Added {len(uploaded_reviews)} reviews from uploaded data")
-            
-            # Validate and filter reviews for quality (Phase 2 enhancement)
-            if st.session_state.xai_client:
-                status_text.text(f"✅ Validating review quality for {tool_name}...")
-                from analyzer.data_validator import DataValidator
-                validator = DataValidator(st.session_state.xai_client)
-                
-                # Filter by relevance
-                reviews = validator.filter_reviews_by_relevance(reviews, tool_name, min_score=5)
-                
-                # Detect bias patterns
-                bias_results = validator.detect_bias_patterns(reviews)
-                if bias_results.get('bias_flags'):
-                    st.warning(f"⚠️ Bias detected: {bias_results['recommendation']}")
-            
-            # Extract patterns with sentiment analysis
-            status_text.text(f"🔍 Analyzing patterns for {tool_name}...")
-            current_step += 1
-            progress_bar.progress(current_step / total_steps)
-            
-            # Add sentiment analysis
-            from analyzer.sentiment_analyzer import SentimentAnalyzer
-            sentiment_analyzer = SentimentAnalyzer()
-            reviews_with_sentiment = sentiment_analyzer.analyze_sentiment(reviews)
-            
-            pattern_results = pattern_extractor.extract_patterns(reviews_with_sentiment)
-            
-            # AI analysis with market validation
-            if st.session_state.xai_client:
-                status_text.text(f"🤖 AI analysis for {tool_name}...")
-                current_step += 1
-                progress_bar.progress(current_step / total_steps)
-                
-                try:
-                    ai_analysis = st.session_state.xai_client.analyze_patterns(
+            tool_config = config.B2B_TOOLS_BY_NAME.get(tool_name)
+            if tool_config:
+                jobs.append((tool_name, tool_config))
+        
+        # Tools are independent and I/O bound, so scrape and analyze them concurrently
+        tool_results = {}
+        if jobs:
+            status_text.text(f"📥 Scraping and analyzing {len(jobs)} tool(s) from multiple sources...")
+            with ThreadPoolExecutor(max_workers=min(len(jobs), MAX_PARALLEL_TOOLS)) as executor:
+                futures = {
+                    executor.submit(
+                        _analyze_tool,
                         tool_name,
-                        pattern_results.get("patterns", []),
-                        reviews
-                    )
+                        tool_config,
+                        multi_scraper,
+                        pattern_extractor,
+                        sentiment_analyzer,
+                        xai_client,
+                        uploaded_data,
+                        text_key,
+                        date_from,
+                        date_to
+                    ): tool_name
+                    for tool_name, tool_config in jobs
+                }
+                for future in as_completed(futures):
+                    tool_name = futures[future]
+                    try:
+                        result, messages = future.result()
+                    except Exception as e:
+                        logger.error("Tool analysis failed", tool_name=tool_name, error=str(e))
+                        result, messages = None, [("error", f"❌ Error analyzing {tool_name}: {str(e)}")]
                     
-                    # Generate product ideas
-                    if ai_analysis.get("top_patterns"):
-                        ideas = st.session_state.xai_client.generate_product_ideas(
-                            tool_name,
-                            ai_analysis["top_patterns"]
-                        )
-                        ai_analysis["product_ideas"] = ideas
-                        
-                        # Validate idea novelty (Phase 2 enhancement)
-                        from analyzer.web_researcher import WebResearcher
-                        researcher = WebResearcher()
-                        
-                        for idea_group in ideas:
-                            for idea in idea_group.get("ideas", []):
-                                idea_name = idea.get("name", "")
-                                idea_desc = idea.get("value_prop", "")
-                                
-                                if idea_name:
-                                    novelty = researcher.validate_idea_novelty(idea_name, idea_desc)
-                                    idea["novelty_validation"] = novelty
-                                    idea["novelty_score"] = novelty.get("novelty_score", 5)
-                        
-                except Exception as e:
-                    st.error(f"Error in AI analysis: {str(e)}")
-                    ai_analysis = {}
-            else:
-                ai_analysis = {}
-            
-            all_results[tool_name] = {
-                "reviews": reviews,
-                "pattern_results": pattern_results,
-                "ai_analysis": ai_analysis
-            }
+                    for level, message in messages:
+                        getattr(st, level)(message)
+                    if result:
+                        tool_results[tool_name] = result
+                    
+                    current_step += 1
+                    progress_bar.progress(current_step / total_steps)
+                    status_text.text(f"✓ Finished {tool_name}")
+        
+        # Keep results in the order the tools were selected
+        all_results = {name: tool_results[name] for name in selected_tools if name in tool_results}
         
         # Generate top 3 opportunities
-        if st.session_state.xai_client and all_results:
+        if xai_client and all_results:
             status_text.text("🎯 Generating top opportunities...")
-            current_step += 1
-            progress_bar.progress(current_step / total_steps)
             
             top_opportunities = generate_top_opportunities(all_results)
             
-            status_text.text("✅ Analysis complete!")
-            current_step += 1
-            progress_bar.progress(current_step / total_steps)
-            
             st.session_state.analysis_results = {
                 "tool_results": all_results,
                 "top_opportunities": top_opportunities
@@ -380,14 +517,46 @@ def run_full_analysis(selected_tools: List[str], date_from: Optional[str] = None
                 "top_opportunities": []
             }
         
-        time.sleep(1)
         progress_bar.empty()
         status_text.empty()
         
     except Exception as e:
         st.error(f"❌ Error during analysis: {str(e)}")
-        import traceback
-        st.code(traceback.format_exc())
+        if os.environ.get("B2B_DEBUG"):
+            with st.expander("Debug traceback", expanded=False):
+                st.code(traceback.format_exc())
+
+
+@st.cache_resource
+def _get_quality_rubric():
+    """Shared QualityRubric instance (stateless, safe to reuse across reruns)"""
+    from analyzer.quality_rubric import QualityRubric
+    return QualityRubric()
+
+
+def score_idea_quality(idea: Dict) -> Dict:
+    """Score an idea with the quality rubric and store score + recommendations on it"""
+    try:
+        rubric = _get_quality_rubric()
+        quality_score = rubric.score_idea(
+            idea,
+            novelty_score=idea.get('novelty_score'),
+            feasibility_score=idea.get('feasibility_score'),
+            market_size_score=idea.get('market_size_score')
+        )
+        recommendations = rubric.get_recommendations(quality_score)
+    except Exception as e:
+        logger.warning("Quality scoring failed", error=str(e))
+        quality_score = {
+            'overall_score': 0.5,
+            'overall_rating': 'Unable to assess',
+            'breakdown': {}
+        }
+        recommendations = []
+    
+    idea["quality_score"] = quality_score
+    idea["recommendations"] = recommendations
+    return quality_score
 
 
 def generate_top_opportunities(all_results: Dict) -> List[Dict]:
@@ -407,24 +576,34 @@ def generate_top_opportunities(all_results: Dict) -> List[Dict]:
                     "idea": idea
                 })
     
-    # Sort by potential (simple heuristic: prioritize standalone apps)
-    opportunities.sort(key=lambda x: (
+    # Rank by potential (simple heuristic: prioritize standalone apps); only the top 3 are needed
+    top_opportunities = heapq.nsmallest(3, opportunities, key=lambda x: (
         0 if x.get("idea", {}).get("type") == "standalone" else 1,
         -len(x.get("idea", {}).get("name", ""))
     ))
     
-    # Generate roadmaps for top 3
-    top_3 = []
-    for opp in opportunities[:3]:
-        if st.session_state.xai_client and opp.get("idea"):
-            try:
-                roadmap = st.session_state.xai_client.generate_roadmap(opp["idea"])
-                opp["roadmap"] = roadmap
-            except Exception as e:
-                st.warning(f"Could not generate roadmap: {str(e)}")
-        top_3.append(opp)
+    # Generate roadmaps for top 3 (independent API calls, so request them concurrently)
+    xai_client = st.session_state.xai_client
+    with_ideas = [opp for opp in top_opportunities if opp.get("idea")]
+    if xai_client and with_ideas:
+        # One deadline for the whole batch; a `with` block would wait for stragglers on exit
+        executor = ThreadPoolExecutor(max_workers=len(with_ideas))
+        try:
+            futures = [(executor.submit(xai_client.generate_roadmap, opp["idea"]), opp) for opp in with_ideas]
+            deadline = time.monotonic() + ROADMAP_TIMEOUT_SECONDS
+            for future, opp in futures:
+                try:
+                    opp["roadmap"] = future.result(timeout=max(0.0, deadline - time.monotonic()))
+                except FuturesTimeoutError:
+                    st.warning(
+                        f"Roadmap for {opp['idea'].get('name', 'idea')} timed out after {ROADMAP_TIMEOUT_SECONDS}s"
+                    )
+                except Exception as e:
+                    st.warning(f"Could not generate roadmap: {type(e).__name__}: {e}")
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
     
-    return top_3
+    return top_opportunities
 
 
 def display_results():
@@ -514,15 +693,15 @@ def display_per_tool(results: Dict):
         patterns_list = pattern_results.get("patterns", [])
         if patterns_list:
             st.subheader("Complaint Patterns")
-            patterns_df = pd.DataFrame([
-                {
-                    "Pattern": p.get("description", "Unknown"),
-                    "Frequency": p.get("frequency", 0),
-                    "Percentage": f"{p.get('frequency', 0) / len(reviews) * 100:.1f}%" if reviews else "0%"
-                }
-                for p in patterns_list[:5]
-            ])
-            st.dataframe(patterns_df, width='stretch', hide_index=True)
+            top_patterns = patterns_list[:5]
+            frequencies = [p.get("frequency", 0) for p in top_patterns]
+            n = max(len(reviews), 1)
+            patterns_table = {
+                "Pattern": [p.get("description", "Unknown") for p in top_patterns],
+                "Frequency": frequencies,
+                "Percentage": [f"{freq / n * 100:.1f}%" for freq in frequencies],
+            }
+            st.dataframe(patterns_table, width='stretch', hide_index=True)
         
         # AI analysis
         if ai_analysis.get("top_patterns"):
@@ -562,53 +741,32 @@ def display_per_tool(results: Dict):
                         st.write(f"**Monetization:** {idea.get('monetization', 'N/A')}")
                         st.write(f"**Estimated TAM:** {idea.get('estimated_tam', 'N/A')}")
                         
-                        # Quality rubric scoring (Phase 2 enhancement)
-                        quality_score = None
-                        try:
-                            from analyzer.quality_rubric import QualityRubric
-                            rubric = QualityRubric()
-                            quality_score = rubric.score_idea(
-                                idea,
-                                novelty_score=idea.get('novelty_score'),
-                                feasibility_score=idea.get('feasibility_score'),
-                                market_size_score=idea.get('market_size_score')
-                            )
-                        except Exception as e:
-                            logger.warning("Quality scoring failed", error=str(e))
-                            quality_score = {
-                                'overall_score': 0.5,
-                                'overall_rating': 'Unable to assess',
-                                'breakdown': {}
-                            }
+                        # Quality rubric scoring (precomputed at analysis time)
+                        if "quality_score" not in idea:
+                            score_idea_quality(idea)
+                        quality_score = idea["quality_score"]
+                        overall_score = quality_score.get('overall_score', 0.5)
                         
-                        if quality_score:
-                            st.divider()
-                            st.write("**Quality Assessment:**")
-                            overall_score = quality_score.get('overall_score', 0.5)
-                            overall_rating = quality_score.get('overall_rating', 'N/A')
-                            st.metric("Overall Score", f"{overall_score:.2f}", overall_rating)
-                            
-                            # Show breakdown
-                            if quality_score.get('breakdown'):
-                                with st.expander("Score Breakdown"):
-                                    for dim, data in quality_score['breakdown'].items():
-                                        st.write(f"**{dim.replace('_', ' ').title()}:** {data['score']:.2f} (weight: {data['weight']:.0%})")
-                            
-                            # Recommendations
-                            try:
-                                from analyzer.quality_rubric import QualityRubric
-                                rubric = QualityRubric()
-                                recommendations = rubric.get_recommendations(quality_score)
-                                if recommendations:
-                                    st.info("**Recommendations:** " + " | ".join(recommendations))
-                            except Exception as e:
-                                logger.debug("Could not get recommendations", error=str(e))
-                                pass
+                        st.divider()
+                        st.write("**Quality Assessment:**")
+                        overall_rating = quality_score.get('overall_rating', 'N/A')
+                        st.metric("Overall Score", f"{overall_score:.2f}", overall_rating)
+                        
+                        # Show breakdown
+                        if quality_score.get('breakdown'):
+                            with st.expander("Score Breakdown"):
+                                for dim, data in quality_score['breakdown'].items():
+                                    st.write(f"**{dim.replace('_', ' ').title()}:** {data['score']:.2f} (weight: {data['weight']:.0%})")
+                        
+                        # Recommendations
+                        recommendations = idea.get("recommendations")
+                        if recommendations:
+                            st.info("**Recommendations:** " + " | ".join(recommendations))
                         
                         # Human review section (Phase 2 enhancement)
                         st.divider()
                         st.write("**Your Rating:**")
-                        default_rating = int(overall_score * 10) if quality_score and overall_score else 5
+                        default_rating = int(overall_score * 10) if overall_score else 5
                         user_rating = st.slider(
                             "Rate this idea (1-10)",
                             min_value=1,
@@ -665,152 +823,187 @@ def display_top_opportunities(results: Dict):
                     with st.expander(f"Week {week_num[-1]}: {week_data.get('goal', 'N/A')}"):
                         tasks = week_data.get("tasks", [])
                         if isinstance(tasks, list):
-                            for task in tasks:
-                                st.write(f"- {task}")
+                            st.markdown("\n".join(f"- {task}" for task in tasks))
                         else:
                             st.write(tasks)
         
         st.divider()
 
 
-def export_markdown(results: Dict):
-    """Export results as Markdown"""
-    md_content = "# B2B Complaint-Driven Product Ideas Report\n\n"
+def _cached_export(fmt: str, results: Dict, builder: Callable[[Dict], Union[str, bytes]]) -> Union[str, bytes]:
+    """
+    Build an export payload once per results object and reuse it across reruns
+    
+    The cache holds a reference to the results it was built from, so a new
+    analysis run (a new results dict) invalidates every cached format.
+    """
+    cache = st.session_state.get("_export_cache")
+    if not cache or cache["results"] is not results:
+        cache = {"results": results, "payloads": {}}
+        st.session_state["_export_cache"] = cache
+    
+    payloads = cache["payloads"]
+    if fmt not in payloads:
+        payloads[fmt] = builder(results)
+    return payloads[fmt]
+
+
+def build_markdown_report(results: Dict) -> str:
+    """Render results as a Markdown report"""
+    parts: List[str] = ["# B2B Complaint-Driven Product Ideas Report\n\n"]
     
     tool_results = results.get("tool_results", {})
     top_opportunities = results.get("top_opportunities", [])
     
-    md_content += "## Summary\n\n"
-    md_content += f"- **Tools Analyzed:** {len(tool_results)}\n"
-    md_content += f"- **Top Opportunities:** {len(top_opportunities)}\n\n"
+    parts.append("## Summary\n\n")
+    parts.append(f"- **Tools Analyzed:** {len(tool_results)}\n")
+    parts.append(f"- **Top Opportunities:** {len(top_opportunities)}\n\n")
     
-    md_content += "## Top 3 Opportunities\n\n"
+    parts.append("## Top 3 Opportunities\n\n")
     for i, opp in enumerate(top_opportunities[:3], 1):
         idea = opp.get('idea', {})
-        md_content += f"### {i}. {idea.get('name', 'Unknown')}\n\n"
-        md_content += f"**Pattern/Source:** {opp.get('pattern', 'N/A')} ({opp.get('tool', 'N/A')})\n\n"
-        md_content += f"**Value Prop:** {idea.get('value_prop', 'N/A')}\n\n"
-        md_content += f"**Target:** {idea.get('target', 'N/A')}\n\n"
-        md_content += f"**MVP Scope:** {idea.get('mvp_scope', 'N/A')}\n\n"
-        md_content += f"**Monetization:** {idea.get('monetization', 'N/A')}\n\n"
+        parts.append(f"### {i}. {idea.get('name', 'Unknown')}\n\n")
+        parts.append(f"**Pattern/Source:** {opp.get('pattern', 'N/A')} ({opp.get('tool', 'N/A')})\n\n")
+        parts.append(f"**Value Prop:** {idea.get('value_prop', 'N/A')}\n\n")
+        parts.append(f"**Target:** {idea.get('target', 'N/A')}\n\n")
+        parts.append(f"**MVP Scope:** {idea.get('mvp_scope', 'N/A')}\n\n")
+        parts.append(f"**Monetization:** {idea.get('monetization', 'N/A')}\n\n")
         
         roadmap = opp.get("roadmap")
         if roadmap:
-            md_content += "**Roadmap:**\n\n"
+            parts.append("**Roadmap:**\n\n")
             for week_num in ["week1", "week2", "week3", "week4"]:
                 week_data = roadmap.get(week_num, {})
                 if week_data:
-                    md_content += f"- **Week {week_num[-1]}:** {week_data.get('goal', 'N/A')}\n"
+                    parts.append(f"- **Week {week_num[-1]}:** {week_data.get('goal', 'N/A')}\n")
                     tasks = week_data.get("tasks", [])
                     if isinstance(tasks, list):
-                        for task in tasks:
-                            md_content += f"  - {task}\n"
-            md_content += "\n"
+                        parts.extend(f"  - {task}\n" for task in tasks)
+            parts.append("\n")
     
+    return "".join(parts)
+
+
+def export_markdown(results: Dict):
+    """Export results as Markdown"""
     st.download_button(
         "Download Markdown",
-        md_content,
+        _cached_export("markdown", results, build_markdown_report),
         file_name="b2b_ideas_report.md",
         mime="text/markdown"
     )
 
 
+def build_json_report(results: Dict) -> bytes:
+    """Serialize results as indented JSON"""
+    return dumps_json(results, indent=True)
+
+
 def export_json(results: Dict):
     """Export results as JSON"""
-    json_str = json.dumps(results, indent=2, default=str)
     st.download_button(
         "Download JSON",
-        json_str,
+        _cached_export("json", results, build_json_report),
         file_name="b2b_ideas_report.json",
         mime="application/json"
     )
 
 
+class _Echo:
+    """File-like object whose write() just returns the value, for row-at-a-time csv output"""
+    
+    def write(self, value: str) -> str:
+        return value
+
+
+def iter_csv_rows(top_opportunities: List[Dict]):
+    """Yield the opportunities CSV one encoded row at a time"""
+    writer = csv.writer(_Echo(), quoting=csv.QUOTE_MINIMAL)
+    yield writer.writerow(CSV_HEADER).encode("utf-8")
+    for opp in top_opportunities:
+        idea = opp.get("idea", {})
+        yield writer.writerow((
+            opp.get("tool", ""),
+            opp.get("pattern", ""),
+            idea.get("name", ""),
+            idea.get("value_prop", ""),
+            idea.get("target", ""),
+            idea.get("mvp_scope", ""),
+            idea.get("monetization", ""),
+            idea.get("type", ""),
+            idea.get("feasibility_score", ""),
+            idea.get("market_size_score", ""),
+            idea.get("estimated_tam", ""),
+        )).encode("utf-8")
+
+
+def build_csv_report(results: Dict) -> bytes:
+    """Render the top opportunities as CSV"""
+    return b"".join(iter_csv_rows(results.get("top_opportunities", [])))
+
+
 def export_csv(results: Dict):
     """Export results as CSV (Phase 2 enhancement)"""
-    import io
+    st.download_button(
+        "Download CSV",
+        _cached_export("csv", results, build_csv_report),
+        file_name="b2b_ideas_report.csv",
+        mime="text/csv"
+    )
+
+
+@lru_cache(maxsize=1)
+def _pdf_styles():
+    """Shared ReportLab sample stylesheet (built once per process)"""
+    return getSampleStyleSheet()
+
+
+def build_pdf_report(results: Dict) -> bytes:
+    """Render results as a PDF document (requires reportlab)"""
+    buffer = io.BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=letter)
+    story = []
+    styles = _pdf_styles()
+    
+    # Title
+    story.append(Paragraph("B2B Complaint-Driven Product Ideas Report", styles['Title']))
+    story.append(Spacer(1, 12))
     
     tool_results = results.get("tool_results", {})
     top_opportunities = results.get("top_opportunities", [])
     
-    # Create CSV content
-    output = io.StringIO()
-    
-    # Write opportunities to CSV
-    output.write("Tool,Pattern,Idea Name,Value Prop,Target,MVP Scope,Monetization,Type,Feasibility Score,Market Size Score,Estimated TAM\n")
+    # Summary
+    story.append(Paragraph(f"Tools Analyzed: {len(tool_results)}", styles['Normal']))
+    story.append(Paragraph(f"Top Opportunities: {len(top_opportunities)}", styles['Normal']))
+    story.append(Spacer(1, 12))
     
-    for opp in top_opportunities:
+    # Top opportunities
+    story.append(Paragraph("Top 3 Opportunities", styles['Heading2']))
+    for i, opp in enumerate(top_opportunities[:3], 1):
         idea = opp.get('idea', {})
-        output.write(f'"{opp.get("tool", "")}",')
-        output.write(f'"{opp.get("pattern", "")}",')
-        output.write(f'"{idea.get("name", "")}",')
-        output.write(f'"{idea.get("value_prop", "")}",')
-        output.write(f'"{idea.get("target", "")}",')
-        output.write(f'"{idea.get("mvp_scope", "")}",')
-        output.write(f'"{idea.get("monetization", "")}",')
-        output.write(f'"{idea.get("type", "")}",')
-        output.write(f'{idea.get("feasibility_score", "")},')
-        output.write(f'{idea.get("market_size_score", "")},')
-        output.write(f'"{idea.get("estimated_tam", "")}"\n')
-    
-    csv_content = output.getvalue()
-    output.close()
+        story.append(Paragraph(f"{i}. {idea.get('name', 'Unknown')}", styles['Heading3']))
+        story.append(Paragraph(f"Tool: {opp.get('tool', 'N/A')}", styles['Normal']))
+        story.append(Paragraph(f"Pattern: {opp.get('pattern', 'N/A')}", styles['Normal']))
+        story.append(Paragraph(f"Value Prop: {idea.get('value_prop', 'N/A')}", styles['Normal']))
+        story.append(Spacer(1, 12))
     
-    st.download_button(
-        "Download CSV",
-        csv_content,
-        file_name="b2b_ideas_report.csv",
-        mime="text/csv"
-    )
+    doc.build(story)
+    return buffer.getvalue()
 
 
 def export_pdf(results: Dict):
     """Export results as PDF (Phase 2 enhancement)"""
+    if not REPORTLAB_AVAILABLE:
+        st.error("PDF export requires reportlab. Install with: pip install reportlab")
+        return
+    
     try:
-        from reportlab.lib.pagesizes import letter
-        from reportlab.lib.styles import getSampleStyleSheet
-        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
-        import io
-        
-        buffer = io.BytesIO()
-        doc = SimpleDocTemplate(buffer, pagesize=letter)
-        story = []
-        styles = getSampleStyleSheet()
-        
-        # Title
-        story.append(Paragraph("B2B Complaint-Driven Product Ideas Report", styles['Title']))
-        story.append(Spacer(1, 12))
-        
-        tool_results = results.get("tool_results", {})
-        top_opportunities = results.get("top_opportunities", [])
-        
-        # Summary
-        story.append(Paragraph(f"Tools Analyzed: {len(tool_results)}", styles['Normal']))
-        story.append(Paragraph(f"Top Opportunities: {len(top_opportunities)}", styles['Normal']))
-        story.append(Spacer(1, 12))
-        
-        # Top opportunities
-        story.append(Paragraph("Top 3 Opportunities", styles['Heading2']))
-        for i, opp in enumerate(top_opportunities[:3], 1):
-            idea = opp.get('idea', {})
-            story.append(Paragraph(f"{i}. {idea.get('name', 'Unknown')}", styles['Heading3']))
-            story.append(Paragraph(f"Tool: {opp.get('tool', 'N/A')}", styles['Normal']))
-            story.append(Paragraph(f"Pattern: {opp.get('pattern', 'N/A')}", styles['Normal']))
-            story.append(Paragraph(f"Value Prop: {idea.get('value_prop', 'N/A')}", styles['Normal']))
-            story.append(Spacer(1, 12))
-        
-        doc.build(story)
-        pdf_content = buffer.getvalue()
-        buffer.close()
-        
         st.download_button(
             "Download PDF",
-            pdf_content,
+            _cached_export("pdf", results, build_pdf_report),
             file_name="b2b_ideas_report.pdf",
             mime="application/pdf"
         )
-    except ImportError:
-        st.error("PDF export requires reportlab. Install with: pip install reportlab")
     except Exception as e:
         st.error(f"Error generating PDF: {str(e)}")
 
@@ -2,15 +2,18 @@
 
 import streamlit as st
 import pandas as pd
-from typing import List, Dict, Optional
-import json
-import time
+from typing import Callable, List, Dict, Optional, Union
+import heapq
 import os
+import traceback
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 
 from scraper import G2Scraper, CapterraScraper
 from analyzer import PatternExtractor, PatternExtractorV2, XAIClient
 from utils.security import SecurityManager, InputValidator
 from utils.logging import get_logger
+from utils.serialization import dumps_json
 from utils.database import get_db_manager
 from utils.cache import CacheManager
 from utils.rate_limiter import RateLimiter
@@ -32,6 +35,18 @@ cache_manager = CacheManager()
 rate_limiter = RateLimiter()
 db_manager = get_db_manager()
 
+# Tool names accepted from the multiselect
+_ALLOWED_TOOLS = frozenset(config.B2B_TOOLS_BY_NAME)
+
+# Pre-configured tools table for the instructions page (B2B_TOOLS is static)
+_TOOLS_DF = pd.DataFrame({
+    "Tool": [tool.name for tool in config.B2B_TOOLS],
+    "Category": [tool.category for tool in config.B2B_TOOLS],
+})
+
+# Max seconds to wait for a single roadmap generation call
+ROADMAP_TIMEOUT_SECONDS = 60
+
 # Page config
 st.set_page_config(
     page_title="B2B Complaint Analyzer",
@@ -135,7 +150,7 @@ def main():
         
         # Tool selection with validation and accessibility
         st.header("📊 Select Tools")
-        tool_names = [tool["name"] for tool in config.B2B_TOOLS]
+        tool_names = [tool.name for tool in config.B2B_TOOLS]
         selected_tools_raw = st.multiselect(
             "Choose B2B tools to analyze",
             tool_names,
@@ -145,10 +160,10 @@ def main():
             label_visibility="visible"
         )
         
-        # Sanitize tool selection
+        # Sanitize tool selection (only pre-configured tools are valid)
         selected_tools = []
         for tool in selected_tools_raw:
-            if InputValidator.validate_tool_name(tool):
+            if tool in _ALLOWED_TOOLS:
                 selected_tools.append(tool)
             else:
                 st.warning(f"Invalid tool name: {tool}")
@@ -234,11 +249,7 @@ def show_instructions():
     The following B2B tools are pre-configured:
     """)
     
-    tools_df = pd.DataFrame([
-        {"Tool": tool["name"], "Category": tool["category"]}
-        for tool in config.B2B_TOOLS
-    ])
-    st.dataframe(tools_df, width="stretch", hide_index=True)
+    st.dataframe(_TOOLS_DF, width="stretch", hide_index=True)
 
 
 def run_full_analysis(selected_tools: List[str], use_semantic: bool = True):
@@ -247,8 +258,7 @@ def run_full_analysis(selected_tools: List[str], use_semantic: bool = True):
     status_text = st.empty()
     
     all_results = {}
-    total_steps = len(selected_tools) * 3 + 2
-    current_step = 0
+    total_steps = len(selected_tools) + 1  # one progress update per tool + opportunities
     
     try:
         # Use semantic extractor if available and requested
@@ -262,16 +272,19 @@ def run_full_analysis(selected_tools: List[str], use_semantic: bool = True):
         else:
             pattern_extractor = PatternExtractor()
         
+        # Bias detection and explainability (shared across tools)
+        bias_detector = get_bias_detector()
+        explainability = get_explainability_provider()
+        
         # Process each tool (using async scrapers for better performance)
-        for tool_name in selected_tools:
-            tool_config = next((t for t in config.B2B_TOOLS if t["name"] == tool_name), None)
+        for index, tool_name in enumerate(selected_tools):
+            tool_config = config.B2B_TOOLS_BY_NAME.get(tool_name)
             if not tool_config:
                 logger.warning("Tool config not found", tool_name=tool_name)
                 continue
             
             status_text.text(f"📥 Scraping reviews for {tool_name}...")
-            current_step += 1
-            progress_bar.progress(current_step / total_steps)
+            progress_bar.progress(index / total_steps)
             
             # Check cache first
             cache_key = f"reviews_{tool_name}"
@@ -291,8 +304,9 @@ def run_full_analysis(selected_tools: List[str], use_semantic: bool = True):
                         max_reviews=config.settings.max_reviews_per_tool
                     )
                     
-                    g2_count = sum(1 for r in reviews if r.get("source") == "G2")
-                    capterra_count = sum(1 for r in reviews if r.get("source") == "Capterra")
+                    source_counts = Counter(r.get("source") for r in reviews)
+                    g2_count = source_counts["G2"]
+                    capterra_count = source_counts["Capterra"]
                     
                     logger.info(
                         "Async scraping complete",
@@ -330,16 +344,12 @@ def run_full_analysis(selected_tools: List[str], use_semantic: bool = True):
             
             # Extract patterns
             status_text.text(f"🔍 Analyzing patterns for {tool_name}...")
-            current_step += 1
-            progress_bar.progress(current_step / total_steps)
             
             pattern_results = pattern_extractor.extract_patterns(reviews)
             
             # AI analysis
             if st.session_state.xai_client:
                 status_text.text(f"🤖 AI analysis for {tool_name}...")
-                current_step += 1
-                progress_bar.progress(current_step / total_steps)
                 
                 try:
                     ai_analysis = st.session_state.xai_client.analyze_patterns(
@@ -356,10 +366,6 @@ def run_full_analysis(selected_tools: List[str], use_semantic: bool = True):
                         )
                         ai_analysis["product_ideas"] = ideas
                         
-                        # Bias detection and explainability
-                        bias_detector = get_bias_detector()
-                        explainability = get_explainability_provider()
-                        
                         # Check for bias in AI output
                         bias_analysis = bias_detector.analyze_ai_output(ai_analysis)
                         if bias_analysis["has_bias"]:
@@ -390,29 +396,26 @@ def run_full_analysis(selected_tools: List[str], use_semantic: bool = True):
         # Generate top 3 opportunities
         if st.session_state.xai_client and all_results:
             status_text.text("🎯 Generating top opportunities...")
-            current_step += 1
-            progress_bar.progress(current_step / total_steps)
+            progress_bar.progress(len(selected_tools) / total_steps)
             
             top_opportunities = generate_top_opportunities(all_results)
             
             # Save analysis results to database
             try:
-                for tool_name, results in all_results.items():
-                    db_manager.save_analysis_result(
-                        tool_name=tool_name,
-                        session_id=st.session_state.session_id,
-                        patterns=results["pattern_results"],
-                        ai_analysis=results["ai_analysis"],
-                        product_ideas=results["ai_analysis"].get("product_ideas", [])
-                    )
+                db_manager.save_analysis_results_bulk([
+                    {
+                        "tool_name": tool_name,
+                        "session_id": st.session_state.session_id,
+                        "patterns": results["pattern_results"],
+                        "ai_analysis": results["ai_analysis"],
+                        "product_ideas": results["ai_analysis"].get("product_ideas", [])
+                    }
+                    for tool_name, results in all_results.items()
+                ])
                 logger.info("Analysis results saved to database")
             except Exception as e:
                 logger.error("Failed to save analysis results", error=str(e))
             
-            status_text.text("✅ Analysis complete!")
-            current_step += 1
-            progress_bar.progress(current_step / total_steps)
-            
             st.session_state.analysis_results = {
                 "tool_results": all_results,
                 "top_opportunities": top_opportunities
@@ -423,15 +426,15 @@ def run_full_analysis(selected_tools: List[str], use_semantic: bool = True):
                 "top_opportunities": []
             }
         
-        time.sleep(1)
         progress_bar.empty()
         status_text.empty()
         
     except Exception as e:
         logger.error("Analysis pipeline failed", error=str(e), exc_info=True)
         st.error(f"❌ Error during analysis: {str(e)}")
-        import traceback
-        st.code(traceback.format_exc())
+        if os.environ.get("B2B_DEBUG"):
+            with st.expander("Debug traceback", expanded=False):
+                st.code(traceback.format_exc())
 
 
 def generate_top_opportunities(all_results: Dict) -> List[Dict]:
@@ -451,25 +454,25 @@ def generate_top_opportunities(all_results: Dict) -> List[Dict]:
                     "idea": idea
                 })
     
-    # Sort by potential (prioritize standalone apps)
-    opportunities.sort(key=lambda x: (
+    # Rank by potential (prioritize standalone apps); only the top 3 are needed
+    top_opportunities = heapq.nsmallest(3, opportunities, key=lambda x: (
         0 if x["idea"].get("type") == "standalone" else 1,
         -len(x["idea"].get("name", ""))
     ))
     
-    # Generate roadmaps for top 3
-    top_3 = []
-    for opp in opportunities[:3]:
-        if st.session_state.xai_client:
-            try:
-                roadmap = st.session_state.xai_client.generate_roadmap(opp["idea"])
-                opp["roadmap"] = roadmap
-            except Exception as e:
-                logger.warning("Failed to generate roadmap", error=str(e))
-                st.warning(f"Could not generate roadmap: {str(e)}")
-        top_3.append(opp)
+    # Generate roadmaps for top 3 (independent API calls, so request them concurrently)
+    xai_client = st.session_state.xai_client
+    if xai_client and top_opportunities:
+        with ThreadPoolExecutor(max_workers=len(top_opportunities)) as executor:
+            futures = [(executor.submit(xai_client.generate_roadmap, opp["idea"]), opp) for opp in top_opportunities]
+            for future, opp in futures:
+                try:
+                    opp["roadmap"] = future.result(timeout=ROADMAP_TIMEOUT_SECONDS)
+                except Exception as e:
+                    logger.warning("Failed to generate roadmap", error=str(e))
+                    st.warning(f"Could not generate roadmap: {str(e)}")
     
-    return top_3
+    return top_opportunities
 
 
 def display_results():
@@ -545,15 +548,15 @@ def display_per_tool(results: Dict):
         
         if pattern_results.get("patterns"):
             st.subheader("Complaint Patterns")
-            patterns_df = pd.DataFrame([
-                {
-                    "Pattern": p["description"],
-                    "Frequency": p["frequency"],
-                    "Percentage": f"{p['frequency'] / len(reviews) * 100:.1f}%"
-                }
-                for p in pattern_results["patterns"][:5]
-            ])
-            st.dataframe(patterns_df, width="stretch", hide_index=True)
+            top_patterns = pattern_results["patterns"][:5]
+            frequencies = [p["frequency"] for p in top_patterns]
+            n = max(len(reviews), 1)
+            patterns_table = {
+                "Pattern": [p["description"] for p in top_patterns],
+                "Frequency": frequencies,
+                "Percentage": [f"{freq / n * 100:.1f}%" for freq in frequencies],
+            }
+            st.dataframe(patterns_table, width="stretch", hide_index=True)
         
         if ai_analysis.get("top_patterns"):
             st.subheader("AI Analysis - Top Patterns")
@@ -609,60 +612,85 @@ def display_top_opportunities(results: Dict):
                 with st.expander(f"Week {week_num[-1]}: {week_data.get('goal', 'N/A')}"):
                     tasks = week_data.get("tasks", [])
                     if isinstance(tasks, list):
-                        for task in tasks:
-                            st.write(f"- {task}")
+                        st.markdown("\n".join(f"- {task}" for task in tasks))
                     else:
                         st.write(tasks)
         
         st.divider()
 
 
-def export_markdown(results: Dict):
-    """Export results as Markdown"""
-    md_content = "# B2B Complaint-Driven Product Ideas Report\n\n"
+def _cached_export(fmt: str, results: Dict, builder: Callable[[Dict], Union[str, bytes]]) -> Union[str, bytes]:
+    """
+    Build an export payload once per results object and reuse it across reruns
+    
+    The cache holds a reference to the results it was built from, so a new
+    analysis run (a new results dict) invalidates every cached format.
+    """
+    cache = st.session_state.get("_export_cache")
+    if not cache or cache["results"] is not results:
+        cache = {"results": results, "payloads": {}}
+        st.session_state["_export_cache"] = cache
+    
+    payloads = cache["payloads"]
+    if fmt not in payloads:
+        payloads[fmt] = builder(results)
+    return payloads[fmt]
+
+
+def build_markdown_report(results: Dict) -> str:
+    """Render results as a Markdown report"""
+    parts: List[str] = ["# B2B Complaint-Driven Product Ideas Report\n\n"]
     
     tool_results = results.get("tool_results", {})
     top_opportunities = results.get("top_opportunities", [])
     
-    md_content += "## Summary\n\n"
-    md_content += f"- **Tools Analyzed:** {len(tool_results)}\n"
-    md_content += f"- **Top Opportunities:** {len(top_opportunities)}\n\n"
+    parts.append("## Summary\n\n")
+    parts.append(f"- **Tools Analyzed:** {len(tool_results)}\n")
+    parts.append(f"- **Top Opportunities:** {len(top_opportunities)}\n\n")
     
-    md_content += "## Top 3 Opportunities\n\n"
+    parts.append("## Top 3 Opportunities\n\n")
     for i, opp in enumerate(top_opportunities[:3], 1):
-        md_content += f"### {i}. {opp['idea'].get('name', 'Unknown')}\n\n"
-        md_content += f"**Pattern/Source:** {opp['pattern']} ({opp['tool']})\n\n"
-        md_content += f"**Value Prop:** {opp['idea'].get('value_prop', 'N/A')}\n\n"
-        md_content += f"**Target:** {opp['idea'].get('target', 'N/A')}\n\n"
-        md_content += f"**MVP Scope:** {opp['idea'].get('mvp_scope', 'N/A')}\n\n"
-        md_content += f"**Monetization:** {opp['idea'].get('monetization', 'N/A')}\n\n"
+        parts.append(f"### {i}. {opp['idea'].get('name', 'Unknown')}\n\n")
+        parts.append(f"**Pattern/Source:** {opp['pattern']} ({opp['tool']})\n\n")
+        parts.append(f"**Value Prop:** {opp['idea'].get('value_prop', 'N/A')}\n\n")
+        parts.append(f"**Target:** {opp['idea'].get('target', 'N/A')}\n\n")
+        parts.append(f"**MVP Scope:** {opp['idea'].get('mvp_scope', 'N/A')}\n\n")
+        parts.append(f"**Monetization:** {opp['idea'].get('monetization', 'N/A')}\n\n")
         
         if opp.get("roadmap"):
-            md_content += "**Roadmap:**\n\n"
+            parts.append("**Roadmap:**\n\n")
             roadmap = opp["roadmap"]
             for week_num in ["week1", "week2", "week3", "week4"]:
                 week_data = roadmap.get(week_num, {})
-                md_content += f"- **Week {week_num[-1]}:** {week_data.get('goal', 'N/A')}\n"
+                parts.append(f"- **Week {week_num[-1]}:** {week_data.get('goal', 'N/A')}\n")
                 tasks = week_data.get("tasks", [])
                 if isinstance(tasks, list):
-                    for task in tasks:
-                        md_content += f"  - {task}\n"
-            md_content += "\n"
+                    parts.extend(f"  - {task}\n" for task in tasks)
+            parts.append("\n")
     
+    return "".join(parts)
+
+
+def export_markdown(results: Dict):
+    """Export results as Markdown"""
     st.download_button(
         "Download Markdown",
-        md_content,
+        _cached_export("markdown", results, build_markdown_report),
         file_name="b2b_ideas_report.md",
         mime="text/markdown"
     )
 
 
+def build_json_report(results: Dict) -> bytes:
+    """Serialize results as indented JSON"""
+    return dumps_json(results, indent=True)
+
+
 def export_json(results: Dict):
     """Export results as JSON"""
-    json_str = json.dumps(results, indent=2, default=str)
     st.download_button(
         "Download JSON",
-        json_str,
+        _cached_export("json", results, build_json_report),
         file_name="b2b_ideas_report.json",
         mime="application/json"
     )
@@ -3,61 +3,125 @@ Configuration file for B2B Complaint Analyzer
 Contains tool list, keywords, and settings with environment variable support
 """
 
-import os
-from typing import List, Dict
-from pydantic_settings import BaseSettings
+import re
+from dataclasses import dataclass
+from typing import Any, List, Dict, Optional, Tuple
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+# Optional C-backed multi-phrase matcher for pain keywords
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
 
 
 class Settings(BaseSettings):
     """Application settings with environment variable support"""
     
+    model_config = SettingsConfigDict(env_file=".env", case_sensitive=False)
+    
     # Scraping settings
-    scrape_delay_min: int = int(os.getenv("SCRAPE_DELAY_MIN", "2"))
-    scrape_delay_max: int = int(os.getenv("SCRAPE_DELAY_MAX", "5"))
-    scrape_timeout: int = int(os.getenv("SCRAPE_TIMEOUT", "30"))
-    max_reviews_per_tool: int = int(os.getenv("MAX_REVIEWS_PER_TOOL", "30"))
+    scrape_delay_min: int = 2
+    scrape_delay_max: int = 5
+    scrape_timeout: int = 30
+    max_reviews_per_tool: int = 30
+    scrape_rate_per_domain: float = 1.0  # requests/sec
+    scrape_burst_per_domain: float = 1.0
+    scrape_max_response_bytes: int = 3_000_000
+    scrape_response_cache_ttl: int = 900  # 0 disables
+    scrape_response_cache_bytes: int = 256 * 1024 * 1024
+    scrape_disk_cache_path: str = ".cache/http/responses.sqlite"
+    scrape_disk_cache_ttl: int = 6 * 3600  # 0 disables
+    capterra_id_cache_path: str = ".cache/capterra_ids.json"  # empty disables persistence
+    scraper_max_conn: int = 100
+    scraper_max_keepalive: int = 20
+    scraper_keepalive_expiry: float = 30.0  # seconds an idle connection stays open
+    scraper_dns_cache_ttl: int = 300  # seconds; 0 disables
+    scrape_parse_workers: int = 2  # async page-parsing processes; 0 parses on the event loop
     
     # Pattern detection thresholds
-    min_pattern_mentions: int = int(os.getenv("MIN_PATTERN_MENTIONS", "5"))
-    pattern_frequency_threshold: float = float(os.getenv("PATTERN_FREQUENCY_THRESHOLD", "0.15"))
+    min_pattern_mentions: int = 5
+    pattern_frequency_threshold: float = 0.15
     
     # xAI Grok settings (Updated Jan 2026 - Grok 4.1 Fast with 2M token context)
-    xai_base_url: str = os.getenv("XAI_BASE_URL", "https://api.x.ai/v1")
-    xai_model: str = os.getenv("XAI_MODEL", "grok-3")  # Fallback: grok-3 (stable), Latest: grok-4.1-fast-reasoning
-    xai_temperature: float = float(os.getenv("XAI_TEMPERATURE", "0.3"))
-    xai_max_tokens: int = int(os.getenv("XAI_MAX_TOKENS", "2000"))
+    xai_base_url: str = "https://api.x.ai/v1"
+    xai_model: str = "grok-3"  # Fallback: grok-3 (stable), Latest: grok-4.1-fast-reasoning
+    xai_temperature: float = 0.3
+    xai_max_tokens: int = 2000
     
     # Compliance settings
-    gdpr_enabled: bool = os.getenv("GDPR_ENABLED", "true").lower() == "true"
-    data_retention_days: int = int(os.getenv("DATA_RETENTION_DAYS", "90"))
-    enable_audit_logging: bool = os.getenv("ENABLE_AUDIT_LOGGING", "true").lower() == "true"
+    gdpr_enabled: bool = True
+    data_retention_days: int = 90
+    enable_audit_logging: bool = True
+
+
+class _LazySettings:
+    """Proxy that builds Settings (env + .env parsing) on first attribute access"""
+    
+    __slots__ = ("_s",)
     
-    class Config:
-        env_file = ".env"
-        case_sensitive = False
+    def __init__(self) -> None:
+        object.__setattr__(self, "_s", None)
+    
+    def _get(self) -> Settings:
+        if self._s is None:
+            object.__setattr__(self, "_s", Settings())
+        return self._s
+    
+    def __getattr__(self, name: str):
+        return getattr(self._get(), name)
+    
+    def __setattr__(self, name: str, value) -> None:
+        setattr(self._get(), name, value)
 
 
-# Initialize settings
-settings = Settings()
+# Initialize settings (lazily, on first use)
+settings = _LazySettings()
+
+@dataclass(slots=True, frozen=True)
+class B2BTool:
+    """Pre-configured tool with its per-source identifiers"""
+    
+    name: str
+    category: str
+    g2_slug: str
+    capterra_id: str
+    ph_slug: Optional[str] = None
+    trustpilot_slug: Optional[str] = None
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """Dict-style lookup, for code that also accepts plain dict tool configs"""
+        return getattr(self, key, default)
+    
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
 
 # Top 10 B2B SaaS tools to analyze (with multi-source metadata)
-B2B_TOOLS: List[Dict[str, str]] = [
-    {"name": "Salesforce", "category": "CRM", "g2_slug": "salesforce", "capterra_id": "165", "ph_slug": "salesforce", "trustpilot_slug": "www.salesforce.com"},
-    {"name": "HubSpot", "category": "CRM/Marketing", "g2_slug": "hubspot", "capterra_id": "1007", "ph_slug": "hubspot", "trustpilot_slug": "www.hubspot.com"},
-    {"name": "Slack", "category": "Comms", "g2_slug": "slack", "capterra_id": "175", "ph_slug": "slack", "trustpilot_slug": "slack.com"},
-    {"name": "Asana", "category": "PM", "g2_slug": "asana", "capterra_id": "110", "ph_slug": "asana", "trustpilot_slug": "asana.com"},
-    {"name": "Notion", "category": "Productivity", "g2_slug": "notion", "capterra_id": "179", "ph_slug": "notion-2-0", "trustpilot_slug": "notion.so"},
-    {"name": "Zoom", "category": "Video", "g2_slug": "zoom", "capterra_id": "115", "ph_slug": "zoom", "trustpilot_slug": "zoom.us"},
-    {"name": "Intercom", "category": "Customer Support", "g2_slug": "intercom", "capterra_id": "1005", "ph_slug": "intercom", "trustpilot_slug": "www.intercom.com"},
-    {"name": "Zendesk", "category": "Customer Support", "g2_slug": "zendesk", "capterra_id": "103", "ph_slug": "zendesk", "trustpilot_slug": "www.zendesk.com"},
-    {"name": "Workday", "category": "HRIS", "g2_slug": "workday", "capterra_id": "1008", "ph_slug": "workday", "trustpilot_slug": "www.workday.com"},
-    {"name": "BambooHR", "category": "HRIS", "g2_slug": "bamboo-hr", "capterra_id": "1009", "ph_slug": "bamboohr", "trustpilot_slug": "www.bamboohr.com"},
-]
-
-# Pain point keywords/phrases for pattern extraction
-PAIN_KEYWORDS: Dict[str, List[str]] = {
+B2B_TOOLS: Tuple[B2BTool, ...] = (
+    B2BTool("Salesforce", "CRM", "salesforce", "165", "salesforce", "www.salesforce.com"),
+    B2BTool("HubSpot", "CRM/Marketing", "hubspot", "1007", "hubspot", "www.hubspot.com"),
+    B2BTool("Slack", "Comms", "slack", "175", "slack", "slack.com"),
+    B2BTool("Asana", "PM", "asana", "110", "asana", "asana.com"),
+    B2BTool("Notion", "Productivity", "notion", "179", "notion-2-0", "notion.so"),
+    B2BTool("Zoom", "Video", "zoom", "115", "zoom", "zoom.us"),
+    B2BTool("Intercom", "Customer Support", "intercom", "1005", "intercom", "www.intercom.com"),
+    B2BTool("Zendesk", "Customer Support", "zendesk", "103", "zendesk", "www.zendesk.com"),
+    B2BTool("Workday", "HRIS", "workday", "1008", "workday", "www.workday.com"),
+    B2BTool("BambooHR", "HRIS", "bamboo-hr", "1009", "bamboohr", "www.bamboohr.com"),
+)
+
+# Tool config lookup by display name
+B2B_TOOLS_BY_NAME: Dict[str, B2BTool] = {tool.name: tool for tool in B2B_TOOLS}
+
+# Pain point keywords/phrases for pattern extraction (as written; normalized below)
+_RAW_PAIN_KEYWORDS: Dict[str, List[str]] = {
     "missing_feature": [
-        "doesn't have", "doesn't have", "missing", "lacks", "no way to", 
+        "doesn't have", "missing", "lacks", "no way to", 
         "absent", "without", "does not have", "does not support"
     ],
     "wish_desire": [
@@ -70,12 +134,83 @@ PAIN_KEYWORDS: Dict[str, List[str]] = {
     ]
 }
 
-# Backward compatibility exports
-MAX_REVIEWS_PER_TOOL = settings.max_reviews_per_tool
-SCRAPE_DELAY_MIN = settings.scrape_delay_min
-SCRAPE_DELAY_MAX = settings.scrape_delay_max
-REQUEST_TIMEOUT = settings.scrape_timeout
-MIN_PATTERN_MENTIONS = settings.min_pattern_mentions
-PATTERN_FREQUENCY_THRESHOLD = settings.pattern_frequency_threshold
-XAI_BASE_URL = settings.xai_base_url
-XAI_MODEL = settings.xai_model
+# Normalize once: lowercase, collapse whitespace, drop duplicates, and put the
+# longest (most specific) phrases first
+PAIN_KEYWORDS: Dict[str, Tuple[str, ...]] = {
+    category: tuple(sorted({" ".join(p.lower().split()) for p in phrases}, key=lambda p: (-len(p), p)))
+    for category, phrases in _RAW_PAIN_KEYWORDS.items()
+}
+
+# (category, phrase) for every pain keyword
+_PAIN_PHRASES: Tuple[Tuple[str, str], ...] = tuple(
+    (category, phrase)
+    for category, phrases in PAIN_KEYWORDS.items()
+    for phrase in phrases
+)
+
+# One compiled alternation per category (longest phrase first). Substring
+# semantics, no word boundaries, to match the Aho-Corasick path.
+PAIN_PATTERNS: Dict[str, "re.Pattern[str]"] = {
+    category: re.compile("|".join(map(re.escape, phrases)), re.IGNORECASE)
+    for category, phrases in PAIN_KEYWORDS.items()
+}
+
+if AHOCORASICK_AVAILABLE:
+    _PAIN_AC = ahocorasick.Automaton()
+    for _category, _phrase in _PAIN_PHRASES:
+        _PAIN_AC.add_word(_phrase, (_category, _phrase))
+    _PAIN_AC.make_automaton()
+else:
+    _PAIN_AC = None
+
+
+def find_pain_matches(text: str, lowered: bool = False) -> List[Tuple[str, str]]:
+    """
+    Find every pain keyword in a piece of text in one pass
+    
+    Uses a prebuilt Aho-Corasick automaton when pyahocorasick is installed,
+    otherwise falls back to the precompiled per-category regexes.
+    
+    Args:
+        text: Text to scan
+        lowered: True if text is already lowercased (skips lowering it again)
+    
+    Returns:
+        (category, phrase) pairs for each match
+    """
+    text_lower = text if lowered else text.lower()
+    if _PAIN_AC is not None:
+        return [match for _, match in _PAIN_AC.iter(text_lower)]
+    return [
+        (category, match.group(0))
+        for category, pattern in PAIN_PATTERNS.items()
+        for match in pattern.finditer(text_lower)
+    ]
+
+
+def first_pain_match_per_category(text: str, lowered: bool = False) -> Dict[str, str]:
+    """Map each pain category found in text to the first phrase that matched it"""
+    matched: Dict[str, str] = {}
+    for category, phrase in find_pain_matches(text, lowered):
+        matched.setdefault(category, phrase)
+    return matched
+
+
+# Backward compatibility exports, resolved from settings on access (PEP 562)
+_SETTINGS_ALIASES: Dict[str, str] = {
+    "MAX_REVIEWS_PER_TOOL": "max_reviews_per_tool",
+    "SCRAPE_DELAY_MIN": "scrape_delay_min",
+    "SCRAPE_DELAY_MAX": "scrape_delay_max",
+    "REQUEST_TIMEOUT": "scrape_timeout",
+    "MIN_PATTERN_MENTIONS": "min_pattern_mentions",
+    "PATTERN_FREQUENCY_THRESHOLD": "pattern_frequency_threshold",
+    "XAI_BASE_URL": "xai_base_url",
+    "XAI_MODEL": "xai_model",
+}
+
+
+def __getattr__(name: str):
+    field = _SETTINGS_ALIASES.get(name)
+    if field is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(settings, field)
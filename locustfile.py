@@ -1,7 +1,6 @@
 """Locust load testing configuration"""
 
 from locust import HttpUser, task, between
-import json
 
 
 class B2BAnalyzerUser(HttpUser):
@@ -9,10 +8,12 @@ class B2BAnalyzerUser(HttpUser):
     
     wait_time = between(1, 3)  # Wait 1-3 seconds between tasks
     
-    def on_start(self):
-        """Called when a user starts"""
-        # Could authenticate here if needed
-        pass
+    # Request body/headers are identical for every task run
+    _ANALYZE_PAYLOAD = {
+        "tools": ["Salesforce"],
+        "use_semantic": True
+    }
+    _JSON_HEADERS = {"Content-Type": "application/json"}
     
     @task(3)
     def health_check(self):
@@ -27,14 +28,11 @@ class B2BAnalyzerUser(HttpUser):
     @task(1)
     def analyze_tool(self):
         """Run analysis (most resource-intensive)"""
-        payload = {
-            "tools": ["Salesforce"],
-            "use_semantic": True
-        }
         self.client.post(
             "/api/v1/analyze",
-            json=payload,
-            headers={"Content-Type": "application/json"}
+            json=self._ANALYZE_PAYLOAD,
+            headers=self._JSON_HEADERS,
+            name="/api/v1/analyze"
         )
 
 
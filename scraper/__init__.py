@@ -3,5 +3,23 @@
 from .g2_scraper import G2Scraper
 from .capterra_scraper import CapterraScraper
 from .base import BaseScraper
+from .exceptions import (
+    ScraperError,
+    ScraperHTTPError,
+    ScraperNotFound,
+    ScraperRateLimited,
+    ScraperRequestError,
+    ScraperTimeout,
+)
 
-__all__ = ["G2Scraper", "CapterraScraper", "BaseScraper"]
+__all__ = [
+    "G2Scraper",
+    "CapterraScraper",
+    "BaseScraper",
+    "ScraperError",
+    "ScraperHTTPError",
+    "ScraperNotFound",
+    "ScraperRateLimited",
+    "ScraperRequestError",
+    "ScraperTimeout",
+]
@@ -0,0 +1,144 @@
+"""Async base for JSON API scrapers (GitHub, Hacker News)"""
+
+import asyncio
+import time
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+import httpx
+
+from scraper.base_async import RETRY_AFTER_MAX, read_capped_async
+from scraper.exceptions import ScraperRateLimited
+from utils.compliance import reserve_token, url_netloc
+from utils.logging import get_logger
+import config
+
+logger = get_logger(__name__)
+
+API_CONCURRENCY = 8  # Requests in flight per scraper (and per-host pool size)
+
+
+class BaseAsyncAPIScraper:
+    """
+    Async base class for scrapers that page through a JSON API
+    
+    Requests fan out with asyncio.gather under a bounded semaphore. A token
+    bucket (burst of ``concurrency``, refilled at SCRAPE_RATE_PER_DOMAIN)
+    replaces the fixed sleep between requests, and an exhausted
+    ``X-RateLimit-Remaining`` quota pauses every request until
+    ``X-RateLimit-Reset``.
+    """
+    
+    def __init__(
+        self,
+        base_url: str,
+        headers: Mapping[str, str],
+        concurrency: int = API_CONCURRENCY,
+        timeout: Optional[int] = None,
+        client: Optional[httpx.AsyncClient] = None
+    ):
+        """
+        Initialize async API scraper
+        
+        Args:
+            base_url: API root URL
+            headers: Headers sent with every request
+            concurrency: Maximum requests in flight
+            timeout: Request timeout (seconds)
+            client: Existing client to use; the scraper only closes clients
+                it created itself
+        """
+        self.base_url = base_url
+        self.headers = dict(headers)
+        self.concurrency = concurrency
+        self._sem = asyncio.BoundedSemaphore(concurrency)
+        self._bucket: Dict[str, Tuple[float, float]] = {}  # domain -> (tokens, last_ts)
+        self._rate_reset: Optional[float] = None  # Epoch seconds when an exhausted quota refills
+        
+        self._owns_client = client is None
+        self.client = client or httpx.AsyncClient(
+            headers=self.headers,
+            timeout=timeout or config.settings.scrape_timeout,
+            limits=httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency),
+            follow_redirects=True
+        )
+    
+    async def __aenter__(self):
+        """Async context manager entry"""
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit - close client if this scraper created it"""
+        if self._owns_client:
+            await self.client.aclose()
+    
+    def _note_rate_limit(self, response: httpx.Response) -> bool:
+        """
+        Record the API's quota headers
+        
+        Returns:
+            True if the quota is exhausted
+        """
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        reset = response.headers.get("X-RateLimit-Reset")
+        if remaining == "0" and reset and reset.isdigit():
+            self._rate_reset = float(reset)
+            return True
+        return False
+    
+    async def _wait_for_quota(self, url: str) -> None:
+        """Sleep until an exhausted rate-limit quota resets"""
+        if self._rate_reset is None:
+            return
+        wait = self._rate_reset - time.time()
+        if wait > RETRY_AFTER_MAX:
+            raise ScraperRateLimited(
+                f"Rate limit resets in {wait:.0f}s: {url}",
+                retry_after=wait,
+                status_code=429,
+                url=url
+            )
+        if wait > 0:
+            logger.warning("API quota exhausted, waiting for reset", url=url, wait_seconds=round(wait, 1))
+            await asyncio.sleep(wait)
+        self._rate_reset = None
+    
+    async def _get(self, url: str, params: Optional[Dict[str, Any]] = None) -> httpx.Response:
+        """
+        GET an API URL, paced by the semaphore, token bucket and quota headers
+        
+        Args:
+            url: URL to fetch
+            params: Query parameters
+        
+        Returns:
+            Successful response
+        
+        Raises:
+            httpx.HTTPStatusError: Non-2xx response
+            ScraperRateLimited: Quota resets too far in the future
+            ValueError: Body exceeds SCRAPE_MAX_RESPONSE_BYTES
+        """
+        domain = url_netloc(url)
+        async with self._sem:
+            # One retry after a quota reset (GitHub answers 403/429 when exhausted)
+            for attempt in range(2):
+                await self._wait_for_quota(url)
+                
+                wait = reserve_token(
+                    self._bucket,
+                    domain,
+                    config.settings.scrape_rate_per_domain,
+                    self.concurrency
+                )
+                if wait:
+                    await asyncio.sleep(wait)
+                
+                async with self.client.stream("GET", url, params=params) as response:
+                    exhausted = self._note_rate_limit(response)
+                    if exhausted and response.status_code in (403, 429) and attempt == 0:
+                        continue
+                    response.raise_for_status()
+                    await read_capped_async(response, url)
+                return response
+        
+        raise RuntimeError(f"Failed to fetch {url} - unexpected control flow")
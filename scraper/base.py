@@ -1,23 +1,150 @@
 """Base scraper class with anti-detection mechanisms and improved error handling"""
 
 import time
-import random
-from typing import Optional, Dict, Any, List
+import threading
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Iterable, List, Mapping, Tuple
 from abc import ABC, abstractmethod
 
+import numpy as np
 import requests
-from fake_useragent import UserAgent
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+from scraper.user_agents import ROBOTS_USER_AGENT, random_ua_headers
+from scraper.exceptions import (
+    ScraperHTTPError,
+    ScraperNotFound,
+    ScraperRateLimited,
+    ScraperRequestError,
+    ScraperTimeout,
+)
 from utils.logging import get_logger
-from utils.retry import retry_scraper
+from utils.retry import parse_retry_after, retry_scraper
+from utils.cache import ResponseCache
 from utils.circuit_breaker import get_circuit_breaker
-from utils.compliance import ComplianceChecker
+from utils.compliance import ComplianceChecker, reserve_token, url_netloc
 import config
 
 logger = get_logger(__name__)
 
+# Pre-sampled request delays per scraper; indexed with a mask, so a power of two
+DELAY_RING_SIZE = 4096
+
+# Response bodies are streamed in chunks of this size and capped at
+# settings.scrape_max_response_bytes
+RESPONSE_CHUNK_SIZE = 64 * 1024
+
+# Browser-like headers shared by every request; only the User-Agent rotates
+BASE_HEADERS: Mapping[str, str] = MappingProxyType({
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.5",
+    "Accept-Encoding": "gzip, deflate, br",
+    "Connection": "keep-alive",
+    "Upgrade-Insecure-Requests": "1",
+    "Sec-Fetch-Dest": "document",
+    "Sec-Fetch-Mode": "navigate",
+    "Sec-Fetch-Site": "none",
+    "Cache-Control": "max-age=0",
+})
+
+
+def sample_delays(delay_min: float, delay_max: float) -> List[float]:
+    """Draw DELAY_RING_SIZE uniform request delays in one vectorized call"""
+    return np.random.default_rng().uniform(delay_min, delay_max, size=DELAY_RING_SIZE).tolist()
+
+
+def check_response_size(size: int, url: str) -> None:
+    """Raise ValueError once a response body exceeds the configured cap"""
+    limit = config.settings.scrape_max_response_bytes
+    if size > limit:
+        logger.warning("Response too large", url=url, size=size, limit=limit)
+        raise ValueError(f"Response exceeds {limit} bytes: {url}")
+
+
+def read_capped(chunks: Iterable[bytes], content_length: Optional[str], url: str) -> bytes:
+    """
+    Read a streamed response body, stopping as soon as it exceeds the size cap
+    
+    Args:
+        chunks: Body chunks as they arrive
+        content_length: Content-Length header, if the server sent one
+        url: URL being fetched (for errors)
+        
+    Returns:
+        The full body
+    """
+    if content_length and content_length.isdigit():
+        check_response_size(int(content_length), url)
+    
+    body = bytearray()
+    for chunk in chunks:
+        body += chunk
+        check_response_size(len(body), url)
+    return bytes(body)
+
+
+def make_api_session(
+    headers: Mapping[str, str],
+    pool_maxsize: int = 10,
+    status_forcelist: Iterable[int] = (429, 502, 503, 504),
+) -> requests.Session:
+    """
+    Build a keep-alive session for a single API host, retrying idempotent GETs
+    
+    Args:
+        headers: Headers sent with every request
+        pool_maxsize: Connections kept open to the host
+        status_forcelist: Status codes that trigger a retry
+        
+    Returns:
+        Configured requests session
+    """
+    session = requests.Session()
+    retry_strategy = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=list(status_forcelist),
+        allowed_methods=["GET"]
+    )
+    adapter = HTTPAdapter(max_retries=retry_strategy, pool_connections=4, pool_maxsize=pool_maxsize)
+    session.mount("https://", adapter)
+    session.headers.update(headers)
+    return session
+
+
+def _restore_response(url: str, body: bytes, content_type: Optional[str]) -> requests.Response:
+    """Rebuild a cached 200 response from its stored body"""
+    response = requests.Response()
+    response.status_code = 200
+    response.url = url
+    response._content = body
+    if content_type:
+        response.headers["Content-Type"] = content_type
+    return response
+
+
+# Successful responses, shared by every sync scraper (memory + disk)
+_RESPONSE_CACHE = ResponseCache(restore=_restore_response)
+
+_compliance_singleton: Optional[ComplianceChecker] = None
+_compliance_lock = threading.Lock()
+
+
+def get_compliance_checker() -> ComplianceChecker:
+    """
+    Get the process-wide ComplianceChecker
+    
+    Shared by every scraper so robots.txt is fetched and parsed once per
+    site rather than once per scraper instance.
+    """
+    global _compliance_singleton
+    if _compliance_singleton is None:
+        with _compliance_lock:
+            if _compliance_singleton is None:
+                _compliance_singleton = ComplianceChecker()
+    return _compliance_singleton
+
 
 class BaseScraper(ABC):
     """Base class for review scrapers with anti-detection features"""
@@ -36,12 +163,26 @@ class BaseScraper(ABC):
             delay_max: Maximum delay between requests (seconds)
             timeout: Request timeout (seconds)
         """
-        self.ua = UserAgent()
         self.delay_min = delay_min or config.settings.scrape_delay_min
         self.delay_max = delay_max or config.settings.scrape_delay_max
         self.timeout = timeout or config.settings.scrape_timeout
-        self.compliance = ComplianceChecker()
-        self.request_count = {}  # Track requests per domain
+        self._delay_ring = sample_delays(self.delay_min, self.delay_max)
+        self._delay_idx = 0
+        self.compliance = get_compliance_checker()
+        self._bucket: Dict[str, Tuple[float, float]] = {}  # domain -> (tokens, last_ts)
+        self._bucket_lock = threading.Lock()  # A scraper may be shared across worker threads
+        
+        # Shared circuit breaker for all scraper requests
+        self.breaker = get_circuit_breaker(
+            "scraper",
+            failure_threshold=5,
+            timeout=60,
+            expected_exception=(
+                requests.exceptions.RequestException,
+                requests.exceptions.Timeout,
+                requests.exceptions.HTTPError
+            )
+        )
         
         # Create session with retry strategy
         self.session = requests.Session()
@@ -51,9 +192,16 @@ class BaseScraper(ABC):
             status_forcelist=[429, 500, 502, 503, 504],
             allowed_methods=["GET"]
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_connections=20,
+            pool_maxsize=50,
+            pool_block=False
+        )
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
+        # Shared browser headers go on the session; requests only add the User-Agent
+        self.session.headers.update(BASE_HEADERS)
         
         logger.info(
             "Base scraper initialized",
@@ -69,31 +217,74 @@ class BaseScraper(ABC):
         Returns:
             Dictionary of HTTP headers
         """
-        return {
-            "User-Agent": self.ua.random,
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.5",
-            "Accept-Encoding": "gzip, deflate, br",
-            "Connection": "keep-alive",
-            "Upgrade-Insecure-Requests": "1",
-            "Sec-Fetch-Dest": "document",
-            "Sec-Fetch-Mode": "navigate",
-            "Sec-Fetch-Site": "none",
-            "Cache-Control": "max-age=0",
-        }
+        return {**BASE_HEADERS, **random_ua_headers()}
     
     def _delay(self) -> None:
         """Random delay between requests to avoid rate limiting"""
-        delay = random.uniform(self.delay_min, self.delay_max)
+        delay = self._delay_ring[self._delay_idx & (DELAY_RING_SIZE - 1)]
+        self._delay_idx += 1
         logger.debug("Delaying request", delay_seconds=delay)
         time.sleep(delay)
     
     def _check_robots_txt(self, url: str) -> bool:
         """Check robots.txt before fetching"""
-        user_agent = self._get_headers().get("User-Agent", "*")
-        return self.compliance.check_robots_txt(url, user_agent)
+        return self.compliance.check_robots_txt(url, ROBOTS_USER_AGENT)
     
-    @retry_scraper(max_attempts=3)
+    def _do_request(self, url: str) -> requests.Response:
+        """Make one throttled, robots-checked HTTP request (run inside the circuit breaker)"""
+        # Check robots.txt before making request
+        if not self._check_robots_txt(url):
+            logger.warning("URL disallowed by robots.txt", url=url)
+            self.compliance.log_compliance_violation(url, "robots_txt")
+            raise RuntimeError(f"URL disallowed by robots.txt: {url}")
+        
+        # Throttle requests per domain (token bucket, default 1 req/sec)
+        with self._bucket_lock:
+            wait = reserve_token(
+                self._bucket,
+                url_netloc(url),
+                config.settings.scrape_rate_per_domain,
+                config.settings.scrape_burst_per_domain
+            )
+        if wait:
+            time.sleep(wait)
+        
+        self._delay()
+        logger.debug("Fetching URL", url=url)
+        
+        response = self.session.get(
+            url,
+            headers=random_ua_headers(),
+            timeout=self.timeout,
+            allow_redirects=True,
+            stream=True
+        )
+        try:
+            response.raise_for_status()
+            # requests caches the body on _content; filling it keeps
+            # .content/.text working for callers
+            response._content = read_capped(
+                response.iter_content(RESPONSE_CHUNK_SIZE),
+                response.headers.get("Content-Length"),
+                url
+            )
+        finally:
+            response.close()
+        
+        # Validate response content
+        if not response.content:
+            logger.warning("Empty response received", url=url)
+            raise ValueError("Empty response received")
+        
+        logger.info(
+            "Successfully fetched URL",
+            url=url,
+            status_code=response.status_code,
+            content_length=len(response.content)
+        )
+        return response
+    
+    @retry_scraper(max_attempts=3, non_retryable=(ScraperNotFound, ScraperRateLimited, ValueError))
     def _fetch(self, url: str, max_retries: int = 3) -> requests.Response:
         """
         Fetch URL with retries, anti-detection, and circuit breaker protection
@@ -106,6 +297,11 @@ class BaseScraper(ABC):
             Response object
             
         Raises:
+            ScraperNotFound: On 404 (not retried)
+            ScraperRateLimited: On 429 (not retried; carries Retry-After for the caller)
+            ScraperHTTPError: On other error statuses
+            ScraperTimeout: If the request timed out
+            ScraperRequestError: On connection-level failures
             Exception: If fetch fails after all retries or circuit breaker is open
         """
         # Validate URL
@@ -115,73 +311,25 @@ class BaseScraper(ABC):
         if not url.startswith(('http://', 'https://')):
             raise ValueError(f"URL must start with http:// or https://: {url}")
         
-        # Get circuit breaker for scraper
-        breaker = get_circuit_breaker(
-            "scraper",
-            failure_threshold=5,
-            timeout=60,
-            expected_exception=(
-                requests.exceptions.RequestException,
-                requests.exceptions.Timeout,
-                requests.exceptions.HTTPError
-            )
-        )
-        
-        def _make_request():
-            """Make HTTP request wrapped in circuit breaker"""
-            # Check robots.txt before making request
-            if not self._check_robots_txt(url):
-                logger.warning("URL disallowed by robots.txt", url=url)
-                self.compliance.log_compliance_violation(url, "robots_txt")
-                raise RuntimeError(f"URL disallowed by robots.txt: {url}")
-            
-            # Throttle requests (1 req/sec per domain)
-            from urllib.parse import urlparse
-            import time
-            domain = urlparse(url).netloc
-            if domain in self.request_count:
-                if self.compliance.should_throttle(domain, self.request_count[domain]):
-                    time.sleep(1)
-                    # Reset counter after throttling
-                    self.request_count[domain] = 0
-            else:
-                self.request_count[domain] = 0
-            self.request_count[domain] = self.request_count.get(domain, 0) + 1
-            
-            self._delay()
-            logger.debug("Fetching URL", url=url)
-            
-            response = self.session.get(
-                url,
-                headers=self._get_headers(),
-                timeout=self.timeout,
-                allow_redirects=True
-            )
-            response.raise_for_status()
-            
-            # Validate response content
-            if not response.content:
-                logger.warning("Empty response received", url=url)
-                raise ValueError("Empty response received")
-            
-            logger.info(
-                "Successfully fetched URL",
-                url=url,
-                status_code=response.status_code,
-                content_length=len(response.content)
-            )
-            return response
+        cached = _RESPONSE_CACHE.get(url)
+        if cached is not None:
+            logger.debug("Serving cached response", url=url)
+            return cached
         
         try:
             # Use circuit breaker to protect request
-            return breaker.call(_make_request)
+            response = self.breaker.call(self._do_request, url)
+            _RESPONSE_CACHE.set(url, response)
+            return response
             
         except requests.exceptions.Timeout as e:
             logger.error("Request timeout", url=url, error=str(e))
-            raise requests.exceptions.Timeout(f"Request timeout: {url}") from e
+            raise ScraperTimeout(f"Request timeout: {url}") from e
             
         except requests.exceptions.HTTPError as e:
-            status_code = e.response.status_code if e.response else None
+            # Response is falsy for error statuses, so compare with None
+            response = e.response
+            status_code = response.status_code if response is not None else None
             logger.error(
                 "HTTP error",
                 url=url,
@@ -191,23 +339,26 @@ class BaseScraper(ABC):
             
             # Handle specific status codes
             if status_code == 429:  # Rate limited
-                if e.response and e.response.headers:
-                    retry_after = int(e.response.headers.get('Retry-After', 60))
-                else:
-                    retry_after = 60
+                retry_after = parse_retry_after(response.headers.get('Retry-After'))
                 logger.warning("Rate limited", url=url, retry_after=retry_after)
-                raise requests.exceptions.HTTPError(
-                    f"Rate limited. Retry after {retry_after} seconds: {url}"
+                raise ScraperRateLimited(
+                    f"Rate limited. Retry after {retry_after or 60} seconds: {url}",
+                    retry_after=retry_after,
+                    status_code=status_code,
+                    url=url,
+                    response=response
                 ) from e
             
             if status_code == 404:  # Not found - don't retry
-                raise requests.exceptions.HTTPError(f"Resource not found: {url}") from e
+                raise ScraperNotFound(
+                    f"Resource not found: {url}", status_code=status_code, url=url, response=response
+                ) from e
             
-            raise
+            raise ScraperHTTPError(str(e), status_code=status_code, url=url, response=response) from e
             
         except requests.exceptions.RequestException as e:
             logger.error("Request failed", url=url, error=str(e))
-            raise requests.exceptions.RequestException(f"Request failed: {url}") from e
+            raise ScraperRequestError(f"Request failed: {url}") from e
             
         except Exception as e:
             logger.error(
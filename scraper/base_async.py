@@ -1,20 +1,201 @@
 """Async base scraper class with anti-detection mechanisms and improved error handling"""
 
 import asyncio
-import random
-from typing import Optional, Dict, Any, List
+import multiprocessing
+import os
+import threading
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional, Dict, Any, AsyncGenerator, List, Mapping, Tuple
 from abc import ABC, abstractmethod
 
 import httpx
-from fake_useragent import UserAgent
 
+from scraper.base import (
+    BASE_HEADERS,
+    DELAY_RING_SIZE,
+    RESPONSE_CHUNK_SIZE,
+    check_response_size,
+    get_compliance_checker,
+    sample_delays,
+)
+from scraper.dns_cache import install_dns_cache
+from scraper.review_html import ReviewPage, ReviewSelectors, parse_review_page
+from scraper.user_agents import ROBOTS_USER_AGENT, random_ua_headers
 from utils.logging import get_logger
-from utils.retry import retry_scraper
-from utils.compliance import ComplianceChecker
+from utils.retry import backoff_delay, parse_retry_after, retry_scraper, update_congestion
+from utils.cache import ResponseCache
+from utils.compliance import reserve_token, url_netloc
 import config
 
 logger = get_logger(__name__)
 
+# HTTP/2 needs the optional h2 package (httpx[http2])
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# HTTP/2 multiplexes requests over each connection, so fewer idle ones are needed
+HTTP2_MAX_KEEPALIVE = 10
+
+RETRY_AFTER_MAX = 120.0  # Give up instead of honoring longer Retry-After waits
+
+# Tools one scraper works on at once in scrape_many (each walks its own pages)
+SCRAPE_MANY_CONCURRENCY = 3
+
+
+async def read_capped_async(response: httpx.Response, url: str) -> bytes:
+    """
+    Read a streamed httpx response body, stopping as soon as it exceeds the size cap
+    
+    httpx caches the body on _content; filling it keeps .content/.text
+    working for callers after the stream is closed.
+    
+    Args:
+        response: Response opened with client.stream()
+        url: URL being fetched (for errors)
+        
+    Returns:
+        The full body
+    """
+    content_length = response.headers.get("Content-Length")
+    if content_length and content_length.isdigit():
+        check_response_size(int(content_length), url)
+    
+    body = bytearray()
+    async for chunk in response.aiter_bytes(RESPONSE_CHUNK_SIZE):
+        body += chunk
+        check_response_size(len(body), url)
+    response._content = bytes(body)
+    return response._content
+
+
+def _restore_response(url: str, body: bytes, content_type: Optional[str]) -> httpx.Response:
+    """Rebuild a cached 200 response from its stored body"""
+    headers = {"Content-Type": content_type} if content_type else None
+    return httpx.Response(200, content=body, headers=headers, request=httpx.Request("GET", url))
+
+
+# Successful responses, shared by every async scraper (memory + disk)
+_RESPONSE_CACHE = ResponseCache(restore=_restore_response)
+
+
+def _build_client(
+    timeout: float,
+    max_connections: Optional[int] = None,
+    max_keepalive: Optional[int] = None
+) -> httpx.AsyncClient:
+    """AsyncClient with the tuned pool limits, cached DNS and shared browser headers"""
+    if max_keepalive is None:
+        max_keepalive = config.settings.scraper_max_keepalive
+        if HTTP2_AVAILABLE:
+            max_keepalive = min(max_keepalive, HTTP2_MAX_KEEPALIVE)
+    limits = httpx.Limits(
+        max_keepalive_connections=max_keepalive,
+        max_connections=max_connections or config.settings.scraper_max_conn,
+        keepalive_expiry=config.settings.scraper_keepalive_expiry
+    )
+    transport = httpx.AsyncHTTPTransport(http2=HTTP2_AVAILABLE, limits=limits)
+    dns_ttl = config.settings.scraper_dns_cache_ttl
+    if dns_ttl > 0:
+        install_dns_cache(transport, dns_ttl)
+    return httpx.AsyncClient(
+        transport=transport,
+        timeout=timeout,
+        follow_redirects=True,
+        headers=BASE_HEADERS
+    )
+
+
+# One client per event loop (connections are bound to the loop that opened
+# them), so every async scraper on a loop reuses one pool and its TLS sessions.
+# Values are (client, closer); entries vanish with their loop.
+_ClientEntry = Tuple[httpx.AsyncClient, AsyncGenerator[None, None]]
+_shared_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _ClientEntry]" = weakref.WeakKeyDictionary()
+_shared_clients_lock = threading.Lock()  # Loops may run on several threads
+
+
+async def _close_with_loop(client: httpx.AsyncClient) -> AsyncGenerator[None, None]:
+    """
+    Async generator parked at its yield for the life of the loop
+    
+    loop.shutdown_asyncgens() (run by asyncio.run before closing the loop)
+    finalizes it, which closes the loop's client.
+    """
+    try:
+        yield
+    finally:
+        await client.aclose()
+
+
+async def get_shared_client() -> httpx.AsyncClient:
+    """
+    Get the running loop's shared AsyncClient, creating it on first use
+    
+    Each event loop gets its own client, so threads running their own loops
+    (e.g. run_async in worker threads) never replace each other's client.
+    The client is closed when its loop shuts down its async generators.
+    
+    Returns:
+        Shared httpx.AsyncClient for the running loop
+    """
+    loop = asyncio.get_running_loop()
+    with _shared_clients_lock:
+        entry = _shared_clients.get(loop)
+        if entry is not None and not entry[0].is_closed:
+            return entry[0]
+        client = _build_client(config.settings.scrape_timeout)
+        closer = _close_with_loop(client)
+        _shared_clients[loop] = (client, closer)
+    
+    # Start the closer so the loop tracks it; the dict keeps it alive until then
+    await closer.__anext__()
+    logger.info("Shared async HTTP client created")
+    return client
+
+
+async def shutdown_shared_client() -> None:
+    """Close the running loop's shared AsyncClient (call on application teardown)"""
+    with _shared_clients_lock:
+        entry = _shared_clients.pop(asyncio.get_running_loop(), None)
+    if entry is not None:
+        client, closer = entry
+        await closer.aclose()  # Closes the client (a no-op if it was never started)
+        await client.aclose()
+
+
+# Worker processes for review page parsing, so HTML parsing does not block
+# the event loop. Created on first use; None when SCRAPE_PARSE_WORKERS is 0.
+_parse_pool: Optional[ProcessPoolExecutor] = None
+_parse_pool_lock = threading.Lock()
+
+
+def _get_parse_pool() -> Optional[ProcessPoolExecutor]:
+    global _parse_pool
+    workers = config.settings.scrape_parse_workers
+    if workers <= 0:
+        return None
+    with _parse_pool_lock:
+        if _parse_pool is None:
+            # spawn: forking a process that already runs threads can deadlock
+            _parse_pool = ProcessPoolExecutor(
+                max_workers=min(workers, os.cpu_count() or 1),
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return _parse_pool
+
+
+def shutdown_parse_pool() -> None:
+    """Stop the parser worker processes (call on application teardown)"""
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool is not None:
+            _parse_pool.shutdown(wait=False, cancel_futures=True)
+        _parse_pool = None
+
 
 class BaseAsyncScraper(ABC):
     """Async base class for review scrapers with anti-detection features"""
@@ -24,7 +205,9 @@ class BaseAsyncScraper(ABC):
         delay_min: Optional[int] = None,
         delay_max: Optional[int] = None,
         timeout: Optional[int] = None,
-        max_connections: int = 10
+        max_connections: Optional[int] = None,
+        max_keepalive: Optional[int] = None,
+        client: Optional[httpx.AsyncClient] = None
     ):
         """
         Initialize async base scraper
@@ -33,33 +216,31 @@ class BaseAsyncScraper(ABC):
             delay_min: Minimum delay between requests (seconds)
             delay_max: Maximum delay between requests (seconds)
             timeout: Request timeout (seconds)
-            max_connections: Maximum concurrent connections
+            max_connections: Maximum concurrent connections (default SCRAPER_MAX_CONN)
+            max_keepalive: Idle connections kept open (default SCRAPER_MAX_KEEPALIVE)
+            client: Existing client to use (e.g. get_shared_client()); the
+                scraper only closes clients it created itself
         """
-        self.ua = UserAgent()
         self.delay_min = delay_min or config.settings.scrape_delay_min
         self.delay_max = delay_max or config.settings.scrape_delay_max
         self.timeout = timeout or config.settings.scrape_timeout
-        self.max_connections = max_connections
-        self.compliance = ComplianceChecker()
-        self.request_count = {}  # Track requests per domain
-        
-        # Create async HTTP client with connection pooling
-        limits = httpx.Limits(
-            max_keepalive_connections=max_connections,
-            max_connections=max_connections * 2
-        )
-        self.client = httpx.AsyncClient(
-            timeout=self.timeout,
-            limits=limits,
-            follow_redirects=True
-        )
+        self.max_connections = max_connections or config.settings.scraper_max_conn
+        self._delay_ring = sample_delays(self.delay_min, self.delay_max)
+        self._delay_idx = 0
+        self.compliance = get_compliance_checker()
+        self._bucket: Dict[str, Tuple[float, float]] = {}  # domain -> (tokens, last_ts)
+        self._congestion: Dict[str, float] = {}  # domain -> EWMA share of 429 responses
+        
+        # Use the caller's client, or create one with connection pooling
+        self._owns_client = client is None
+        self.client = client or _build_client(self.timeout, self.max_connections, max_keepalive)
         
         logger.info(
             "Async base scraper initialized",
             delay_min=self.delay_min,
             delay_max=self.delay_max,
             timeout=self.timeout,
-            max_connections=max_connections
+            max_connections=self.max_connections
         )
     
     async def __aenter__(self):
@@ -67,39 +248,32 @@ class BaseAsyncScraper(ABC):
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Async context manager exit - close client"""
-        await self.client.aclose()
+        """Async context manager exit - close client if this scraper created it"""
+        if self._owns_client:
+            await self.client.aclose()
     
-    def _get_headers(self) -> Dict[str, str]:
+    def _get_headers(self) -> Mapping[str, str]:
         """
-        Generate random headers to avoid detection
+        Generate per-request headers to avoid detection
+        
+        The shared browser headers are set once on the client, so only the
+        rotating User-Agent is sent per request.
         
         Returns:
-            Dictionary of HTTP headers
+            Read-only mapping of HTTP headers
         """
-        return {
-            "User-Agent": self.ua.random,
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.5",
-            "Accept-Encoding": "gzip, deflate, br",
-            "Connection": "keep-alive",
-            "Upgrade-Insecure-Requests": "1",
-            "Sec-Fetch-Dest": "document",
-            "Sec-Fetch-Mode": "navigate",
-            "Sec-Fetch-Site": "none",
-            "Cache-Control": "max-age=0",
-        }
+        return random_ua_headers()
     
     async def _delay(self) -> None:
         """Random delay between requests to avoid rate limiting"""
-        delay = random.uniform(self.delay_min, self.delay_max)
+        delay = self._delay_ring[self._delay_idx & (DELAY_RING_SIZE - 1)]
+        self._delay_idx += 1
         logger.debug("Delaying request", delay_seconds=delay)
         await asyncio.sleep(delay)
     
     def _check_robots_txt(self, url: str) -> bool:
         """Check robots.txt before fetching"""
-        user_agent = self._get_headers().get("User-Agent", "*")
-        return self.compliance.check_robots_txt(url, user_agent)
+        return self.compliance.check_robots_txt(url, ROBOTS_USER_AGENT)
     
     async def _fetch(self, url: str, max_retries: int = 3) -> httpx.Response:
         """
@@ -115,6 +289,12 @@ class BaseAsyncScraper(ABC):
         Raises:
             Exception: If fetch fails after all retries
         """
+        cached = _RESPONSE_CACHE.get(url)
+        if cached is not None:
+            logger.debug("Serving cached response", url=url)
+            return cached
+        
+        domain = url_netloc(url)
         for attempt in range(max_retries):
             try:
                 # Check robots.txt (only on first attempt)
@@ -124,62 +304,134 @@ class BaseAsyncScraper(ABC):
                         self.compliance.log_compliance_violation(url, "robots_txt")
                         raise RuntimeError(f"URL disallowed by robots.txt: {url}")
                 
-                # Throttle requests (1 req/sec per domain)
-                from urllib.parse import urlparse
-                domain = urlparse(url).netloc
-                if domain in self.request_count:
-                    if self.compliance.should_throttle(domain, self.request_count[domain]):
-                        await asyncio.sleep(1)
-                else:
-                    self.request_count[domain] = 0
-                self.request_count[domain] = self.request_count.get(domain, 0) + 1
+                # Throttle requests per domain (token bucket, default 1 req/sec)
+                wait = reserve_token(
+                    self._bucket,
+                    domain,
+                    config.settings.scrape_rate_per_domain,
+                    config.settings.scrape_burst_per_domain
+                )
+                if wait:
+                    await asyncio.sleep(wait)
                 
                 await self._delay()
                 logger.debug("Fetching URL", url=url, attempt=attempt + 1)
                 
-                response = await self.client.get(
-                    url,
-                    headers=self._get_headers()
-                )
-                response.raise_for_status()
+                async with self.client.stream("GET", url, headers=self._get_headers()) as response:
+                    response.raise_for_status()
+                    
+                    body = await read_capped_async(response, url)
                 
                 logger.info(
                     "Successfully fetched URL",
                     url=url,
-                    status_code=response.status_code
+                    status_code=response.status_code,
+                    http_version=response.http_version,
+                    content_length=len(body)
                 )
+                self._congestion[domain] = update_congestion(self._congestion.get(domain, 0.0), False)
+                _RESPONSE_CACHE.set(url, response)
                 return response
                 
             except httpx.TimeoutException as e:
                 logger.error("Request timeout", url=url, attempt=attempt + 1, error=str(e))
                 if attempt == max_retries - 1:
                     raise
-                await asyncio.sleep(2 ** attempt)  # Exponential backoff
+                await asyncio.sleep(backoff_delay(attempt))
                 
             except httpx.HTTPStatusError as e:
+                status_code = e.response.status_code
                 logger.error(
                     "HTTP error",
                     url=url,
-                    status_code=e.response.status_code,
+                    status_code=status_code,
                     attempt=attempt + 1,
                     error=str(e)
                 )
-                if e.response.status_code in [429, 500, 502, 503, 504]:
-                    if attempt < max_retries - 1:
-                        await asyncio.sleep(2 ** attempt)
-                        continue
-                raise
+                if status_code not in (429, 500, 502, 503, 504) or attempt == max_retries - 1:
+                    raise
+                
+                retry_after = None
+                if status_code == 429:
+                    self._congestion[domain] = update_congestion(self._congestion.get(domain, 0.0), True)
+                    retry_after = parse_retry_after(e.response.headers.get("Retry-After"))
+                    if retry_after is not None and retry_after > RETRY_AFTER_MAX:
+                        logger.warning("Retry-After too long, giving up", url=url, retry_after=retry_after)
+                        raise
+                
+                delay = backoff_delay(attempt, self._congestion.get(domain, 0.0), retry_after)
+                logger.debug("Backing off", url=url, delay_seconds=round(delay, 2))
+                await asyncio.sleep(delay)
                 
             except httpx.RequestError as e:
                 logger.error("Request failed", url=url, attempt=attempt + 1, error=str(e))
                 if attempt == max_retries - 1:
                     raise
-                await asyncio.sleep(2 ** attempt)
+                await asyncio.sleep(backoff_delay(attempt))
         
         # This should never be reached as all exceptions are re-raised on last attempt
         # This is a safety fallback in case of unexpected control flow
         raise RuntimeError(f"Failed to fetch {url} after {max_retries} attempts - unexpected control flow")
     
+    async def _parse_review_page(
+        self,
+        content: bytes,
+        selectors: ReviewSelectors,
+        source: str,
+        limit: int,
+        base_url: Optional[str] = None
+    ) -> ReviewPage:
+        """
+        parse_review_page in a worker process, keeping the event loop free
+        
+        Falls back to parsing inline when the pool is disabled or broken.
+        """
+        pool = _get_parse_pool()
+        if pool is not None:
+            try:
+                return await asyncio.get_running_loop().run_in_executor(
+                    pool, parse_review_page, content, selectors, source, limit, base_url
+                )
+            except BrokenProcessPool as e:
+                logger.warning("Parser pool failed, parsing inline", error=str(e))
+                shutdown_parse_pool()
+        return parse_review_page(content, selectors, source, limit, base_url)
+    
+    async def scrape_many(
+        self,
+        tools: List[Dict[str, Any]],
+        max_concurrent: int = SCRAPE_MANY_CONCURRENCY
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Scrape several tools concurrently (async)
+        
+        Pages within one tool stay sequential since each drives the next;
+        at most ``max_concurrent`` tools are scraped at once, independent of
+        the (much larger) connection pool size.
+        
+        Args:
+            tools: scrape_reviews keyword arguments per tool (tool_name required)
+            max_concurrent: Maximum tools scraped at once
+            
+        Returns:
+            Reviews keyed by tool name (empty list if that tool failed)
+        """
+        semaphore = asyncio.Semaphore(max_concurrent)
+        
+        async def _scrape_one(tool: Dict[str, Any]) -> List[Dict[str, Any]]:
+            async with semaphore:
+                return await self.scrape_reviews(**tool)
+        
+        results = await asyncio.gather(*(_scrape_one(tool) for tool in tools), return_exceptions=True)
+        
+        reviews_by_tool: Dict[str, List[Dict[str, Any]]] = {}
+        for tool, result in zip(tools, results):
+            if isinstance(result, BaseException):
+                logger.error("Tool scraping failed", tool_name=tool["tool_name"], error=str(result))
+                result = []
+            reviews_by_tool[tool["tool_name"]] = result
+        return reviews_by_tool
+    
     @abstractmethod
     async def scrape_reviews(
         self,
@@ -1,145 +1,212 @@
 """Capterra.com review scraper"""
 
+import json
+import os
 import re
-import requests
-from bs4 import BeautifulSoup
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+from urllib.parse import quote, urlencode
+
+from bs4 import BeautifulSoup, SoupStrainer
 from .base import BaseScraper
+from .exceptions import (
+    ScraperHTTPError,
+    ScraperNotFound,
+    ScraperRateLimited,
+    ScraperRequestError,
+    ScraperTimeout,
+)
+from .dedupe import SeenTexts
+from .review_html import MAX_EMPTY_PAGES, MAX_PAGES, ReviewSelectors, page_number, parse_review_page
 from utils.logging import get_logger
+from utils.serialization import dumps_json
+import config
 
 logger = get_logger(__name__)
 
+# Class-name keywords for Capterra review pages
+_SELECTORS = ReviewSelectors(
+    review=("review", "rating", "comment"),
+    text=("text", "content", "review-text", "body", "comment")
+)
+
+# Fixed part of the listing query: 1-2 star reviews, most recent first
+_QUERY = urlencode([("rating", "1-2"), ("sort", "most_recent")])
+
+# Product links on the search page (/p/<id>/...)
+_RE_PID = re.compile(r'/p/(\d+)/')
+_STRAINER_LINK = SoupStrainer('a', href=_RE_PID)
+
+
+def search_url(tool_name: str) -> str:
+    """Capterra search page used to discover a tool's product ID"""
+    return f"https://www.capterra.com/search/{quote(tool_name, safe='')}"
+
+
+def extract_product_id(content: bytes) -> Optional[str]:
+    """Product ID from the first /p/<id>/ link on a search page, if any"""
+    soup = BeautifulSoup(content, 'lxml', parse_only=_STRAINER_LINK)
+    product_link = soup.find('a', href=_RE_PID)
+    if product_link:
+        match = _RE_PID.search(product_link.get('href', ''))
+        if match:
+            return match.group(1)
+    return None
+
+
+class CapterraIdCache:
+    """
+    Tool name -> Capterra product ID, kept in memory and persisted as JSON
+    
+    IDs do not change, so resolved lookups are reused across runs instead of
+    repeating the search-page request. Keys are normalized
+    (stripped, lowercased). The file is loaded lazily from
+    config.settings.capterra_id_cache_path; an empty path keeps the cache
+    in memory only. Thread-safe.
+    """
+    
+    def __init__(self) -> None:
+        self._ids: Optional[Dict[str, str]] = None
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def _key(tool_name: str) -> str:
+        return tool_name.strip().lower()
+    
+    def _load(self) -> Dict[str, str]:
+        if self._ids is None:
+            self._ids = {}
+            path = config.settings.capterra_id_cache_path
+            if path and os.path.exists(path):
+                try:
+                    with open(path, "rb") as f:
+                        self._ids = dict(json.load(f))
+                except (OSError, ValueError, TypeError) as e:
+                    logger.warning("Could not read Capterra ID cache", path=path, error=str(e))
+        return self._ids
+    
+    def get(self, tool_name: str) -> Optional[str]:
+        """Cached product ID for tool_name, or None"""
+        with self._lock:
+            return self._load().get(self._key(tool_name))
+    
+    def set(self, tool_name: str, tool_id: str) -> None:
+        """Remember a resolved product ID and persist the mapping"""
+        with self._lock:
+            ids = self._load()
+            key = self._key(tool_name)
+            if ids.get(key) == tool_id:
+                return
+            ids[key] = tool_id
+            path = config.settings.capterra_id_cache_path
+            if not path:
+                return
+            try:
+                Path(path).parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = f"{path}.tmp"
+                with open(tmp_path, "wb") as f:
+                    f.write(dumps_json(ids, indent=True))
+                os.replace(tmp_path, path)
+            except OSError as e:
+                logger.warning("Could not write Capterra ID cache", path=path, error=str(e))
+
+
+# Shared by the sync and async Capterra scrapers
+capterra_id_cache = CapterraIdCache()
+
 
 class CapterraScraper(BaseScraper):
     """Scraper for Capterra.com reviews"""
     
-    def scrape_reviews(self, tool_name, tool_slug=None, tool_id=None, max_reviews=30):
+    def _resolve_tool_id(self, tool_name: str) -> Optional[str]:
+        """Find a tool's product ID via the cache, then the search page"""
+        tool_id = capterra_id_cache.get(tool_name)
+        if tool_id:
+            return tool_id
+        
+        try:
+            tool_id = extract_product_id(self._fetch(search_url(tool_name)).content)
+        except Exception as e:
+            logger.warning("Failed to find tool ID", tool_name=tool_name, error=str(e))
+            return None
+        
+        if tool_id:
+            capterra_id_cache.set(tool_name, tool_id)
+        return tool_id
+    
+    def iter_reviews(self, tool_name, tool_slug=None, tool_id=None, max_reviews=30) -> Iterator[Dict[str, Any]]:
         """
-        Scrape 1-2 star reviews from Capterra
+        Yield 1-2 star reviews from Capterra as each listing page is parsed
         URL pattern: https://www.capterra.com/p/{id}/{tool}/reviews/?rating=1-2&sort=most_recent
         """
-        if not tool_id:
-            # Try to find tool ID from tool name search
-            search_url = f"https://www.capterra.com/search/{tool_name.replace(' ', '%20')}"
-            try:
-                response = self._fetch(search_url)
-                soup = BeautifulSoup(response.content, 'html.parser')
-                # Look for product link
-                product_link = soup.find('a', href=re.compile(r'/p/\d+/'))
-                if product_link:
-                    match = re.search(r'/p/(\d+)/', product_link.get('href', ''))
-                    if match:
-                        tool_id = match.group(1)
-            except:
-                pass
+        tool_id = tool_id or self._resolve_tool_id(tool_name)
         
         if not tool_id:
-            # Fallback: try common ID patterns or return empty
-            return []
+            # Fallback: try common ID patterns or yield nothing
+            return
         
-        reviews = []
+        count = 0  # Reviews yielded so far
+        seen = SeenTexts()  # Same review repeated across pages
         page = 1
+        empty_streak = 0  # Consecutive pages with no 1-2 star reviews
+        next_url = None  # The site's own link to the next page, once seen
         
-        while len(reviews) < max_reviews:
-            url = f"https://www.capterra.com/p/{tool_id}/{tool_name.lower().replace(' ', '-')}/reviews/"
-            params = {
-                "rating": "1-2",
-                "sort": "most_recent",
-                "page": str(page)
-            }
-            
+        url = f"https://www.capterra.com/p/{quote(tool_id)}/{quote(tool_name.lower().replace(' ', '-'))}/reviews/"
+        
+        while count < max_reviews:
             try:
-                param_str = "&".join([f"{k}={v}" for k, v in params.items()])
-                full_url = f"{url}?{param_str}"
+                full_url = next_url or f"{url}?{_QUERY}&page={page}"
                 
                 response = self._fetch(full_url)
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # Find review elements (Capterra structure)
-                review_elements = soup.find_all(['div', 'article'], class_=re.compile(r'review|rating|comment', re.I))
-                
-                if not review_elements:
-                    # Try alternative selectors
-                    review_elements = soup.find_all('div', {'data-testid': re.compile(r'review', re.I)})
+                result = parse_review_page(
+                    response.content, _SELECTORS, "Capterra", max_reviews - count, base_url=full_url
+                )
                 
-                if not review_elements:
+                if not result.element_count:
                     break
                 
-                for element in review_elements:
-                    if len(reviews) >= max_reviews:
-                        break
-                    
-                    try:
-                        # Extract review text with error handling
-                        text_elem = element.find(['p', 'div'], class_=re.compile(r'text|content|review-text|body|comment', re.I))
-                        if not text_elem:
-                            text_elem = element.find('p')
-                        
-                        review_text = text_elem.get_text(strip=True) if text_elem else ""
-                        
-                        if not review_text or len(review_text) < 20:
-                            continue
-                        
-                        # Extract rating with error handling
-                        rating_elem = element.find(['span', 'div'], class_=re.compile(r'rating|star', re.I))
-                        rating = None
-                        if rating_elem:
-                            try:
-                                rating_text = rating_elem.get_text(strip=True)
-                                rating_match = re.search(r'(\d+)', rating_text)
-                                if rating_match:
-                                    rating = int(rating_match.group(1))
-                            except (ValueError, AttributeError) as e:
-                                logger.debug("Error extracting rating", error=str(e))
-                                continue
-                        
-                        # Extract date with error handling
-                        date_elem = element.find(['time', 'span', 'div'], class_=re.compile(r'date|time', re.I))
-                        date = None
-                        if date_elem:
-                            try:
-                                date = date_elem.get_text(strip=True)
-                            except AttributeError:
-                                pass
-                        
-                        # Only include 1-2 star reviews
-                        if rating and rating <= 2:
-                            reviews.append({
-                                "text": review_text,
-                                "rating": rating,
-                                "date": date,
-                                "source": "Capterra"
-                            })
-                    except Exception as e:
-                        logger.warning("Error extracting review element", error=str(e), tool_name=tool_name)
-                        continue  # Skip this element and continue
+                for review in result.reviews:
+                    if seen.add(review["text"]):
+                        count += 1
+                        yield review
+                empty_streak = 0 if result.reviews else empty_streak + 1
                 
-                # Check for next page
-                next_page = soup.find('a', {'aria-label': re.compile(r'next|page', re.I)})
-                if not next_page or page >= 10:
+                # Stop on the last page, or once complaints have dried up
+                if not result.has_next or page >= MAX_PAGES or empty_streak >= MAX_EMPTY_PAGES:
                     break
                 
-                page += 1
-                
-            except requests.exceptions.HTTPError as e:
-                status_code = e.response.status_code if e.response else None
-                if status_code == 404:
-                    logger.info("Page not found, stopping", page=page, tool_name=tool_name)
-                    break
-                elif status_code == 429:
-                    logger.warning("Rate limited, stopping", page=page, tool_name=tool_name)
+                # Follow the site's next link, unless it does not move forward
+                next_page = page_number(result.next_url)
+                if next_page is not None and next_page <= page:
                     break
+                next_url = result.next_url
+                page = next_page or page + 1
+                
+            except ScraperNotFound:
+                if page == 1:
+                    logger.info("Tool not found, skipping", tool_name=tool_name)
                 else:
-                    logger.error("HTTP error scraping Capterra page", page=page, tool_name=tool_name, status_code=status_code, error=str(e))
-                    break
-            except requests.exceptions.Timeout as e:
+                    logger.info("Page not found, stopping", page=page, tool_name=tool_name)
+                break
+            except ScraperRateLimited as e:
+                logger.warning("Rate limited, stopping", page=page, tool_name=tool_name, retry_after=e.retry_after)
+                break
+            except ScraperHTTPError as e:
+                logger.error("HTTP error scraping Capterra page", page=page, tool_name=tool_name, status_code=e.status_code, error=str(e))
+                break
+            except ScraperTimeout as e:
                 logger.error("Timeout scraping Capterra page", page=page, tool_name=tool_name, error=str(e))
                 break
-            except requests.exceptions.RequestException as e:
+            except ScraperRequestError as e:
                 logger.error("Request error scraping Capterra page", page=page, tool_name=tool_name, error=str(e))
                 break
             except Exception as e:
                 logger.error("Unexpected error scraping Capterra page", page=page, tool_name=tool_name, error=str(e), error_type=type(e).__name__)
                 break
         
-        logger.info("Scraping complete", tool_name=tool_name, reviews_found=len(reviews), max_reviews=max_reviews)
-        return reviews[:max_reviews]
+        logger.info("Scraping complete", tool_name=tool_name, reviews_found=count, max_reviews=max_reviews)
+    
+    def scrape_reviews(self, tool_name, tool_slug=None, tool_id=None, max_reviews=30):
+        """Scrape 1-2 star reviews from Capterra into a list"""
+        return list(self.iter_reviews(tool_name, tool_slug, tool_id, max_reviews))
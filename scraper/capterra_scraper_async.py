@@ -1,133 +1,99 @@
 """Async Capterra.com review scraper"""
 
-from bs4 import BeautifulSoup
+from typing import Any, AsyncIterator, Dict, List, Optional
+from urllib.parse import quote, urlencode
+
 from .base_async import BaseAsyncScraper
+from .capterra_scraper import capterra_id_cache, extract_product_id, search_url
+from .dedupe import SeenTexts
+from .review_html import MAX_EMPTY_PAGES, MAX_PAGES, ReviewSelectors, page_number
 from utils.logging import get_logger
-import re
 
 logger = get_logger(__name__)
 
+# Class-name keywords for Capterra review pages
+_SELECTORS = ReviewSelectors(
+    review=("review", "rating", "comment"),
+    text=("text", "content", "review-text", "body", "comment")
+)
+
+# Fixed part of the listing query: 1-2 star reviews, most recent first
+_QUERY = urlencode([("rating", "1-2"), ("sort", "most_recent")])
+
 
 class CapterraScraperAsync(BaseAsyncScraper):
     """Async scraper for Capterra.com reviews"""
     
-    async def scrape_reviews(
+    async def _resolve_tool_id(self, tool_name: str) -> Optional[str]:
+        """Find a tool's product ID via the cache, then the search page"""
+        tool_id = capterra_id_cache.get(tool_name)
+        if tool_id:
+            return tool_id
+        
+        try:
+            response = await self._fetch(search_url(tool_name))
+            tool_id = extract_product_id(response.content)
+        except Exception as e:
+            logger.warning("Failed to find tool ID", tool_name=tool_name, error=str(e))
+            return None
+        
+        if tool_id:
+            capterra_id_cache.set(tool_name, tool_id)
+        return tool_id
+    
+    async def iter_reviews(
         self,
         tool_name: str,
         tool_slug: str = None,
         tool_id: str = None,
         max_reviews: int = 30
-    ):
+    ) -> AsyncIterator[Dict[str, Any]]:
         """
-        Scrape 1-2 star reviews from Capterra (async)
+        Yield 1-2 star reviews from Capterra as each listing page is parsed (async)
         URL pattern: https://www.capterra.com/p/{id}/{tool}/reviews/?rating=1-2&sort=most_recent
         """
-        if not tool_id:
-            # Try to find tool ID from tool name search
-            search_url = f"https://www.capterra.com/search/{tool_name.replace(' ', '%20')}"
-            try:
-                response = await self._fetch(search_url)
-                soup = BeautifulSoup(response.content, 'html.parser')
-                # Look for product link
-                product_link = soup.find('a', href=re.compile(r'/p/\d+/'))
-                if product_link:
-                    match = re.search(r'/p/(\d+)/', product_link.get('href', ''))
-                    if match:
-                        tool_id = match.group(1)
-            except Exception as e:
-                logger.warning("Failed to find tool ID", tool_name=tool_name, error=str(e))
+        tool_id = tool_id or await self._resolve_tool_id(tool_name)
         
         if not tool_id:
-            # Fallback: try common ID patterns or return empty
-            return []
+            # Fallback: try common ID patterns or yield nothing
+            return
         
-        reviews = []
+        count = 0  # Reviews yielded so far
+        seen = SeenTexts()  # Same review repeated across pages
         page = 1
+        empty_streak = 0  # Consecutive pages with no 1-2 star reviews
+        next_url = None  # The site's own link to the next page, once seen
+        
+        url = f"https://www.capterra.com/p/{quote(tool_id)}/{quote(tool_name.lower().replace(' ', '-'))}/reviews/"
         
-        while len(reviews) < max_reviews:
-            url = f"https://www.capterra.com/p/{tool_id}/{tool_name.lower().replace(' ', '-')}/reviews/"
-            params = {
-                "rating": "1-2",
-                "sort": "most_recent",
-                "page": str(page)
-            }
-            
+        while count < max_reviews:
             try:
-                param_str = "&".join([f"{k}={v}" for k, v in params.items()])
-                full_url = f"{url}?{param_str}"
+                full_url = next_url or f"{url}?{_QUERY}&page={page}"
                 
                 response = await self._fetch(full_url)
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # Find review elements (Capterra structure)
-                review_elements = soup.find_all(
-                    ['div', 'article'],
-                    class_=re.compile(r'review|rating|comment', re.I)
+                result = await self._parse_review_page(
+                    response.content, _SELECTORS, "Capterra", max_reviews - count, base_url=full_url
                 )
                 
-                if not review_elements:
-                    # Try alternative selectors
-                    review_elements = soup.find_all(
-                        'div',
-                        {'data-testid': re.compile(r'review', re.I)}
-                    )
-                
-                if not review_elements:
+                if not result.element_count:
                     break
                 
-                for element in review_elements:
-                    if len(reviews) >= max_reviews:
-                        break
-                    
-                    # Extract review text
-                    text_elem = element.find(
-                        ['p', 'div'],
-                        class_=re.compile(r'text|content|review-text|body|comment', re.I)
-                    )
-                    if not text_elem:
-                        text_elem = element.find('p')
-                    
-                    review_text = text_elem.get_text(strip=True) if text_elem else ""
-                    
-                    if not review_text or len(review_text) < 20:
-                        continue
-                    
-                    # Extract rating
-                    rating_elem = element.find(
-                        ['span', 'div'],
-                        class_=re.compile(r'rating|star', re.I)
-                    )
-                    rating = None
-                    if rating_elem:
-                        rating_text = rating_elem.get_text(strip=True)
-                        rating_match = re.search(r'(\d+)', rating_text)
-                        if rating_match:
-                            rating = int(rating_match.group(1))
-                    
-                    # Extract date
-                    date_elem = element.find(
-                        ['time', 'span', 'div'],
-                        class_=re.compile(r'date|time', re.I)
-                    )
-                    date = None
-                    if date_elem:
-                        date = date_elem.get_text(strip=True)
-                    
-                    # Only include 1-2 star reviews
-                    if rating and rating <= 2:
-                        reviews.append({
-                            "text": review_text,
-                            "rating": rating,
-                            "date": date,
-                            "source": "Capterra"
-                        })
+                for review in result.reviews:
+                    if seen.add(review["text"]):
+                        count += 1
+                        yield review
+                empty_streak = 0 if result.reviews else empty_streak + 1
                 
-                # Check for next page
-                next_page = soup.find('a', {'aria-label': re.compile(r'next|page', re.I)})
-                if not next_page or page >= 10:
+                # Stop on the last page, or once complaints have dried up
+                if not result.has_next or page >= MAX_PAGES or empty_streak >= MAX_EMPTY_PAGES:
                     break
                 
-                page += 1
+                # Follow the site's next link, unless it does not move forward
+                next_page = page_number(result.next_url)
+                if next_page is not None and next_page <= page:
+                    break
+                next_url = result.next_url
+                page = next_page or page + 1
                 
             except Exception as e:
                 logger.error(
@@ -137,5 +103,13 @@ class CapterraScraperAsync(BaseAsyncScraper):
                     error=str(e)
                 )
                 break
-        
-        return reviews[:max_reviews]
+    
+    async def scrape_reviews(
+        self,
+        tool_name: str,
+        tool_slug: str = None,
+        tool_id: str = None,
+        max_reviews: int = 30
+    ) -> List[Dict[str, Any]]:
+        """Scrape 1-2 star reviews from Capterra into a list (async)"""
+        return [review async for review in self.iter_reviews(tool_name, tool_slug, tool_id, max_reviews)]
@@ -0,0 +1,46 @@
+"""Per-scrape duplicate filtering for scraped records
+
+Listing pages and search queries often return the same review, issue or
+comment more than once (e.g. a comment matching several HN queries). Each
+scrape keeps a set of 64-bit digests of the texts it has emitted, so a
+repeat costs one hash and one set lookup.
+"""
+
+import hashlib
+
+# Optional fast non-cryptographic hash
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+
+def text_digest(text: str) -> int:
+    """64-bit digest of a record's text (xxh64 when installed, else BLAKE2b)"""
+    data = text.encode("utf-8")
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh64_intdigest(data)
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "big")
+
+
+class SeenTexts:
+    """Texts already emitted during one scrape"""
+    
+    __slots__ = ("_digests",)
+    
+    def __init__(self) -> None:
+        self._digests = set()
+    
+    def add(self, text: str) -> bool:
+        """
+        Record a text
+        
+        Returns:
+            True if the text is new, False if it was already seen
+        """
+        digest = text_digest(text)
+        if digest in self._digests:
+            return False
+        self._digests.add(digest)
+        return True
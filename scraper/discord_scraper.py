@@ -1,5 +1,7 @@
 """Discord scraper for tech servers and B2B discussions"""
 
+import re
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 from utils.logging import get_logger
@@ -15,12 +17,41 @@ except ImportError:
     logger.warning("discord.py not available. Install with: pip install discord.py")
 
 
+# All complaint keywords as one alternation, matched in a single pass per message
+_COMPLAINT_RE = re.compile(
+    r'\b(?:problem|issue|bug|broken|disappointed|frustrated|terrible|awful|worst|hate|'
+    r'switching|alternative)\b',
+    re.IGNORECASE
+)
+
+
+@lru_cache(maxsize=256)
+def _tool_pattern(tool_name: str) -> "re.Pattern[str]":
+    """Whole-word, case-insensitive matcher for a tool name"""
+    return re.compile(rf'\b{re.escape(tool_name)}\b', re.IGNORECASE)
+
+
+def is_tool_complaint(content: str, tool_name: str) -> bool:
+    """True if a message mentions the tool alongside a complaint keyword"""
+    return bool(_COMPLAINT_RE.search(content)) and bool(_tool_pattern(tool_name).search(content))
+
+
+def _load_token() -> Optional[str]:
+    """Discord bot token from Streamlit secrets, or None"""
+    try:
+        import streamlit as st
+        return st.secrets.get("discord", {}).get("token") or None
+    except Exception:
+        return None
+
+
 class DiscordScraper:
     """Scraper for Discord tech servers and B2B discussions"""
     
     def __init__(self):
         """Initialize Discord scraper"""
         self.client = None
+        self._token = _load_token() if DISCORD_AVAILABLE else None
         logger.info("Discord scraper initialized")
     
     async def scrape_tech_servers(
@@ -52,18 +83,12 @@ class DiscordScraper:
             logger.warning("discord.py not available, skipping Discord scraping")
             return []
         
-        complaints = []
-        
-        try:
-            import streamlit as st
-            discord_token = st.secrets.get("discord", {}).get("token") or None
-        except:
-            discord_token = None
-        
-        if not discord_token:
+        if not self._token:
             logger.warning("Discord token not found, skipping Discord scraping")
             return []
         
+        complaints = []
+        
         try:
             intents = discord.Intents.default()
             intents.message_content = True
@@ -73,10 +98,7 @@ class DiscordScraper:
             async def on_ready():
                 logger.info("Discord client ready")
             
-            # Search for messages containing tool name and complaint keywords
-            complaint_keywords = ['problem', 'issue', 'bug', 'broken', 'disappointed',
-                                'frustrated', 'terrible', 'awful', 'worst', 'hate',
-                                'switching', 'alternative']
+            # Messages are kept when is_tool_complaint(message.content, tool_name)
             
             # Note: Discord API requires proper bot setup and permissions
             # This is a placeholder implementation
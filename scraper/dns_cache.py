@@ -0,0 +1,125 @@
+"""TTL-cached DNS resolution for the async scrapers' httpx connection pool"""
+
+import asyncio
+import ipaddress
+import socket
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import httpcore
+import httpx
+
+from utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# (host, port) -> (expires_at, addresses); shared by every client in the process
+_DNS_CACHE: Dict[Tuple[str, int], Tuple[float, List[str]]] = {}
+
+
+def _is_ip(host: str) -> bool:
+    try:
+        ipaddress.ip_address(host)
+        return True
+    except ValueError:
+        return False
+
+
+class CachingNetworkBackend(httpcore.AsyncNetworkBackend):
+    """
+    httpcore network backend that resolves each host once per TTL
+    
+    New pool connections to G2/Capterra reuse the cached addresses instead
+    of a getaddrinfo round-trip. Only the TCP connect target changes; TLS
+    still verifies and sends SNI for the original hostname.
+    """
+    
+    def __init__(self, backend: httpcore.AsyncNetworkBackend, ttl: float) -> None:
+        self._backend = backend
+        self._ttl = ttl
+    
+    async def _resolve(self, host: str, port: int, timeout: Optional[float]) -> List[str]:
+        if _is_ip(host):
+            return [host]
+        
+        key = (host, port)
+        now = time.monotonic()
+        entry = _DNS_CACHE.get(key)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+        
+        try:
+            infos = await asyncio.wait_for(
+                asyncio.get_running_loop().getaddrinfo(host, port, type=socket.SOCK_STREAM),
+                timeout
+            )
+        except (OSError, asyncio.TimeoutError) as e:
+            raise httpcore.ConnectError(f"DNS lookup failed for {host}: {e}") from e
+        
+        addresses = list(dict.fromkeys(str(info[4][0]) for info in infos))
+        _DNS_CACHE[key] = (now + self._ttl, addresses)
+        logger.debug("Resolved host", host=host, addresses=addresses)
+        return addresses
+    
+    async def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: Optional[float] = None,
+        local_address: Optional[str] = None,
+        socket_options: Optional[Iterable] = None
+    ) -> httpcore.AsyncNetworkStream:
+        last_error: Optional[Exception] = None
+        for address in await self._resolve(host, port, timeout):
+            try:
+                return await self._backend.connect_tcp(
+                    address,
+                    port,
+                    timeout=timeout,
+                    local_address=local_address,
+                    socket_options=socket_options
+                )
+            except (httpcore.ConnectError, httpcore.ConnectTimeout) as e:
+                last_error = e  # Try the next address
+        
+        # A failed connect may mean the host moved: resolve again next time
+        _DNS_CACHE.pop((host, port), None)
+        raise last_error or httpcore.ConnectError(f"No addresses for {host}")
+    
+    async def connect_unix_socket(
+        self,
+        path: str,
+        timeout: Optional[float] = None,
+        socket_options: Optional[Iterable] = None
+    ) -> httpcore.AsyncNetworkStream:
+        return await self._backend.connect_unix_socket(path, timeout=timeout, socket_options=socket_options)
+    
+    async def sleep(self, seconds: float) -> None:
+        await self._backend.sleep(seconds)
+
+
+def install_dns_cache(transport: httpx.AsyncHTTPTransport, ttl: float) -> bool:
+    """
+    Route a transport's new connections through CachingNetworkBackend
+    
+    Args:
+        transport: Transport whose connection pool should use the cache
+        ttl: Seconds a resolved address stays cached
+    
+    Returns:
+        True if installed (False for pools without a network backend, e.g.
+        an unexpected httpcore layout)
+    """
+    pool = getattr(transport, "_pool", None)
+    backend = getattr(pool, "_network_backend", None)
+    if pool is None or backend is None:
+        logger.debug("DNS cache not installed: transport has no network backend")
+        return False
+    if not isinstance(backend, CachingNetworkBackend):
+        pool._network_backend = CachingNetworkBackend(backend, ttl)
+    return True
+
+
+def clear_dns_cache() -> None:
+    """Drop all cached addresses"""
+    _DNS_CACHE.clear()
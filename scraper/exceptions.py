@@ -0,0 +1,45 @@
+"""Scraper exception hierarchy
+
+BaseScraper._fetch raises these instead of bare ``requests`` exceptions so
+scrape loops can branch on what went wrong (missing page, rate limit,
+timeout) without depending on the HTTP library. Each class also subclasses
+the matching ``requests`` exception, so existing ``except
+requests.exceptions.*`` handlers keep working.
+"""
+
+from typing import Optional
+
+import requests
+
+
+class ScraperError(Exception):
+    """Base class for scraper failures"""
+
+
+class ScraperRequestError(ScraperError, requests.exceptions.RequestException):
+    """Request could not be completed (connection, TLS, etc.)"""
+
+
+class ScraperTimeout(ScraperRequestError, requests.exceptions.Timeout):
+    """Request timed out"""
+
+
+class ScraperHTTPError(ScraperRequestError, requests.exceptions.HTTPError):
+    """Server answered with an error status"""
+    
+    def __init__(self, message: str, status_code: Optional[int] = None, url: Optional[str] = None, **kwargs):
+        super().__init__(message, **kwargs)
+        self.status_code = status_code
+        self.url = url
+
+
+class ScraperNotFound(ScraperHTTPError):
+    """Page does not exist (404); retrying will not help"""
+
+
+class ScraperRateLimited(ScraperHTTPError):
+    """Server is rate limiting (429)"""
+    
+    def __init__(self, message: str, retry_after: Optional[float] = None, **kwargs):
+        super().__init__(message, **kwargs)
+        self.retry_after = retry_after
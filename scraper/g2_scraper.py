@@ -1,133 +1,107 @@
 """G2.com review scraper"""
 
-import re
-import requests
-from bs4 import BeautifulSoup
+from typing import Any, Dict, Iterator
+from urllib.parse import quote, urlencode
+
 from .base import BaseScraper
+from .exceptions import (
+    ScraperHTTPError,
+    ScraperNotFound,
+    ScraperRateLimited,
+    ScraperRequestError,
+    ScraperTimeout,
+)
+from .dedupe import SeenTexts
+from .review_html import MAX_EMPTY_PAGES, MAX_PAGES, ReviewSelectors, page_number, parse_review_page
 from utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Class-name keywords for G2 review pages
+_SELECTORS = ReviewSelectors(
+    review=("review", "rating"),
+    text=("text", "content", "review-text", "body")
+)
+
+# Fixed part of the listing query: 1-2 star reviews, newest first
+_QUERY = urlencode([("rating", "1"), ("rating", "2"), ("sort", "newest")])
+
 
 class G2Scraper(BaseScraper):
     """Scraper for G2.com reviews"""
     
-    def scrape_reviews(self, tool_name, tool_slug=None, tool_id=None, max_reviews=30):
+    def iter_reviews(self, tool_name, tool_slug=None, tool_id=None, max_reviews=30) -> Iterator[Dict[str, Any]]:
         """
-        Scrape 1-2 star reviews from G2.com
+        Yield 1-2 star reviews from G2.com as each listing page is parsed
         URL pattern: https://www.g2.com/products/{tool_slug}/reviews?rating=1&rating=2&sort=newest
         """
         if not tool_slug:
             # Convert tool name to slug format
             tool_slug = tool_name.lower().replace(" ", "-")
         
-        reviews = []
+        count = 0  # Reviews yielded so far
+        seen = SeenTexts()  # Same review repeated across pages
         page = 1
+        empty_streak = 0  # Consecutive pages with no 1-2 star reviews
+        next_url = None  # The site's own link to the next page, once seen
+        
+        url = f"https://www.g2.com/products/{quote(tool_slug)}/reviews"
         
-        while len(reviews) < max_reviews:
-            url = f"https://www.g2.com/products/{tool_slug}/reviews"
-            params = {
-                "rating": ["1", "2"],
-                "sort": "newest",
-                "page": str(page)
-            }
-            
+        while count < max_reviews:
             try:
-                # Build URL with params
-                param_str = "&".join([f"{k}={v}" if not isinstance(v, list) else "&".join([f"{k}={item}" for item in v]) for k, v in params.items()])
-                full_url = f"{url}?{param_str}"
+                full_url = next_url or f"{url}?{_QUERY}&page={page}"
                 
                 response = self._fetch(full_url)
-                soup = BeautifulSoup(response.content, 'html.parser')
+                result = parse_review_page(
+                    response.content, _SELECTORS, "G2", max_reviews - count, base_url=full_url
+                )
                 
-                # Find review elements (G2 structure may vary)
-                review_elements = soup.find_all(['div', 'article'], class_=re.compile(r'review|rating', re.I))
-                
-                if not review_elements:
-                    # Try alternative selectors
-                    review_elements = soup.find_all('div', {'data-testid': re.compile(r'review', re.I)})
-                
-                if not review_elements:
+                if not result.element_count:
                     # If no reviews found, break
                     logger.debug("No review elements found", page=page, tool_name=tool_name)
                     break
                 
-                for element in review_elements:
-                    if len(reviews) >= max_reviews:
-                        break
-                    
-                    try:
-                        # Extract review text with error handling
-                        text_elem = element.find(['p', 'div'], class_=re.compile(r'text|content|review-text|body', re.I))
-                        if not text_elem:
-                            text_elem = element.find('p')
-                        
-                        review_text = text_elem.get_text(strip=True) if text_elem else ""
-                        
-                        if not review_text or len(review_text) < 20:  # Skip very short reviews
-                            continue
-                        
-                        # Extract rating with error handling
-                        rating_elem = element.find(['span', 'div'], class_=re.compile(r'rating|star', re.I))
-                        rating = None
-                        if rating_elem:
-                            try:
-                                rating_text = rating_elem.get_text(strip=True)
-                                rating_match = re.search(r'(\d+)', rating_text)
-                                if rating_match:
-                                    rating = int(rating_match.group(1))
-                            except (ValueError, AttributeError) as e:
-                                logger.debug("Error extracting rating", error=str(e))
-                                continue
-                        
-                        # Extract date with error handling
-                        date_elem = element.find(['time', 'span', 'div'], class_=re.compile(r'date|time', re.I))
-                        date = None
-                        if date_elem:
-                            try:
-                                date = date_elem.get_text(strip=True)
-                            except AttributeError:
-                                pass
-                        
-                        # Only include 1-2 star reviews
-                        if rating and rating <= 2:
-                            reviews.append({
-                                "text": review_text,
-                                "rating": rating,
-                                "date": date,
-                                "source": "G2"
-                            })
-                    except Exception as e:
-                        logger.warning("Error extracting review element", error=str(e), tool_name=tool_name)
-                        continue  # Skip this element and continue
+                for review in result.reviews:
+                    if seen.add(review["text"]):
+                        count += 1
+                        yield review
+                empty_streak = 0 if result.reviews else empty_streak + 1
                 
-                # Check if there are more pages
-                next_page = soup.find('a', {'aria-label': re.compile(r'next|page', re.I)})
-                if not next_page or page >= 10:  # Limit to 10 pages
+                # Stop on the last page, or once complaints have dried up
+                if not result.has_next or page >= MAX_PAGES or empty_streak >= MAX_EMPTY_PAGES:
                     break
                 
-                page += 1
-                
-            except requests.exceptions.HTTPError as e:
-                status_code = e.response.status_code if e.response else None
-                if status_code == 404:
-                    logger.info("Page not found, stopping", page=page, tool_name=tool_name)
-                    break
-                elif status_code == 429:
-                    logger.warning("Rate limited, stopping", page=page, tool_name=tool_name)
+                # Follow the site's next link, unless it does not move forward
+                next_page = page_number(result.next_url)
+                if next_page is not None and next_page <= page:
                     break
+                next_url = result.next_url
+                page = next_page or page + 1
+                
+            except ScraperNotFound:
+                if page == 1:
+                    logger.info("Tool not found, skipping", tool_name=tool_name)
                 else:
-                    logger.error("HTTP error scraping G2 page", page=page, tool_name=tool_name, status_code=status_code, error=str(e))
-                    break
-            except requests.exceptions.Timeout as e:
+                    logger.info("Page not found, stopping", page=page, tool_name=tool_name)
+                break
+            except ScraperRateLimited as e:
+                logger.warning("Rate limited, stopping", page=page, tool_name=tool_name, retry_after=e.retry_after)
+                break
+            except ScraperHTTPError as e:
+                logger.error("HTTP error scraping G2 page", page=page, tool_name=tool_name, status_code=e.status_code, error=str(e))
+                break
+            except ScraperTimeout as e:
                 logger.error("Timeout scraping G2 page", page=page, tool_name=tool_name, error=str(e))
                 break
-            except requests.exceptions.RequestException as e:
+            except ScraperRequestError as e:
                 logger.error("Request error scraping G2 page", page=page, tool_name=tool_name, error=str(e))
                 break
             except Exception as e:
                 logger.error("Unexpected error scraping G2 page", page=page, tool_name=tool_name, error=str(e), error_type=type(e).__name__)
                 break
         
-        logger.info("Scraping complete", tool_name=tool_name, reviews_found=len(reviews), max_reviews=max_reviews)
-        return reviews[:max_reviews]
+        logger.info("Scraping complete", tool_name=tool_name, reviews_found=count, max_reviews=max_reviews)
+    
+    def scrape_reviews(self, tool_name, tool_slug=None, tool_id=None, max_reviews=30):
+        """Scrape 1-2 star reviews from G2.com into a list"""
+        return list(self.iter_reviews(tool_name, tool_slug, tool_id, max_reviews))
@@ -1,124 +1,79 @@
 """Async G2.com review scraper"""
 
-from bs4 import BeautifulSoup
+from typing import Any, AsyncIterator, Dict, List
+from urllib.parse import quote, urlencode
+
 from .base_async import BaseAsyncScraper
+from .dedupe import SeenTexts
+from .review_html import MAX_EMPTY_PAGES, MAX_PAGES, ReviewSelectors, page_number
 from utils.logging import get_logger
-import re
 
 logger = get_logger(__name__)
 
+# Class-name keywords for G2 review pages
+_SELECTORS = ReviewSelectors(
+    review=("review", "rating"),
+    text=("text", "content", "review-text", "body")
+)
+
+# Fixed part of the listing query: 1-2 star reviews, newest first
+_QUERY = urlencode([("rating", "1"), ("rating", "2"), ("sort", "newest")])
+
 
 class G2ScraperAsync(BaseAsyncScraper):
     """Async scraper for G2.com reviews"""
     
-    async def scrape_reviews(
+    async def iter_reviews(
         self,
         tool_name: str,
         tool_slug: str = None,
         tool_id: str = None,
         max_reviews: int = 30
-    ):
+    ) -> AsyncIterator[Dict[str, Any]]:
         """
-        Scrape 1-2 star reviews from G2.com (async)
+        Yield 1-2 star reviews from G2.com as each listing page is parsed (async)
         URL pattern: https://www.g2.com/products/{tool_slug}/reviews?rating=1&rating=2&sort=newest
         """
         if not tool_slug:
             # Convert tool name to slug format
             tool_slug = tool_name.lower().replace(" ", "-")
         
-        reviews = []
+        count = 0  # Reviews yielded so far
+        seen = SeenTexts()  # Same review repeated across pages
         page = 1
+        empty_streak = 0  # Consecutive pages with no 1-2 star reviews
+        next_url = None  # The site's own link to the next page, once seen
         
-        while len(reviews) < max_reviews:
-            url = f"https://www.g2.com/products/{tool_slug}/reviews"
-            params = {
-                "rating": ["1", "2"],
-                "sort": "newest",
-                "page": str(page)
-            }
-            
+        url = f"https://www.g2.com/products/{quote(tool_slug)}/reviews"
+        
+        while count < max_reviews:
             try:
-                # Build URL with params
-                param_str = "&".join([
-                    f"{k}={v}" if not isinstance(v, list)
-                    else "&".join([f"{k}={item}" for item in v])
-                    for k, v in params.items()
-                ])
-                full_url = f"{url}?{param_str}"
+                full_url = next_url or f"{url}?{_QUERY}&page={page}"
                 
                 response = await self._fetch(full_url)
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # Find review elements (G2 structure may vary)
-                review_elements = soup.find_all(
-                    ['div', 'article'],
-                    class_=re.compile(r'review|rating', re.I)
+                result = await self._parse_review_page(
+                    response.content, _SELECTORS, "G2", max_reviews - count, base_url=full_url
                 )
                 
-                if not review_elements:
-                    # Try alternative selectors
-                    review_elements = soup.find_all(
-                        'div',
-                        {'data-testid': re.compile(r'review', re.I)}
-                    )
-                
-                if not review_elements:
-                    # If no reviews found, break
+                if not result.element_count:
                     break
                 
-                for element in review_elements:
-                    if len(reviews) >= max_reviews:
-                        break
-                    
-                    # Extract review text
-                    text_elem = element.find(
-                        ['p', 'div'],
-                        class_=re.compile(r'text|content|review-text|body', re.I)
-                    )
-                    if not text_elem:
-                        text_elem = element.find('p')
-                    
-                    review_text = text_elem.get_text(strip=True) if text_elem else ""
-                    
-                    if not review_text or len(review_text) < 20:  # Skip very short reviews
-                        continue
-                    
-                    # Extract rating
-                    rating_elem = element.find(
-                        ['span', 'div'],
-                        class_=re.compile(r'rating|star', re.I)
-                    )
-                    rating = None
-                    if rating_elem:
-                        rating_text = rating_elem.get_text(strip=True)
-                        rating_match = re.search(r'(\d+)', rating_text)
-                        if rating_match:
-                            rating = int(rating_match.group(1))
-                    
-                    # Extract date
-                    date_elem = element.find(
-                        ['time', 'span', 'div'],
-                        class_=re.compile(r'date|time', re.I)
-                    )
-                    date = None
-                    if date_elem:
-                        date = date_elem.get_text(strip=True)
-                    
-                    # Only include 1-2 star reviews
-                    if rating and rating <= 2:
-                        reviews.append({
-                            "text": review_text,
-                            "rating": rating,
-                            "date": date,
-                            "source": "G2"
-                        })
+                for review in result.reviews:
+                    if seen.add(review["text"]):
+                        count += 1
+                        yield review
+                empty_streak = 0 if result.reviews else empty_streak + 1
                 
-                # Check if there are more pages
-                next_page = soup.find('a', {'aria-label': re.compile(r'next|page', re.I)})
-                if not next_page or page >= 10:  # Limit to 10 pages
+                # Stop on the last page, or once complaints have dried up
+                if not result.has_next or page >= MAX_PAGES or empty_streak >= MAX_EMPTY_PAGES:
                     break
                 
-                page += 1
+                # Follow the site's next link, unless it does not move forward
+                next_page = page_number(result.next_url)
+                if next_page is not None and next_page <= page:
+                    break
+                next_url = result.next_url
+                page = next_page or page + 1
                 
             except Exception as e:
                 logger.error(
@@ -128,5 +83,13 @@ class G2ScraperAsync(BaseAsyncScraper):
                     error=str(e)
                 )
                 break
-        
-        return reviews[:max_reviews]
+    
+    async def scrape_reviews(
+        self,
+        tool_name: str,
+        tool_slug: str = None,
+        tool_id: str = None,
+        max_reviews: int = 30
+    ) -> List[Dict[str, Any]]:
+        """Scrape 1-2 star reviews from G2.com into a list (async)"""
+        return [review async for review in self.iter_reviews(tool_name, tool_slug, tool_id, max_reviews)]
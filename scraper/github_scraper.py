@@ -1,13 +1,92 @@
 """GitHub Issues scraper for product complaints and feature requests"""
 
 import re
+import time
 from typing import List, Dict, Any, Optional
-import requests
 from datetime import datetime
+from scraper.base import RESPONSE_CHUNK_SIZE, make_api_session, read_capped
+from scraper.dedupe import SeenTexts
 from utils.logging import get_logger
+from utils.serialization import loads_json
 
 logger = get_logger(__name__)
 
+# Severity indicators (substring, case-insensitive)
+_RE_BUG = re.compile(r'bug', re.IGNORECASE)
+_RE_CRITICAL = re.compile(r'critical|urgent|blocker|broken', re.IGNORECASE)
+
+API_BASE_URL = "https://api.github.com"
+API_HEADERS = {
+    'Accept': 'application/vnd.github.v3+json',
+    'User-Agent': 'B2B-Complaint-Analyzer'
+}
+
+# Issue search: any of these labels, open or closed, newest first
+ISSUE_LABELS = ('bug', 'enhancement', 'feature-request')  # Focus on complaints/requests
+SEARCH_PARAMS = {
+    'sort': 'created',
+    'order': 'desc'
+}
+PER_PAGE = 100  # Search API maximum
+
+
+def search_query(repo_owner: str, repo_name: str) -> str:
+    """Search API query for a repository's labelled issues (pull requests excluded)"""
+    return f"repo:{repo_owner}/{repo_name} is:issue label:{','.join(ISSUE_LABELS)}"
+
+
+def parse_issue(
+    issue: Dict[str, Any],
+    tool_name: str,
+    repo_owner: str,
+    repo_name: str
+) -> Optional[Dict[str, Any]]:
+    """
+    Convert one GitHub API issue into a complaint record
+    
+    Args:
+        issue: Issue object from the GitHub search API
+        tool_name: Name of the tool
+        repo_owner: GitHub repository owner
+        repo_name: GitHub repository name
+        
+    Returns:
+        Complaint dictionary, or None for short issues
+    """
+    title = issue.get('title', '')
+    body = issue.get('body', '') or ''
+    
+    # Reject short issues before building anything (stripping only shortens)
+    if len(title) + len(body) + 2 < 30:
+        return None
+    
+    # Combine title and body
+    full_text = f"{title}\n\n{body}".strip()
+    
+    # Filter short issues
+    if len(full_text) < 30:
+        return None
+    
+    # Determine severity/rating based on labels and content
+    labels = [label.get('name', '') for label in issue.get('labels', [])]
+    label_set = frozenset(name.lower() for name in labels)  # Case-insensitive lookups
+    is_bug = 'bug' in label_set or _RE_BUG.search(full_text) is not None
+    rating = 1 if is_bug and _RE_CRITICAL.search(full_text) else 2
+    
+    return {
+        'text': full_text,
+        'rating': rating,
+        'date': issue.get('created_at', ''),
+        'source': f'GitHub ({repo_owner}/{repo_name})',
+        'tool': tool_name,
+        'metadata': {
+            'state': issue.get('state', ''),
+            'labels': labels,
+            'comments': issue.get('comments', 0),
+            'url': issue.get('html_url', '')
+        }
+    }
+
 
 class GitHubScraper:
     """Scraper for GitHub issues (complaints, bugs, feature requests)"""
@@ -19,14 +98,14 @@ class GitHubScraper:
         Args:
             github_token: Optional GitHub personal access token for higher rate limits
         """
-        self.base_url = "https://api.github.com"
-        self.headers = {
-            'Accept': 'application/vnd.github.v3+json',
-            'User-Agent': 'B2B-Complaint-Analyzer'
-        }
+        self.base_url = API_BASE_URL
+        self.headers = dict(API_HEADERS)
         if github_token:
             self.headers['Authorization'] = f'token {github_token}'
         
+        # One keep-alive session per scraper: every request hits the same API host
+        self.session = make_api_session(self.headers)
+        
         logger.info("GitHub scraper initialized")
     
     def scrape_issues(
@@ -53,83 +132,44 @@ class GitHubScraper:
             return []
         
         issues = []
+        seen = SeenTexts()
         page = 1
-        per_page = 30
+        url = f"{self.base_url}/search/issues"
+        query = search_query(repo_owner, repo_name)
         
         try:
             while len(issues) < max_issues:
-                url = f"{self.base_url}/repos/{repo_owner}/{repo_name}/issues"
-                params = {
-                    'state': 'all',  # Both open and closed
-                    'sort': 'created',
-                    'direction': 'desc',
-                    'per_page': per_page,
-                    'page': page,
-                    'labels': 'bug,enhancement,feature-request'  # Focus on complaints/requests
-                }
-                
-                response = requests.get(
-                    url,
-                    headers=self.headers,
-                    params=params,
-                    timeout=15
-                )
-                
-                if response.status_code != 200:
-                    logger.warning("GitHub API request failed", status=response.status_code)
-                    break
+                params = {**SEARCH_PARAMS, 'q': query, 'per_page': PER_PAGE, 'page': page}
                 
-                data = response.json()
+                # Stream the body straight into the JSON parser, within the size cap
+                with self.session.get(url, params=params, timeout=15, stream=True) as response:
+                    if response.status_code != 200:
+                        logger.warning("GitHub API request failed", status=response.status_code)
+                        break
+                    
+                    body = read_capped(
+                        response.iter_content(RESPONSE_CHUNK_SIZE),
+                        response.headers.get('Content-Length'),
+                        response.url
+                    )
                 
-                if not data:
-                    break
+                data = loads_json(body).get('items', [])
                 
                 for issue in data:
                     if len(issues) >= max_issues:
                         break
                     
-                    # Skip pull requests
-                    if 'pull_request' in issue:
-                        continue
-                    
-                    title = issue.get('title', '')
-                    body = issue.get('body', '') or ''
-                    state = issue.get('state', '')
-                    labels = [label.get('name', '') for label in issue.get('labels', [])]
-                    created_at = issue.get('created_at', '')
-                    comments_count = issue.get('comments', 0)
-                    
-                    # Combine title and body
-                    full_text = f"{title}\n\n{body}".strip()
-                    
-                    # Filter short issues
-                    if len(full_text) < 30:
-                        continue
-                    
-                    # Determine severity/rating based on labels and content
-                    is_bug = 'bug' in labels or 'bug' in full_text.lower()
-                    is_critical = any(word in full_text.lower() for word in ['critical', 'urgent', 'blocker', 'broken'])
-                    
-                    rating = 1 if (is_bug and is_critical) else 2
-                    
-                    issues.append({
-                        'text': full_text,
-                        'rating': rating,
-                        'date': created_at,
-                        'source': f'GitHub ({repo_owner}/{repo_name})',
-                        'tool': tool_name,
-                        'metadata': {
-                            'state': state,
-                            'labels': labels,
-                            'comments': comments_count,
-                            'url': issue.get('html_url', '')
-                        }
-                    })
+                    record = parse_issue(issue, tool_name, repo_owner, repo_name)
+                    if record and seen.add(record['text']):
+                        issues.append(record)
+                
+                # A short page is the last one
+                if len(data) < PER_PAGE:
+                    break
                 
                 page += 1
                 
                 # Rate limiting
-                import time
                 time.sleep(1)
             
             logger.info("GitHub scraping complete", 
@@ -0,0 +1,105 @@
+"""Async GitHub Issues scraper"""
+
+import asyncio
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from .api_async import BaseAsyncAPIScraper
+from .dedupe import SeenTexts
+from .github_scraper import API_BASE_URL, API_HEADERS, PER_PAGE, SEARCH_PARAMS, parse_issue, search_query
+from .review_html import page_number
+from utils.logging import get_logger
+from utils.serialization import loads_json
+
+logger = get_logger(__name__)
+
+
+def last_page(response: httpx.Response) -> int:
+    """Last page number from the Link header (1 when there is no next page)"""
+    return page_number(response.links.get("last", {}).get("url")) or 1
+
+
+class GitHubScraperAsync(BaseAsyncAPIScraper):
+    """Async scraper for GitHub issues (complaints, bugs, feature requests)"""
+    
+    def __init__(self, github_token: Optional[str] = None, **kwargs):
+        """
+        Initialize async GitHub scraper
+        
+        Args:
+            github_token: Optional GitHub personal access token for higher rate limits
+            **kwargs: Passed to BaseAsyncAPIScraper
+        """
+        headers = dict(API_HEADERS)
+        if github_token:
+            headers['Authorization'] = f'token {github_token}'
+        super().__init__(API_BASE_URL, headers, **kwargs)
+        
+        logger.info("Async GitHub scraper initialized")
+    
+    async def scrape_issues(
+        self,
+        tool_name: str,
+        repo_owner: Optional[str] = None,
+        repo_name: Optional[str] = None,
+        max_issues: int = 50
+    ) -> List[Dict[str, Any]]:
+        """
+        Scrape GitHub issues for complaints and feature requests (async)
+        
+        The first page's Link header gives the page count; the pages still
+        needed are then fetched concurrently.
+        
+        Args:
+            tool_name: Name of the tool
+            repo_owner: GitHub repository owner
+            repo_name: GitHub repository name
+            max_issues: Maximum number of issues to collect
+        
+        Returns:
+            List of issue dictionaries
+        """
+        if not repo_owner or not repo_name:
+            logger.warning("No GitHub repo specified", tool_name=tool_name)
+            return []
+        
+        url = f"{self.base_url}/search/issues"
+        query = search_query(repo_owner, repo_name)
+        issues: List[Dict[str, Any]] = []
+        seen = SeenTexts()
+        
+        def _collect(response: httpx.Response) -> None:
+            for issue in loads_json(response.content).get('items', []):
+                if len(issues) >= max_issues:
+                    return
+                record = parse_issue(issue, tool_name, repo_owner, repo_name)
+                if record and seen.add(record['text']):
+                    issues.append(record)
+        
+        try:
+            first = await self._get(url, {**SEARCH_PARAMS, 'q': query, 'per_page': PER_PAGE, 'page': 1})
+            _collect(first)
+            total_pages = last_page(first)
+            
+            page = 2
+            while len(issues) < max_issues and page <= total_pages:
+                # Enough pages to fill the rest if every issue on them qualifies
+                needed = -(-(max_issues - len(issues)) // PER_PAGE)
+                batch = range(page, min(total_pages, page + needed - 1) + 1)
+                responses = await asyncio.gather(*(
+                    self._get(url, {**SEARCH_PARAMS, 'q': query, 'per_page': PER_PAGE, 'page': p})
+                    for p in batch
+                ))
+                for response in responses:
+                    _collect(response)
+                page = batch.stop
+            
+            logger.info("GitHub scraping complete",
+                       tool_name=tool_name,
+                       issues_found=len(issues))
+        
+        except Exception as e:
+            logger.error("Error scraping GitHub", error=str(e), tool_name=tool_name)
+        
+        return issues
@@ -1,18 +1,86 @@
 """Google News scraper via SerpAPI for B2B product complaints"""
 
-from typing import List, Dict, Any, Optional
+import logging
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
+
+import httpx
+
+from scraper.dedupe import SeenTexts
 from utils.logging import get_logger
+from utils.serialization import loads_json
 
 logger = get_logger(__name__)
 
-# Try to import serpapi
-try:
-    from serpapi import GoogleSearch
-    SERPAPI_AVAILABLE = True
-except ImportError:
-    SERPAPI_AVAILABLE = False
-    logger.warning("serpapi not available. Install with: pip install google-search-results")
+SERPAPI_URL = "https://serpapi.com/search.json"
+SERPAPI_TIMEOUT = 30.0
+
+# httpx logs every request URL at INFO, and SerpAPI URLs carry the API key
+logging.getLogger("httpx").setLevel(logging.WARNING)
+
+# Complaint indicators (substring, case-insensitive), one alternation each
+_RE_NEGATIVE = re.compile(
+    r'problem|issue|bug|broken|disappointed|frustrated|terrible|awful|worst|hate|'
+    r'switching|alternative|complaint',
+    re.IGNORECASE
+)
+_RE_VERY_NEGATIVE = re.compile(r'terrible|awful|worst|hate', re.IGNORECASE)
+
+# SerpAPI calls in flight across all scrapers in the process (plan concurrency limit)
+SERPAPI_MAX_CONCURRENCY = 4
+_serpapi_slots = threading.BoundedSemaphore(SERPAPI_MAX_CONCURRENCY)
+
+# Process-wide keep-alive client, so queries after the first skip the TLS handshake
+_client: Optional[httpx.Client] = None
+_client_lock = threading.Lock()
+
+
+def get_serpapi_client() -> httpx.Client:
+    """Get the shared SerpAPI client, creating it on first use"""
+    global _client
+    with _client_lock:
+        if _client is None or _client.is_closed:
+            _client = httpx.Client(
+                timeout=SERPAPI_TIMEOUT,
+                limits=httpx.Limits(
+                    max_connections=SERPAPI_MAX_CONCURRENCY,
+                    max_keepalive_connections=SERPAPI_MAX_CONCURRENCY
+                )
+            )
+        return _client
+
+
+@lru_cache(maxsize=256)
+def search_queries(tool_name: str) -> Tuple[str, ...]:
+    """SerpAPI news queries that tend to surface complaints about a tool (memoized per tool)"""
+    return (
+        f"{tool_name} problems",
+        f"{tool_name} issues",
+        f"{tool_name} complaints",
+        f"{tool_name} alternatives",
+    )
+
+
+# SerpAPI key once found; a missing key is looked up again on the next scraper
+_api_key: Optional[str] = None
+
+
+def _load_api_key() -> Optional[str]:
+    """SerpAPI key from Streamlit secrets or SERPAPI_API_KEY (cached once found)"""
+    global _api_key
+    if _api_key is None:
+        try:
+            import streamlit as st
+            api_key = st.secrets.get("serpapi", {}).get("api_key")
+        except Exception:
+            api_key = None
+        _api_key = api_key or os.getenv("SERPAPI_API_KEY") or None
+    return _api_key
 
 
 class GoogleNewsScraper:
@@ -20,18 +88,9 @@ class GoogleNewsScraper:
     
     def __init__(self):
         """Initialize Google News scraper"""
-        self.api_key = None
+        self.api_key = _load_api_key()
         
-        # Try to get API key from Streamlit secrets or environment
-        try:
-            import streamlit as st
-            serpapi_config = st.secrets.get("serpapi", {})
-            self.api_key = serpapi_config.get("api_key") or None
-        except:
-            import os
-            self.api_key = os.getenv("SERPAPI_API_KEY")
-        
-        if not self.api_key and SERPAPI_AVAILABLE:
+        if not self.api_key:
             logger.warning("SerpAPI key not found. Add to Streamlit secrets or set SERPAPI_API_KEY env var")
         
         logger.info("Google News scraper initialized", has_api_key=bool(self.api_key))
@@ -60,84 +119,112 @@ class GoogleNewsScraper:
             serpapi:
               api_key: your_api_key
         """
-        if not SERPAPI_AVAILABLE or not self.api_key:
-            logger.warning("SerpAPI not available or API key missing")
+        if not self.api_key:
+            logger.warning("SerpAPI API key missing")
             return []
         
-        complaints = []
+        # Queries run concurrently; results are merged in query order
+        queries = search_queries(tool_name)
+        with ThreadPoolExecutor(max_workers=len(queries)) as executor:
+            results = list(executor.map(
+                lambda query: self._run_query(query, tool_name, date_from, date_to),
+                queries
+            ))
+        
+        # The same article often matches several queries
+        seen = SeenTexts()
+        complaints = [
+            complaint
+            for query_complaints in results
+            for complaint in query_complaints
+            if seen.add(complaint['text'])
+        ]
+        del complaints[max_articles:]
+        
+        logger.info("Google News scraping complete", tool_name=tool_name, articles_found=len(complaints))
+        return complaints
+    
+    def _run_query(
+        self,
+        query: str,
+        tool_name: str,
+        date_from: Optional[str],
+        date_to: Optional[str]
+    ) -> List[Dict[str, Any]]:
+        """
+        Run one SerpAPI news search and keep the complaint-like articles
+        
+        Args:
+            query: Search query
+            tool_name: Name of the tool/product
+            date_from: Filter articles from this date (ISO format)
+            date_to: Filter articles up to this date (ISO format)
+            
+        Returns:
+            Complaint dictionaries (empty if the search failed)
+        """
+        params = {
+            "engine": "google",
+            "q": query,
+            "tbm": "nws",  # News search
+            "api_key": self.api_key,
+            "num": 20  # Results per page
+        }
+        
+        # Add date filters if provided
+        if date_from:
+            params["tbs"] = f"cdr:1,cd_min:{date_from},cd_max:{date_to or datetime.now().strftime('%Y-%m-%d')}"
         
+        # The API key rides in the query string, so never log the request URL or
+        # a stringified httpx exception (both embed it)
         try:
-            # Search queries for complaints
-            search_queries = [
-                f"{tool_name} problems",
-                f"{tool_name} issues",
-                f"{tool_name} complaints",
-                f"{tool_name} alternatives",
-            ]
+            with _serpapi_slots:
+                response = get_serpapi_client().get(SERPAPI_URL, params=params)
+        except Exception as e:
+            logger.error("Error scraping Google News", error_type=type(e).__name__, query=query)
+            return []
+        
+        if response.status_code != 200:
+            logger.error("Google News request failed", status_code=response.status_code, query=query)
+            return []
+        
+        try:
+            results = loads_json(response.content)
+        except ValueError as e:
+            logger.error("Invalid Google News response", error=str(e), query=query)
+            return []
+        
+        complaints = []
+        for article in results.get("news_results", []):
+            title = article.get("title", "")
+            snippet = article.get("snippet", "")
+            
+            # Reject short articles before building anything (stripping only shortens)
+            if len(title) + len(snippet) + 2 < 50:
+                continue
             
-            for query in search_queries:
-                if len(complaints) >= max_articles:
-                    break
-                
-                params = {
-                    "q": query,
-                    "tbm": "nws",  # News search
-                    "api_key": self.api_key,
-                    "num": 20  # Results per page
+            # Combine title and snippet
+            full_text = f"{title}\n\n{snippet}".strip()
+            
+            if len(full_text) < 50:
+                continue
+            
+            # Check for complaint indicators
+            if not _RE_NEGATIVE.search(full_text):
+                continue
+            
+            rating = 1 if _RE_VERY_NEGATIVE.search(full_text) else 2
+            
+            complaints.append({
+                'text': full_text,
+                'rating': rating,
+                'date': article.get("date", "") or datetime.now().isoformat(),
+                'source': 'Google News',
+                'tool': tool_name,
+                'metadata': {
+                    'link': article.get("link", ""),
+                    'query': query
                 }
-                
-                # Add date filters if provided
-                if date_from:
-                    params["tbs"] = f"cdr:1,cd_min:{date_from},cd_max:{date_to or datetime.now().strftime('%Y-%m-%d')}"
-                
-                search = GoogleSearch(params)
-                results = search.get_dict()
-                
-                news_results = results.get("news_results", [])
-                
-                for article in news_results:
-                    if len(complaints) >= max_articles:
-                        break
-                    
-                    title = article.get("title", "")
-                    snippet = article.get("snippet", "")
-                    link = article.get("link", "")
-                    date = article.get("date", "")
-                    
-                    # Combine title and snippet
-                    full_text = f"{title}\n\n{snippet}".strip()
-                    
-                    if len(full_text) < 50:
-                        continue
-                    
-                    # Check for complaint indicators
-                    negative_words = ['problem', 'issue', 'bug', 'broken', 'disappointed',
-                                    'frustrated', 'terrible', 'awful', 'worst', 'hate',
-                                    'switching', 'alternative', 'complaint']
-                    
-                    if not any(word in full_text.lower() for word in negative_words):
-                        continue
-                    
-                    rating = 1 if any(word in full_text.lower() for word in ['terrible', 'awful', 'worst', 'hate']) else 2
-                    
-                    complaints.append({
-                        'text': full_text,
-                        'rating': rating,
-                        'date': date or datetime.now().isoformat(),
-                        'source': 'Google News',
-                        'tool': tool_name,
-                        'metadata': {
-                            'link': link,
-                            'query': query
-                        }
-                    })
-                
-                # Rate limiting (SerpAPI has rate limits)
-                import time
-                time.sleep(1)
-                
-        except Exception as e:
-            logger.error("Error scraping Google News", error=str(e))
+            })
         
-        logger.info("Google News scraping complete", tool_name=tool_name, articles_found=len(complaints))
         return complaints
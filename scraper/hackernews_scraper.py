@@ -1,23 +1,109 @@
 """Hacker News scraper for product discussions and complaints"""
 
+import html
 import re
-from typing import List, Dict, Any, Optional
-import requests
+import time
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
+from scraper.base import RESPONSE_CHUNK_SIZE, make_api_session, read_capped
+from scraper.dedupe import SeenTexts
 from utils.logging import get_logger
+from utils.serialization import loads_json
 
 logger = get_logger(__name__)
 
+# Negative-sentiment indicators (substring, case-insensitive), one alternation each
+_RE_NEGATIVE = re.compile(
+    r'problem|issue|disappointed|frustrat|terrible|awful|switching|alternative|'
+    r'better than|worse|lacking',
+    re.IGNORECASE
+)
+_RE_VERY_NEGATIVE = re.compile(r'terrible|awful|worst|hate', re.IGNORECASE)
+# HN comment markup: paragraph breaks become newlines, inline tags are dropped
+_RE_BREAK_TAG = re.compile(r'<(?:p|br|/?pre)\b[^>]*>', re.IGNORECASE)
+_RE_TAG = re.compile(r'<[^>]+>')
+
+API_BASE_URL = "https://hn.algolia.com/api/v1"
+API_HEADERS = {
+    'User-Agent': 'B2B-Complaint-Analyzer'
+}
+
+# Fixed part of each Algolia search
+SEARCH_PARAMS = {
+    'tags': 'comment',  # Focus on comments
+    'hitsPerPage': 20
+}
+
+
+@lru_cache(maxsize=256)
+def search_queries(tool_name: str) -> Tuple[str, ...]:
+    """Algolia search queries that tend to surface complaints about a tool (memoized per tool)"""
+    return (
+        f"{tool_name} alternative",
+        f"{tool_name} vs",
+        f"{tool_name} problem",
+        f"{tool_name} issue",
+        f"switching from {tool_name}",
+    )
+
+
+def parse_hit(hit: Dict[str, Any], tool_name: str) -> Optional[Dict[str, Any]]:
+    """
+    Convert one Algolia comment hit into a discussion record
+    
+    Args:
+        hit: Hit object from the HN search API
+        tool_name: Name of the tool/product
+        
+    Returns:
+        Discussion dictionary, or None for short or non-negative comments
+    """
+    comment_text = hit.get('comment_text', '')
+    
+    # Markup only adds characters, so a short raw comment is short as text too
+    if not comment_text or len(comment_text) < 50:
+        return None
+    
+    # Remove HTML tags (Algolia returns HN's small tag allow-list: <p>, <a>, <i>, <pre>)
+    clean_text = html.unescape(_RE_TAG.sub('', _RE_BREAK_TAG.sub('\n', comment_text))).strip()
+    
+    # Filter short comments
+    if len(clean_text) < 50:
+        return None
+    
+    # Check for negative sentiment
+    if not _RE_NEGATIVE.search(clean_text):
+        return None
+    
+    # Estimate rating
+    rating = 1 if _RE_VERY_NEGATIVE.search(clean_text) else 2
+    
+    return {
+        'text': clean_text,
+        'rating': rating,
+        'date': hit.get('created_at', ''),
+        'source': 'Hacker News',
+        'tool': tool_name,
+        'metadata': {
+            'points': hit.get('points', 0),
+            'story_title': hit.get('story_title', ''),
+            'url': hit.get('story_url', '')
+        }
+    }
+
 
 class HackerNewsScraper:
     """Scraper for Hacker News product discussions"""
     
     def __init__(self):
         """Initialize Hacker News scraper"""
-        self.base_url = "https://hn.algolia.com/api/v1"
-        self.headers = {
-            'User-Agent': 'B2B-Complaint-Analyzer'
-        }
+        self.base_url = API_BASE_URL
+        self.headers = dict(API_HEADERS)
+        
+        # One keep-alive session per scraper: every request hits the same API host
+        self.session = make_api_session(self.headers)
+        
         logger.info("Hacker News scraper initialized")
     
     def scrape_discussions(
@@ -36,90 +122,41 @@ class HackerNewsScraper:
             List of discussion dictionaries
         """
         discussions = []
+        seen = SeenTexts()  # A comment can match several queries
         
-        # Search queries
-        search_queries = [
-            f"{tool_name} alternative",
-            f"{tool_name} vs",
-            f"{tool_name} problem",
-            f"{tool_name} issue",
-            f"switching from {tool_name}",
-        ]
-        
-        for query in search_queries:
+        for query in search_queries(tool_name):
             if len(discussions) >= max_items:
                 break
             
             try:
                 # Search using Algolia HN API
                 search_url = f"{self.base_url}/search"
-                params = {
-                    'query': query,
-                    'tags': 'comment',  # Focus on comments
-                    'hitsPerPage': 20
-                }
-                
-                response = requests.get(
-                    search_url,
-                    headers=self.headers,
-                    params=params,
-                    timeout=10
-                )
+                params = {**SEARCH_PARAMS, 'query': query}
                 
-                if response.status_code != 200:
-                    logger.warning("HN API request failed", status=response.status_code)
-                    continue
+                # Stream the body straight into the JSON parser, within the size cap
+                with self.session.get(search_url, params=params, timeout=10, stream=True) as response:
+                    if response.status_code != 200:
+                        logger.warning("HN API request failed", status=response.status_code)
+                        continue
+                    
+                    body = read_capped(
+                        response.iter_content(RESPONSE_CHUNK_SIZE),
+                        response.headers.get('Content-Length'),
+                        response.url
+                    )
                 
-                data = response.json()
+                data = loads_json(body)
                 hits = data.get('hits', [])
                 
                 for hit in hits:
                     if len(discussions) >= max_items:
                         break
                     
-                    comment_text = hit.get('comment_text', '')
-                    if not comment_text:
-                        continue
-                    
-                    # Remove HTML tags
-                    from bs4 import BeautifulSoup
-                    clean_text = BeautifulSoup(comment_text, 'html.parser').get_text()
-                    
-                    # Filter short comments
-                    if len(clean_text) < 50:
-                        continue
-                    
-                    # Check for negative sentiment
-                    negative_words = ['problem', 'issue', 'disappointed', 'frustrat', 
-                                    'terrible', 'awful', 'switching', 'alternative', 
-                                    'better than', 'worse', 'lacking']
-                    
-                    if not any(word in clean_text.lower() for word in negative_words):
-                        continue
-                    
-                    created_at = hit.get('created_at', '')
-                    points = hit.get('points', 0)
-                    story_title = hit.get('story_title', '')
-                    
-                    # Estimate rating
-                    very_negative = ['terrible', 'awful', 'worst', 'hate']
-                    rating = 1 if any(word in clean_text.lower() for word in very_negative) else 2
-                    
-                    discussions.append({
-                        'text': clean_text,
-                        'rating': rating,
-                        'date': created_at,
-                        'source': 'Hacker News',
-                        'tool': tool_name,
-                        'metadata': {
-                            'points': points,
-                            'story_title': story_title,
-                            'url': hit.get('story_url', '')
-                        }
-                    })
+                    record = parse_hit(hit, tool_name)
+                    if record and seen.add(record['text']):
+                        discussions.append(record)
                 
                 # Rate limiting
-                import time
                 time.sleep(1)
                 
             except Exception as e:
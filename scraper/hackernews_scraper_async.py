@@ -0,0 +1,73 @@
+"""Async Hacker News scraper"""
+
+import asyncio
+from typing import Any, Dict, List
+
+from .api_async import BaseAsyncAPIScraper
+from .dedupe import SeenTexts
+from .hackernews_scraper import API_BASE_URL, API_HEADERS, SEARCH_PARAMS, parse_hit, search_queries
+from utils.logging import get_logger
+from utils.serialization import loads_json
+
+logger = get_logger(__name__)
+
+
+class HackerNewsScraperAsync(BaseAsyncAPIScraper):
+    """Async scraper for Hacker News product discussions"""
+    
+    def __init__(self, **kwargs):
+        """
+        Initialize async Hacker News scraper
+        
+        Args:
+            **kwargs: Passed to BaseAsyncAPIScraper
+        """
+        super().__init__(API_BASE_URL, API_HEADERS, **kwargs)
+        
+        logger.info("Async Hacker News scraper initialized")
+    
+    async def _search(self, query: str) -> List[Dict[str, Any]]:
+        """Hits for one Algolia search query"""
+        response = await self._get(f"{self.base_url}/search", {**SEARCH_PARAMS, 'query': query})
+        return loads_json(response.content).get('hits', [])
+    
+    async def scrape_discussions(
+        self,
+        tool_name: str,
+        max_items: int = 50
+    ) -> List[Dict[str, Any]]:
+        """
+        Scrape Hacker News for product discussions (async)
+        
+        All search queries are issued concurrently; hits are kept in query
+        order, as in the sequential scraper.
+        
+        Args:
+            tool_name: Name of the tool/product
+            max_items: Maximum number of items to collect
+        
+        Returns:
+            List of discussion dictionaries
+        """
+        queries = search_queries(tool_name)
+        results = await asyncio.gather(*(self._search(q) for q in queries), return_exceptions=True)
+        
+        discussions: List[Dict[str, Any]] = []
+        seen = SeenTexts()  # A comment can match several queries
+        for query, hits in zip(queries, results):
+            if isinstance(hits, BaseException):
+                logger.error("Error scraping Hacker News", error=str(hits), query=query)
+                continue
+            
+            for hit in hits:
+                if len(discussions) >= max_items:
+                    break
+                record = parse_hit(hit, tool_name)
+                if record and seen.add(record['text']):
+                    discussions.append(record)
+        
+        logger.info("Hacker News scraping complete",
+                   tool_name=tool_name,
+                   discussions_found=len(discussions))
+        
+        return discussions
@@ -1,13 +1,30 @@
 """LinkedIn scraper for B2B groups and discussions"""
 
-from typing import List, Dict, Any, Optional
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
+from utils.compliance import reserve_token, url_netloc
 from utils.logging import get_logger
-import requests
 from bs4 import BeautifulSoup
+from scraper.base import make_api_session
+import config
 
 logger = get_logger(__name__)
 
+# Complaint indicators (substring, case-insensitive)
+_RE_NEGATIVE = re.compile(
+    r'problem|issue|bug|broken|disappointed|frustrated|terrible|awful|worst|hate|'
+    r'switching|alternative',
+    re.IGNORECASE
+)
+_RE_VERY_NEGATIVE = re.compile(r'terrible|awful|worst|hate', re.IGNORECASE)
+
+# Search requests in flight at once (also the token bucket's burst)
+LINKEDIN_CONCURRENCY = 2
+
 
 class LinkedInScraper:
     """Scraper for LinkedIn B2B groups and discussions"""
@@ -18,8 +35,28 @@ class LinkedInScraper:
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
         }
+        
+        # One keep-alive session per scraper: every query hits linkedin.com
+        self.session = make_api_session(
+            self.headers, pool_maxsize=16, status_forcelist=(429, 500, 502, 503, 504)
+        )
+        self._bucket: Dict[str, Tuple[float, float]] = {}  # domain -> (tokens, last_ts)
+        self._bucket_lock = threading.Lock()  # Queries share the bucket across threads
+        
         logger.info("LinkedIn scraper initialized")
     
+    def __enter__(self):
+        """Context manager entry"""
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit - close the session"""
+        self.close()
+    
+    def close(self) -> None:
+        """Close pooled connections"""
+        self.session.close()
+    
     def scrape_b2b_complaints(
         self,
         tool_name: str,
@@ -43,8 +80,6 @@ class LinkedInScraper:
             LinkedIn requires authentication for most content. This is a basic implementation
             that searches public posts. For production, use LinkedIn API with OAuth.
         """
-        complaints = []
-        
         # Search for B2B groups related to the tool
         # Example: "Salesforce admins complaints" or "HubSpot users"
         search_queries = [
@@ -54,97 +89,125 @@ class LinkedInScraper:
             f"switching from {tool_name}",
         ]
         
-        for query in search_queries:
-            if len(complaints) >= max_posts:
-                break
+        # Queries overlap (LINKEDIN_CONCURRENCY at a time); results merge in query order
+        with ThreadPoolExecutor(max_workers=LINKEDIN_CONCURRENCY) as executor:
+            results = list(executor.map(
+                lambda query: self._search(query, tool_name, max_posts, date_from, date_to),
+                search_queries
+            ))
+        
+        complaints = [complaint for query_complaints in results for complaint in query_complaints]
+        del complaints[max_posts:]
+        
+        logger.info("LinkedIn scraping complete", tool_name=tool_name, complaints_found=len(complaints))
+        return complaints
+    
+    def _search(
+        self,
+        query: str,
+        tool_name: str,
+        max_posts: int,
+        date_from: Optional[str],
+        date_to: Optional[str]
+    ) -> List[Dict[str, Any]]:
+        """
+        Run one LinkedIn content search and keep the complaint-like posts
+        
+        Args:
+            query: Search keywords
+            tool_name: Name of the tool/product
+            max_posts: Maximum number of posts to collect
+            date_from: Filter posts from this date (ISO format)
+            date_to: Filter posts up to this date (ISO format)
             
-            try:
-                # LinkedIn search URL (public posts)
-                # Note: LinkedIn heavily restricts scraping. For production, use LinkedIn API
-                search_url = f"{self.base_url}/search/results/content/"
-                params = {
-                    'keywords': query,
-                    'origin': 'GLOBAL_SEARCH_HEADER'
-                }
-                
-                response = requests.get(
-                    search_url,
-                    headers=self.headers,
-                    params=params,
-                    timeout=10
+        Returns:
+            Complaint dictionaries (empty if the search failed)
+        """
+        complaints = []
+        
+        try:
+            # LinkedIn search URL (public posts)
+            # Note: LinkedIn heavily restricts scraping. For production, use LinkedIn API
+            search_url = f"{self.base_url}/search/results/content/"
+            params = {
+                'keywords': query,
+                'origin': 'GLOBAL_SEARCH_HEADER'
+            }
+            
+            # Throttle: at most LINKEDIN_CONCURRENCY at once, then 1 req/sec
+            with self._bucket_lock:
+                wait = reserve_token(
+                    self._bucket,
+                    url_netloc(search_url),
+                    config.settings.scrape_rate_per_domain,
+                    LINKEDIN_CONCURRENCY
                 )
+            if wait:
+                time.sleep(wait)
+            
+            response = self.session.get(search_url, params=params, timeout=10)
+            
+            if response.status_code != 200:
+                logger.warning("LinkedIn request failed", status=response.status_code, query=query)
+                return complaints
+            
+            # Parse HTML (LinkedIn uses dynamic content, so this is limited)
+            soup = BeautifulSoup(response.content, 'lxml')
+            
+            # Find post elements (LinkedIn structure may vary)
+            post_elements = soup.find_all('div', class_='feed-shared-update-v2')
+            
+            for post_elem in post_elements:
+                if len(complaints) >= max_posts:
+                    break
+                
+                # Extract post text
+                text_elem = post_elem.find('span', class_='feed-shared-text')
+                if not text_elem:
+                    continue
+                
+                post_text = text_elem.get_text(strip=True)
                 
-                if response.status_code != 200:
-                    logger.warning("LinkedIn request failed", status=response.status_code, query=query)
+                if len(post_text) < 50:
                     continue
                 
-                # Parse HTML (LinkedIn uses dynamic content, so this is limited)
-                soup = BeautifulSoup(response.content, 'html.parser')
+                # Check for complaint indicators
+                if not _RE_NEGATIVE.search(post_text):
+                    continue
                 
-                # Find post elements (LinkedIn structure may vary)
-                post_elements = soup.find_all('div', class_='feed-shared-update-v2')
+                # Extract date if available
+                date_elem = post_elem.find('time')
+                date = date_elem.get('datetime', '') if date_elem else datetime.now().isoformat()
                 
-                for post_elem in post_elements:
-                    if len(complaints) >= max_posts:
-                        break
-                    
-                    # Extract post text
-                    text_elem = post_elem.find('span', class_='feed-shared-text')
-                    if not text_elem:
-                        continue
-                    
-                    post_text = text_elem.get_text(strip=True)
-                    
-                    if len(post_text) < 50:
-                        continue
-                    
-                    # Check for complaint indicators
-                    negative_words = ['problem', 'issue', 'bug', 'broken', 'disappointed',
-                                    'frustrated', 'terrible', 'awful', 'worst', 'hate',
-                                    'switching', 'alternative']
-                    
-                    if not any(word in post_text.lower() for word in negative_words):
-                        continue
-                    
-                    # Extract date if available
-                    date_elem = post_elem.find('time')
-                    date = date_elem.get('datetime', '') if date_elem else datetime.now().isoformat()
-                    
-                    # Date filtering
-                    if date_from or date_to:
-                        try:
-                            post_date = datetime.fromisoformat(date.replace('Z', '+00:00'))
-                            if date_from:
-                                from_date = datetime.fromisoformat(date_from.replace('Z', '+00:00'))
-                                if post_date < from_date:
-                                    continue
-                            if date_to:
-                                to_date = datetime.fromisoformat(date_to.replace('Z', '+00:00'))
-                                if post_date > to_date:
-                                    continue
-                        except:
-                            pass
-                    
-                    rating = 1 if any(word in post_text.lower() for word in ['terrible', 'awful', 'worst', 'hate']) else 2
-                    
-                    complaints.append({
-                        'text': post_text,
-                        'rating': rating,
-                        'date': date,
-                        'source': 'LinkedIn',
-                        'tool': tool_name,
-                        'metadata': {
-                            'query': query
-                        }
-                    })
+                # Date filtering
+                if date_from or date_to:
+                    try:
+                        post_date = datetime.fromisoformat(date.replace('Z', '+00:00'))
+                        if date_from:
+                            from_date = datetime.fromisoformat(date_from.replace('Z', '+00:00'))
+                            if post_date < from_date:
+                                continue
+                        if date_to:
+                            to_date = datetime.fromisoformat(date_to.replace('Z', '+00:00'))
+                            if post_date > to_date:
+                                continue
+                    except:
+                        pass
                 
-                # Rate limiting (1 req/sec)
-                import time
-                time.sleep(1)
+                rating = 1 if _RE_VERY_NEGATIVE.search(post_text) else 2
                 
-            except Exception as e:
-                logger.error("Error scraping LinkedIn", error=str(e), query=query)
-                continue
+                complaints.append({
+                    'text': post_text,
+                    'rating': rating,
+                    'date': date,
+                    'source': 'LinkedIn',
+                    'tool': tool_name,
+                    'metadata': {
+                        'query': query
+                    }
+                })
+            
+        except Exception as e:
+            logger.error("Error scraping LinkedIn", error=str(e), query=query)
         
-        logger.info("LinkedIn scraping complete", tool_name=tool_name, complaints_found=len(complaints))
         return complaints
@@ -1,13 +1,127 @@
 """Browser-based scraper using Playwright for anti-bot protection bypass"""
 
 import asyncio
-from typing import List, Dict, Any, Optional
+import math
+import random
+from typing import Callable, List, Dict, Any, Optional
+from urllib.parse import quote, urlencode
 from bs4 import BeautifulSoup
-from playwright.async_api import async_playwright, Browser, Page
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page, Route
 from utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Fixed part of each listing query: 1-2 star reviews, newest first
+_G2_QUERY = urlencode([("rating", "1"), ("rating", "2"), ("sort", "newest")])
+_CAPTERRA_QUERY = urlencode([("rating", "1-2"), ("sort", "most_recent")])
+
+# Review text is in the HTML, so these are never needed (and are most of the bytes)
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "stylesheet", "media"})
+
+# Listing pages loading at once (more tends to trip G2's anti-bot checks)
+PAGE_CONCURRENCY = 4
+
+# Reviews on a full listing page, used to decide how many pages to request
+REVIEWS_PER_PAGE = 10
+
+# Hide the automation flag from page scripts
+_STEALTH_SCRIPT = """
+    Object.defineProperty(navigator, 'webdriver', {
+        get: () => undefined
+    });
+"""
+
+
+async def _block_resources(route: Route) -> None:
+    """Abort requests for resources the parsers never look at"""
+    if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+def _parse_g2_page(content: str, tool_name: str) -> Optional[List[Dict[str, Any]]]:
+    """Reviews on a rendered G2 listing page, or None if it has no review elements"""
+    soup = BeautifulSoup(content, 'lxml')
+    
+    # Find review elements
+    review_elements = soup.find_all('div', class_='paper paper--white paper--box')
+    if not review_elements:
+        return None
+    
+    reviews = []
+    for element in review_elements:
+        # Extract review text
+        review_text_elem = element.find('div', itemprop='reviewBody')
+        if not review_text_elem:
+            continue
+        
+        review_text = review_text_elem.get_text(strip=True)
+        
+        # Extract rating
+        rating_elem = element.find('div', class_='stars')
+        rating = 1  # Default for filtered results
+        if rating_elem:
+            stars = rating_elem.find_all('div', class_='star')
+            rating = len([s for s in stars if 'full' in s.get('class', [])])
+        
+        # Extract date
+        date_elem = element.find('time')
+        date = date_elem.get('datetime', '') if date_elem else ''
+        
+        reviews.append({
+            'text': review_text,
+            'rating': rating,
+            'date': date,
+            'source': 'G2',
+            'tool': tool_name
+        })
+    
+    return reviews
+
+
+def _parse_capterra_page(content: str, tool_name: str) -> Optional[List[Dict[str, Any]]]:
+    """Reviews on a rendered Capterra listing page, or None if it has no review elements"""
+    soup = BeautifulSoup(content, 'lxml')
+    
+    # Find review elements
+    review_elements = soup.find_all('div', class_='review-card')
+    if not review_elements:
+        return None
+    
+    reviews = []
+    for element in review_elements:
+        # Extract review text
+        review_text_elem = element.find('div', class_='review-text')
+        if not review_text_elem:
+            continue
+        
+        review_text = review_text_elem.get_text(strip=True)
+        
+        # Extract rating
+        rating_elem = element.find('div', class_='rating')
+        rating = 1  # Default
+        if rating_elem:
+            rating_text = rating_elem.get_text()
+            try:
+                rating = int(float(rating_text.split()[0]))
+            except:
+                pass
+        
+        # Extract date
+        date_elem = element.find('time')
+        date = date_elem.get('datetime', '') if date_elem else ''
+        
+        reviews.append({
+            'text': review_text,
+            'rating': rating,
+            'date': date,
+            'source': 'Capterra',
+            'tool': tool_name
+        })
+    
+    return reviews
+
 
 class PlaywrightScraper:
     """Scraper using Playwright for JavaScript-rendered pages"""
@@ -15,6 +129,8 @@ class PlaywrightScraper:
     def __init__(self):
         """Initialize Playwright scraper"""
         self.browser: Optional[Browser] = None
+        self.context: Optional[BrowserContext] = None
+        self._page_slots = asyncio.Semaphore(PAGE_CONCURRENCY)  # Shared by G2 and Capterra
         logger.info("Playwright scraper initialized")
     
     async def __aenter__(self):
@@ -29,31 +145,110 @@ class PlaywrightScraper:
                 '--disable-blink-features=AutomationControlled'
             ]
         )
+        
+        # One context for every page: context setup is expensive, and sharing it
+        # keeps chromium's connection pools warm between G2 and Capterra pages
+        self.context = await self.browser.new_context(
+            viewport={'width': 1920, 'height': 1080},
+            user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+        )
+        await self.context.add_init_script(_STEALTH_SCRIPT)
+        await self.context.route("**/*", _block_resources)
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit"""
+        if self.context:
+            await self.context.close()
         if self.browser:
             await self.browser.close()
         if hasattr(self, 'playwright'):
             await self.playwright.stop()
     
     async def _create_page(self) -> Page:
-        """Create a new page with stealth settings"""
-        context = await self.browser.new_context(
-            viewport={'width': 1920, 'height': 1080},
-            user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        )
-        page = await context.new_page()
+        """Open a page in the shared context (stealth script and resource blocking already applied)"""
+        return await self.context.new_page()
+    
+    async def _scrape_one_page(
+        self,
+        url: str,
+        source: str,
+        page_num: int,
+        parse: Callable[[str], Optional[List[Dict[str, Any]]]]
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Load one listing page on its own Page and parse it
+        
+        At most PAGE_CONCURRENCY pages load at once; each holds its slot for a
+        short random delay afterwards to stay polite to the site.
+        
+        Args:
+            url: Listing page URL
+            source: Source name for logging
+            page_num: Page number for logging
+            parse: Parser for the rendered HTML
+            
+        Returns:
+            Parsed reviews, or None if the page failed or had no review elements
+        """
+        async with self._page_slots:
+            logger.info("Scraping page", source=source, url=url, page=page_num)
+            try:
+                page = await self._create_page()
+                try:
+                    # Navigate and wait for content
+                    await page.goto(url, wait_until='networkidle', timeout=30000)
+                    await page.wait_for_timeout(2000)  # Additional wait for JS rendering
+                    content = await page.content()
+                finally:
+                    await page.close()
+            except Exception as e:
+                logger.error("Error scraping page", source=source, error=str(e), page=page_num)
+                return None
+            finally:
+                await asyncio.sleep(random.uniform(1, 2))  # Polite delay
+        
+        reviews = parse(content)
+        if reviews is None:
+            logger.info("No more reviews found", source=source, page=page_num)
+        return reviews
+    
+    async def _scrape_pages(
+        self,
+        base_url: str,
+        query: str,
+        source: str,
+        max_reviews: int,
+        parse: Callable[[str], Optional[List[Dict[str, Any]]]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch enough listing pages for max_reviews concurrently
         
-        # Add stealth scripts
-        await page.add_init_script("""
-            Object.defineProperty(navigator, 'webdriver', {
-                get: () => undefined
-            });
-        """)
+        Page URLs are deterministic, so every page is requested up front and the
+        results are merged in page order, stopping at the first empty or failed page.
         
-        return page
+        Args:
+            base_url: Listing URL without the query string
+            query: Fixed part of the listing query
+            source: Source name for logging
+            max_reviews: Maximum number of reviews to return
+            parse: Parser for the rendered HTML
+            
+        Returns:
+            List of review dictionaries
+        """
+        pages_needed = max(1, math.ceil(max_reviews / REVIEWS_PER_PAGE))
+        pages = await asyncio.gather(*[
+            self._scrape_one_page(f"{base_url}?{query}&page={page_num}", source, page_num, parse)
+            for page_num in range(1, pages_needed + 1)
+        ])
+        
+        reviews = []
+        for page_reviews in pages:
+            if page_reviews is None:
+                break
+            reviews.extend(page_reviews)
+        return reviews[:max_reviews]
     
     async def scrape_g2_reviews(
         self,
@@ -76,72 +271,13 @@ class PlaywrightScraper:
             tool_slug = tool_name.lower().replace(" ", "-")
         
         reviews = []
-        page_num = 1
         
         try:
-            page = await self._create_page()
-            
-            while len(reviews) < max_reviews:
-                url = f"https://www.g2.com/products/{tool_slug}/reviews"
-                params = f"?rating=1&rating=2&sort=newest&page={page_num}"
-                full_url = url + params
-                
-                logger.info("Scraping G2 page", url=full_url, page=page_num)
-                
-                try:
-                    # Navigate and wait for content
-                    await page.goto(full_url, wait_until='networkidle', timeout=30000)
-                    await page.wait_for_timeout(2000)  # Additional wait for JS rendering
-                    
-                    # Get page content
-                    content = await page.content()
-                    soup = BeautifulSoup(content, 'html.parser')
-                    
-                    # Find review elements
-                    review_elements = soup.find_all('div', class_='paper paper--white paper--box')
-                    
-                    if not review_elements:
-                        logger.info("No more reviews found", page=page_num)
-                        break
-                    
-                    for element in review_elements:
-                        if len(reviews) >= max_reviews:
-                            break
-                        
-                        # Extract review text
-                        review_text_elem = element.find('div', itemprop='reviewBody')
-                        if not review_text_elem:
-                            continue
-                        
-                        review_text = review_text_elem.get_text(strip=True)
-                        
-                        # Extract rating
-                        rating_elem = element.find('div', class_='stars')
-                        rating = 1  # Default for filtered results
-                        if rating_elem:
-                            stars = rating_elem.find_all('div', class_='star')
-                            rating = len([s for s in stars if 'full' in s.get('class', [])])
-                        
-                        # Extract date
-                        date_elem = element.find('time')
-                        date = date_elem.get('datetime', '') if date_elem else ''
-                        
-                        reviews.append({
-                            'text': review_text,
-                            'rating': rating,
-                            'date': date,
-                            'source': 'G2',
-                            'tool': tool_name
-                        })
-                    
-                    page_num += 1
-                    await page.wait_for_timeout(3000)  # Polite delay
-                    
-                except Exception as e:
-                    logger.error("Error scraping G2 page", error=str(e), page=page_num)
-                    break
-            
-            await page.close()
+            url = f"https://www.g2.com/products/{quote(tool_slug)}/reviews"
+            reviews = await self._scrape_pages(
+                url, _G2_QUERY, "G2", max_reviews,
+                lambda content: _parse_g2_page(content, tool_name)
+            )
             logger.info("G2 scraping complete", tool_name=tool_name, reviews_found=len(reviews))
             
         except Exception as e:
@@ -171,73 +307,13 @@ class PlaywrightScraper:
             return []
         
         reviews = []
-        page_num = 1
         
         try:
-            page = await self._create_page()
-            
-            while len(reviews) < max_reviews:
-                url = f"https://www.capterra.com/p/{tool_id}/{tool_name.lower().replace(' ', '-')}/reviews/"
-                params = f"?rating=1-2&sort=most_recent&page={page_num}"
-                full_url = url + params
-                
-                logger.info("Scraping Capterra page", url=full_url, page=page_num)
-                
-                try:
-                    await page.goto(full_url, wait_until='networkidle', timeout=30000)
-                    await page.wait_for_timeout(2000)
-                    
-                    content = await page.content()
-                    soup = BeautifulSoup(content, 'html.parser')
-                    
-                    # Find review elements
-                    review_elements = soup.find_all('div', class_='review-card')
-                    
-                    if not review_elements:
-                        logger.info("No more reviews found", page=page_num)
-                        break
-                    
-                    for element in review_elements:
-                        if len(reviews) >= max_reviews:
-                            break
-                        
-                        # Extract review text
-                        review_text_elem = element.find('div', class_='review-text')
-                        if not review_text_elem:
-                            continue
-                        
-                        review_text = review_text_elem.get_text(strip=True)
-                        
-                        # Extract rating
-                        rating_elem = element.find('div', class_='rating')
-                        rating = 1  # Default
-                        if rating_elem:
-                            rating_text = rating_elem.get_text()
-                            try:
-                                rating = int(float(rating_text.split()[0]))
-                            except:
-                                pass
-                        
-                        # Extract date
-                        date_elem = element.find('time')
-                        date = date_elem.get('datetime', '') if date_elem else ''
-                        
-                        reviews.append({
-                            'text': review_text,
-                            'rating': rating,
-                            'date': date,
-                            'source': 'Capterra',
-                            'tool': tool_name
-                        })
-                    
-                    page_num += 1
-                    await page.wait_for_timeout(3000)
-                    
-                except Exception as e:
-                    logger.error("Error scraping Capterra page", error=str(e), page=page_num)
-                    break
-            
-            await page.close()
+            url = f"https://www.capterra.com/p/{quote(tool_id)}/{quote(tool_name.lower().replace(' ', '-'))}/reviews/"
+            reviews = await self._scrape_pages(
+                url, _CAPTERRA_QUERY, "Capterra", max_reviews,
+                lambda content: _parse_capterra_page(content, tool_name)
+            )
             logger.info("Capterra scraping complete", tool_name=tool_name, reviews_found=len(reviews))
             
         except Exception as e:
@@ -9,6 +9,16 @@ from utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Criticism indicators (substring, case-insensitive)
+_RE_CRITICISM = re.compile(
+    r'problem|issue|disappointed|lacking|missing|wish|needs|could be better|'
+    r'unfortunately|however|but',
+    re.IGNORECASE
+)
+_RE_VERY_NEGATIVE = re.compile(r'terrible|awful|worst|disappointed', re.IGNORECASE)
+_RE_TEXT_CLASS = re.compile(r'text|content')
+_RE_AUTHOR_CLASS = re.compile(r'user|author')
+
 
 class ProductHuntScraper:
     """Scraper for Product Hunt comments and reviews"""
@@ -62,7 +72,7 @@ class ProductHuntScraper:
                 logger.warning("Product Hunt page not found", status=response.status_code, slug=product_slug)
                 return []
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml')
             
             # Find comment elements (structure may vary)
             comment_elements = soup.find_all('div', class_=re.compile(r'comment|review'))
@@ -72,7 +82,7 @@ class ProductHuntScraper:
                     break
                 
                 # Extract comment text
-                text_elem = comment_elem.find('p') or comment_elem.find('div', class_=re.compile(r'text|content'))
+                text_elem = comment_elem.find('p') or comment_elem.find('div', class_=_RE_TEXT_CLASS)
                 if not text_elem:
                     continue
                 
@@ -83,20 +93,13 @@ class ProductHuntScraper:
                     continue
                 
                 # Look for critical/negative comments
-                negative_indicators = ['problem', 'issue', 'disappointed', 'lacking', 
-                                     'missing', 'wish', 'needs', 'could be better',
-                                     'unfortunately', 'however', 'but']
-                
-                has_criticism = any(indicator in comment_text.lower() for indicator in negative_indicators)
-                
-                if has_criticism:
+                if _RE_CRITICISM.search(comment_text):
                     # Extract author
-                    author_elem = comment_elem.find('a', class_=re.compile(r'user|author'))
+                    author_elem = comment_elem.find('a', class_=_RE_AUTHOR_CLASS)
                     author = author_elem.get_text(strip=True) if author_elem else 'Anonymous'
                     
                     # Estimate rating based on sentiment
-                    very_negative = ['terrible', 'awful', 'worst', 'disappointed']
-                    rating = 1 if any(word in comment_text.lower() for word in very_negative) else 2
+                    rating = 1 if _RE_VERY_NEGATIVE.search(comment_text) else 2
                     
                     comments.append({
                         'text': comment_text,
@@ -143,7 +146,7 @@ class ProductHuntScraper:
             if response.status_code != 200:
                 return None
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml')
             
             # Find first product link
             product_link = soup.find('a', href=re.compile(r'/posts/[a-z0-9-]+'))
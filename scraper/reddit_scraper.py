@@ -1,6 +1,7 @@
 """Reddit scraper for product complaints and reviews using PRAW API"""
 
 import re
+import time
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 from utils.logging import get_logger
@@ -16,6 +17,21 @@ except ImportError:
     PRAW_AVAILABLE = False
     import requests
 
+# Complaint indicators (substring, case-insensitive), one alternation per list
+_RE_NEGATIVE = re.compile(
+    r'problem|issue|bug|broken|disappointed|frustrated|terrible|awful|worst|hate|'
+    r'switching|alternative',
+    re.IGNORECASE
+)
+# Fallback search also treats "better than" comparisons as complaints
+_RE_NEGATIVE_SEARCH = re.compile(_RE_NEGATIVE.pattern + r'|better than', re.IGNORECASE)
+_RE_VERY_NEGATIVE = re.compile(r'terrible|awful|worst|hate', re.IGNORECASE)
+# Looser help-request indicators for subreddit browsing
+_RE_HELP_REQUEST = re.compile(
+    r'problem|issue|bug|help|not working|error|frustrated|disappointed',
+    re.IGNORECASE
+)
+
 
 class RedditScraper:
     """Scraper for Reddit complaints and product discussions using PRAW API"""
@@ -134,14 +150,10 @@ class RedditScraper:
                     continue
                 
                 # Check for complaint indicators
-                negative_words = ['problem', 'issue', 'bug', 'broken', 'disappointed', 
-                                'frustrated', 'terrible', 'awful', 'worst', 'hate',
-                                'switching', 'alternative']
-                
-                if not any(word in full_text.lower() for word in negative_words):
+                if not _RE_NEGATIVE.search(full_text):
                     continue
                 
-                rating = 1 if any(word in full_text.lower() for word in ['terrible', 'awful', 'worst', 'hate']) else 2
+                rating = 1 if _RE_VERY_NEGATIVE.search(full_text) else 2
                 
                 complaints.append({
                     'text': full_text,
@@ -253,15 +265,11 @@ class RedditScraper:
                             continue
                         
                         # Check if it's actually a complaint (negative sentiment indicators)
-                        negative_words = ['problem', 'issue', 'bug', 'broken', 'disappointed', 
-                                        'frustrated', 'terrible', 'awful', 'worst', 'hate',
-                                        'switching', 'alternative', 'better than']
-                        
-                        if not any(word in full_text.lower() for word in negative_words):
+                        if not _RE_NEGATIVE_SEARCH.search(full_text):
                             continue
                         
                         # Estimate rating based on sentiment (1-2 for complaints)
-                        rating = 1 if any(word in full_text.lower() for word in ['terrible', 'awful', 'worst', 'hate']) else 2
+                        rating = 1 if _RE_VERY_NEGATIVE.search(full_text) else 2
                         
                         complaints.append({
                             'text': full_text,
@@ -277,7 +285,6 @@ class RedditScraper:
                         })
                     
                     # Be polite - rate limiting (1 req/sec)
-                    import time
                     time.sleep(1)
                     
                 except Exception as e:
@@ -339,10 +346,7 @@ class RedditScraper:
                     continue
                 
                 # Check for negative sentiment
-                negative_indicators = ['problem', 'issue', 'bug', 'help', 'not working', 
-                                     'error', 'frustrated', 'disappointed']
-                
-                if any(indicator in full_text.lower() for indicator in negative_indicators):
+                if _RE_HELP_REQUEST.search(full_text):
                     complaints.append({
                         'text': full_text,
                         'rating': 2,  # Moderate complaint
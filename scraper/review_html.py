@@ -0,0 +1,323 @@
+"""Review page parsing shared by the G2 and Capterra scrapers
+
+Uses selectolax (lexbor C engine) with CSS selectors when installed, and
+lxml with precompiled XPath otherwise or when selectolax finds no review
+containers on a page. Both backends match class keywords case-insensitively
+inside the C engine and apply the same extraction rules, so results do not
+depend on which one is available.
+"""
+
+import re
+from functools import lru_cache
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence
+from urllib.parse import parse_qs, urlencode, urljoin, urlparse, urlunparse
+
+from lxml import etree
+
+from utils.logging import get_logger
+
+# Optional C-backed HTML parser
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
+logger = get_logger(__name__)
+
+MIN_REVIEW_LENGTH = 20  # Skip very short reviews
+MAX_COMPLAINT_RATING = 2  # Only keep 1-2 star reviews
+MAX_PAGES = 10  # Listing pages fetched per tool
+MAX_EMPTY_PAGES = 2  # Stop after this many pages in a row without a complaint
+
+_RE_DIGIT = re.compile(r'(\d+)')
+_RE_PREV = re.compile(r'prev', re.I)
+_RE_NEXT = re.compile(r'next', re.I)
+
+_WRAPPER_TAGS = ('div', 'article')
+_TEXT_TAGS = ('p', 'div')
+_RATING_TAGS = ('span', 'div')
+_DATE_TAGS = ('time', 'span', 'div')
+
+_UPPER = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+_LOWER = "abcdefghijklmnopqrstuvwxyz"
+
+
+def _css(tags: Sequence[str], keywords: Sequence[str], attr: str = "class") -> str:
+    """CSS group matching any tag whose attribute contains any keyword (case-insensitive)"""
+    return ", ".join(f'{tag}[{attr}*="{kw}" i]' for tag in tags for kw in keywords)
+
+
+def _xpath(axis: str, tags: Sequence[str], keywords: Sequence[str], attr: str = "class") -> str:
+    """XPath equivalent of _css: tags along axis whose attribute contains any keyword"""
+    value = f"translate(@{attr}, '{_UPPER}', '{_LOWER}')"
+    tag_test = " or ".join(f"self::{tag}" for tag in tags)
+    keyword_test = " or ".join(f"contains({value}, '{kw.lower()}')" for kw in keywords)
+    return f"{axis}*[({tag_test}) and ({keyword_test})]"
+
+
+@lru_cache(maxsize=None)
+def _compiled(expression: str) -> etree.XPath:
+    """Compile an XPath once per process (selectors must stay picklable for the parse pool)"""
+    return etree.XPath(expression)
+
+
+class ReviewSelectors:
+    """
+    Class-name keywords that locate review parts on a site's review pages
+    
+    Each keyword list is built once into both a CSS selector (selectolax)
+    and an XPath expression (lxml fallback).
+    """
+    
+    __slots__ = (
+        "review_css", "testid_css", "text_css", "rating_css", "date_css", "next_css",
+        "review_xpath", "testid_xpath", "text_xpath", "rating_xpath", "date_xpath", "next_xpath",
+    )
+    
+    def __init__(
+        self,
+        review: Sequence[str],
+        text: Sequence[str],
+        rating: Sequence[str] = ("rating", "star"),
+        date: Sequence[str] = ("date", "time"),
+        next_page: Sequence[str] = ("next", "page")
+    ) -> None:
+        self.review_css = _css(_WRAPPER_TAGS, review)
+        self.testid_css = _css(("div",), ("review",), attr="data-testid")
+        self.text_css = _css(_TEXT_TAGS, text)
+        self.rating_css = _css(_RATING_TAGS, rating)
+        self.date_css = _css(_DATE_TAGS, date)
+        self.next_css = _css(("a",), next_page, attr="aria-label")
+        
+        self.review_xpath = _xpath("//", _WRAPPER_TAGS, review)
+        self.testid_xpath = _xpath("//", ("div",), ("review",), attr="data-testid")
+        self.text_xpath = _xpath(".//", _TEXT_TAGS, text)
+        self.rating_xpath = _xpath(".//", _RATING_TAGS, rating)
+        self.date_xpath = _xpath(".//", _DATE_TAGS, date)
+        self.next_xpath = _xpath("//", ("a",), next_page, attr="aria-label")
+
+
+class ReviewPage(NamedTuple):
+    """Reviews extracted from one listing page"""
+    
+    reviews: List[Dict[str, Any]]
+    element_count: int  # Review containers found (0 means an empty/blocked page)
+    has_next: bool
+    next_url: Optional[str] = None  # Absolute href of the next-page link, if it has one
+
+
+def _build_review(
+    text: str,
+    rating_text: Optional[str],
+    date: Optional[str],
+    source: str
+) -> Optional[Dict[str, Any]]:
+    """Apply the shared length/rating filters to extracted fields"""
+    if not text or len(text) < MIN_REVIEW_LENGTH:
+        return None
+    
+    rating = None
+    if rating_text:
+        match = _RE_DIGIT.search(rating_text)
+        if match:
+            rating = int(match.group(1))
+    
+    if not rating or rating > MAX_COMPLAINT_RATING:
+        return None
+    
+    return {"text": text, "rating": rating, "date": date, "source": source}
+
+
+def page_number(url: Optional[str]) -> Optional[int]:
+    """Value of the ``page`` query parameter in url, if present and numeric"""
+    if not url:
+        return None
+    value = parse_qs(urlparse(url).query).get("page", [""])[0]
+    return int(value) if value.isdigit() else None
+
+
+def _resolve_href(base_url: str, href: str) -> str:
+    """Absolute href; a link on the same listing keeps filters it leaves out (e.g. ?page=2)"""
+    url = urljoin(base_url, href)
+    base, target = urlparse(base_url), urlparse(url)
+    if target.path == base.path:
+        query = parse_qs(base.query)
+        query.update(parse_qs(target.query))
+        url = urlunparse(target._replace(query=urlencode(query, doseq=True)))
+    return url
+
+
+def _next_href(links, base_url: Optional[str]) -> Optional[str]:
+    """
+    Resolved href of the next page among (aria-label, rel, href) pagination links
+    
+    A link whose rel or aria-label says "next" wins; on numbered paginators
+    without one, the lowest-numbered link past the current page is used.
+    """
+    numbered = []
+    for label, rel, href in links:
+        if not href or _RE_PREV.search(label or ""):
+            continue
+        url = _resolve_href(base_url, href) if base_url else href
+        if _RE_NEXT.search(label or "") or _RE_NEXT.search(rel or ""):
+            return url
+        number = page_number(url)
+        if number is not None:
+            numbered.append((number, url))
+    
+    current = page_number(base_url) or 1
+    later = [(number, url) for number, url in numbered if number > current]
+    return min(later)[1] if later else None
+
+
+def _first_descendant(node, selector: str):
+    """First match strictly inside node (lexbor's css() also matches node itself)"""
+    own_id = node.mem_id
+    for match in node.css(selector):
+        if match.mem_id != own_id:
+            return match
+    return None
+
+
+def _extract_selectolax(element, selectors: ReviewSelectors, source: str) -> Optional[Dict[str, Any]]:
+    """Review dict for one selectolax review container, or None if filtered out"""
+    text_elem = _first_descendant(element, selectors.text_css) or _first_descendant(element, "p")
+    if text_elem is None:
+        return None
+    text = text_elem.text(strip=True)
+    if len(text) < MIN_REVIEW_LENGTH:
+        return None
+    
+    rating_elem = _first_descendant(element, selectors.rating_css)
+    date_elem = _first_descendant(element, selectors.date_css)
+    return _build_review(
+        text,
+        rating_elem.text(strip=True) if rating_elem is not None else None,
+        date_elem.text(strip=True) if date_elem is not None else None,
+        source
+    )
+
+
+def _parse_selectolax(
+    content: bytes,
+    selectors: ReviewSelectors,
+    source: str,
+    limit: int,
+    base_url: Optional[str]
+) -> ReviewPage:
+    tree = LexborHTMLParser(content)
+    
+    elements = tree.css(selectors.review_css) or tree.css(selectors.testid_css)
+    reviews: List[Dict[str, Any]] = []
+    append = reviews.append
+    
+    if limit > 0:
+        for element in elements:
+            if (review := _extract_selectolax(element, selectors, source)) is not None:
+                append(review)
+                if len(reviews) >= limit:
+                    break
+    
+    links = tree.css(selectors.next_css)
+    next_url = _next_href(
+        ((a.attributes.get("aria-label"), a.attributes.get("rel"), a.attributes.get("href")) for a in links),
+        base_url
+    )
+    return ReviewPage(reviews, len(elements), bool(links), next_url)
+
+
+def _first(element, expression: str):
+    """First match of a descendant XPath, or None"""
+    matches = _compiled(expression)(element)
+    return matches[0] if matches else None
+
+
+def _text(element) -> str:
+    """Stripped text fragments joined together (like get_text(strip=True))"""
+    return "".join(fragment.strip() for fragment in element.itertext())
+
+
+def _extract_lxml(element, selectors: ReviewSelectors, source: str) -> Optional[Dict[str, Any]]:
+    """Review dict for one lxml review container, or None if filtered out"""
+    text_elem = _first(element, selectors.text_xpath)
+    if text_elem is None:
+        text_elem = _first(element, ".//p")
+        if text_elem is None:
+            return None
+    text = _text(text_elem)
+    if len(text) < MIN_REVIEW_LENGTH:
+        return None
+    
+    rating_elem = _first(element, selectors.rating_xpath)
+    date_elem = _first(element, selectors.date_xpath)
+    return _build_review(
+        text,
+        _text(rating_elem) if rating_elem is not None else None,
+        _text(date_elem) if date_elem is not None else None,
+        source
+    )
+
+
+def _parse_lxml(
+    content: bytes,
+    selectors: ReviewSelectors,
+    source: str,
+    limit: int,
+    base_url: Optional[str]
+) -> ReviewPage:
+    root = etree.HTML(content)
+    if root is None:  # Empty document
+        return ReviewPage([], 0, False)
+    
+    elements = _compiled(selectors.review_xpath)(root) or _compiled(selectors.testid_xpath)(root)
+    reviews: List[Dict[str, Any]] = []
+    append = reviews.append
+    
+    if limit > 0:
+        for element in elements:
+            try:
+                review = _extract_lxml(element, selectors, source)
+            except Exception as e:
+                logger.warning("Error extracting review element", error=str(e), source=source)
+                continue  # Skip this element and continue
+            
+            if review is not None:
+                append(review)
+                if len(reviews) >= limit:
+                    break
+    
+    links = _compiled(selectors.next_xpath)(root)
+    next_url = _next_href(((a.get('aria-label'), a.get('rel'), a.get('href')) for a in links), base_url)
+    return ReviewPage(reviews, len(elements), bool(links), next_url)
+
+
+def parse_review_page(
+    content: bytes,
+    selectors: ReviewSelectors,
+    source: str,
+    limit: int,
+    base_url: Optional[str] = None
+) -> ReviewPage:
+    """
+    Extract 1-2 star reviews from a review listing page
+    
+    Args:
+        content: Raw page HTML
+        selectors: Site-specific class keywords
+        source: Source label stored on each review (e.g. "G2")
+        limit: Maximum reviews to return from this page
+        base_url: URL of the page, used to resolve a relative next-page href
+    
+    Returns:
+        ReviewPage with the reviews, container count, whether a next-page
+        link exists, and that link's URL
+    """
+    if SELECTOLAX_AVAILABLE:
+        page = _parse_selectolax(content, selectors, source, limit, base_url)
+        if page.element_count or not content.strip():
+            return page
+        # No containers found: re-parse in case lexbor and libxml2 disagree
+        # on a malformed page; an empty or blocked page costs one more parse
+        logger.debug("No review containers via selectolax, retrying with lxml", source=source)
+    return _parse_lxml(content, selectors, source, limit, base_url)
@@ -1,6 +1,7 @@
 """Trustpilot scraper for business reviews"""
 
 import re
+import time
 from typing import List, Dict, Any, Optional
 import requests
 from bs4 import BeautifulSoup
@@ -9,6 +10,14 @@ from utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Class/href patterns for review and search pages, compiled once
+_RE_REVIEW_CARD = re.compile(r'review')
+_RE_REVIEW_CONTENT = re.compile(r'review-content')
+_RE_STAR_RATING = re.compile(r'star-rating')
+_RE_REVIEW_TITLE = re.compile(r'review-title')
+_RE_COMPANY_HREF = re.compile(r'/review/[a-z0-9\-\.]+')
+_RE_COMPANY_SLUG = re.compile(r'/review/([a-z0-9\-\.]+)')
+
 
 class TrustpilotScraper:
     """Scraper for Trustpilot reviews"""
@@ -65,10 +74,10 @@ class TrustpilotScraper:
                     logger.warning("Trustpilot request failed", status=response.status_code)
                     break
                 
-                soup = BeautifulSoup(response.content, 'html.parser')
+                soup = BeautifulSoup(response.content, 'lxml')
                 
                 # Find review cards
-                review_cards = soup.find_all('article', class_=re.compile(r'review'))
+                review_cards = soup.find_all('article', class_=_RE_REVIEW_CARD)
                 
                 if not review_cards:
                     break
@@ -78,14 +87,14 @@ class TrustpilotScraper:
                         break
                     
                     # Extract review text
-                    text_elem = card.find('p', class_=re.compile(r'review-content'))
+                    text_elem = card.find('p', class_=_RE_REVIEW_CONTENT)
                     if not text_elem:
                         continue
                     
                     review_text = text_elem.get_text(strip=True)
                     
                     # Extract rating
-                    rating_elem = card.find('div', class_=re.compile(r'star-rating'))
+                    rating_elem = card.find('div', class_=_RE_STAR_RATING)
                     rating = 1  # Default
                     if rating_elem:
                         rating_img = rating_elem.find('img')
@@ -100,7 +109,7 @@ class TrustpilotScraper:
                     date = date_elem.get('datetime', '') if date_elem else ''
                     
                     # Extract title
-                    title_elem = card.find('h2', class_=re.compile(r'review-title'))
+                    title_elem = card.find('h2', class_=_RE_REVIEW_TITLE)
                     title = title_elem.get_text(strip=True) if title_elem else ''
                     
                     full_text = f"{title}\n\n{review_text}".strip() if title else review_text
@@ -122,7 +131,6 @@ class TrustpilotScraper:
                 page += 1
                 
                 # Rate limiting
-                import time
                 time.sleep(2)
             
             logger.info("Trustpilot scraping complete", 
@@ -150,13 +158,13 @@ class TrustpilotScraper:
             if response.status_code != 200:
                 return None
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml')
             
             # Find first company link
-            company_link = soup.find('a', href=re.compile(r'/review/[a-z0-9\-\.]+'))
+            company_link = soup.find('a', href=_RE_COMPANY_HREF)
             if company_link:
                 href = company_link.get('href', '')
-                match = re.search(r'/review/([a-z0-9\-\.]+)', href)
+                match = _RE_COMPANY_SLUG.search(href)
                 if match:
                     return match.group(1)
             
@@ -1,13 +1,18 @@
 """Twitter/X scraper for product mentions and complaints"""
 
 import re
+import time
 from typing import List, Dict, Any, Optional
 import requests
-from datetime import datetime
+from bs4 import BeautifulSoup
+from datetime import datetime, timedelta
 from utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Strong-negative indicators (substring, case-insensitive)
+_RE_VERY_NEGATIVE = re.compile(r'terrible|awful|worst|hate|garbage', re.IGNORECASE)
+
 
 class TwitterScraper:
     """Scraper for Twitter/X product mentions (using nitter.net as proxy)"""
@@ -61,7 +66,6 @@ class TwitterScraper:
         
         # Advanced search queries with operators (2026 best practices)
         # Using operators: "Slack issues since:2025-12-01 filter:replies min_faves:5"
-        from datetime import datetime, timedelta
         
         # Default to last 30 days if no date specified
         default_since = (datetime.now() - timedelta(days=30)).strftime("%Y-%m-%d")
@@ -100,8 +104,7 @@ class TwitterScraper:
                     logger.warning("Twitter search failed", status=response.status_code, query=query)
                     continue
                 
-                from bs4 import BeautifulSoup
-                soup = BeautifulSoup(response.content, 'html.parser')
+                soup = BeautifulSoup(response.content, 'lxml')
                 
                 # Find tweet elements
                 tweet_elements = soup.find_all('div', class_='timeline-item')
@@ -138,8 +141,7 @@ class TwitterScraper:
                                 pass
                     
                     # Determine sentiment/rating
-                    very_negative = ['terrible', 'awful', 'worst', 'hate', 'garbage']
-                    rating = 1 if any(word in tweet_text.lower() for word in very_negative) else 2
+                    rating = 1 if _RE_VERY_NEGATIVE.search(tweet_text) else 2
                     
                     complaints.append({
                         'text': tweet_text,
@@ -154,7 +156,6 @@ class TwitterScraper:
                     })
                 
                 # Rate limiting
-                import time
                 time.sleep(3)
                 
             except Exception as e:
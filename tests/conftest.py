@@ -0,0 +1,10 @@
+"""Shared pytest setup"""
+
+import os
+
+# Keep test runs from reading or writing the on-disk scraper caches
+os.environ.setdefault("SCRAPE_DISK_CACHE_TTL", "0")
+os.environ.setdefault("CAPTERRA_ID_CACHE_PATH", "")
+
+# Parse async review pages inline instead of spawning worker processes
+os.environ.setdefault("SCRAPE_PARSE_WORKERS", "0")
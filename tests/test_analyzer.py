@@ -57,6 +57,37 @@ class TestPatternExtractor:
         assert "wish_desire" in categorized
         assert "cant_blocks" in categorized
     
+    def test_extract_patterns_with_sentiment(self):
+        """Test fused sentiment scoring and pattern extraction"""
+        reviews = [
+            {"text": "doesn't have the features, terrible", "rating": 1, "source": "G2"},
+            {"text": "wish it could do more", "rating": 2, "source": "G2"},
+            {"text": "can't perform tasks", "rating": 1, "source": "Capterra"},
+        ]
+        sentiment_analyzer = Mock(use_embeddings=False)
+        sentiment_analyzer.score_review.side_effect = lambda review, text_lower: review.update(sentiment_score=-0.5)
+        
+        extractor = PatternExtractor()
+        result = extractor.extract_patterns_with_sentiment(reviews, sentiment_analyzer)
+        
+        assert result["total_reviews"] == 3
+        assert sentiment_analyzer.score_review.call_count == 3
+        assert all(r["sentiment_score"] == -0.5 for r in reviews)
+        assert result["categorized_complaints"] == extractor._categorize_complaints(reviews)
+    
+    def test_pain_match_regex_fallback(self):
+        """Test regex fallback finds the same categories as the automaton"""
+        import config
+        
+        text = "It does not have exports. I can't share boards and wish it could sync."
+        expected = config.first_pain_match_per_category(text)
+        
+        with patch.object(config, "_PAIN_AC", None):
+            assert config.first_pain_match_per_category(text) == expected
+        assert expected["missing_feature"] == "does not have"
+        assert config.PAIN_PATTERNS["cant_blocks"].search("I CAN'T log in")
+        assert config.first_pain_match_per_category(text.lower(), lowered=True) == expected
+    
     def test_cluster_patterns_small_dataset(self):
         """Test clustering with small dataset"""
         reviews = [
@@ -84,15 +84,18 @@ class TestAsyncHelpers:
             {"name": "Tool2", "g2_slug": "tool2", "capterra_id": "2"}
         ]
         
-        with patch('utils.async_helpers.scrape_tool_async') as mock_scrape:
-            async def mock_scrape_side_effect(tool_name, tool_config, max_reviews):
-                return [{"text": f"{tool_name} review", "rating": 1, "source": "G2"}]
-            
-            mock_scrape.side_effect = mock_scrape_side_effect
-            
+        async def fake_scrape_many(self, tool_kwargs, max_concurrent):
+            source = "G2" if type(self).__name__.startswith("G2") else "Capterra"
+            return {
+                t["tool_name"]: [{"text": f"{t['tool_name']} review", "rating": 1, "source": source}]
+                for t in tool_kwargs
+            }
+        
+        with patch('utils.async_helpers.G2ScraperAsync.scrape_many', new=fake_scrape_many), \
+             patch('utils.async_helpers.CapterraScraperAsync.scrape_many', new=fake_scrape_many):
             results = await scrape_multiple_tools_async(tools, max_reviews_per_tool=10)
             
             assert "Tool1" in results
             assert "Tool2" in results
-            assert len(results["Tool1"]) == 1
-            assert len(results["Tool2"]) == 1
+            assert len(results["Tool1"]) == 2
+            assert [r["source"] for r in results["Tool2"]] == ["G2", "Capterra"]
@@ -2,7 +2,10 @@
 
 import time
 import pytest
-from utils.cache import CacheManager, cached
+from unittest.mock import Mock, patch
+
+from utils import cache as cache_module
+from utils.cache import CacheManager, DiskResponseStore, ResponseCache, cached
 
 
 class TestCacheManager:
@@ -81,3 +84,50 @@ class TestCachedDecorator:
         result3 = expensive_function(2, 3)
         assert result3 == 5
         assert call_count == 2
+
+
+class TestResponseCache:
+    """Test fetched-response cache"""
+    
+    def test_get_set_bounded_by_bytes(self):
+        """Test responses are cached by URL and bounded by body size"""
+        with patch('config.settings.scrape_response_cache_bytes', 10):
+            cache = ResponseCache()
+            small = Mock(content=b"12345")
+            cache.set("https://a.test/1", small)
+            assert cache.get("https://a.test/1") is small
+            
+            # Larger than the whole cache: skipped
+            cache.set("https://a.test/big", Mock(content=b"x" * 11))
+            assert cache.get("https://a.test/big") is None
+            
+            cache.clear()
+            assert cache.get("https://a.test/1") is None
+    
+    def test_disabled_with_zero_ttl(self):
+        """Test a TTL of 0 disables caching"""
+        with patch('config.settings.scrape_response_cache_ttl', 0):
+            cache = ResponseCache()
+            cache.set("https://a.test/1", Mock(content=b"123"))
+            assert cache.get("https://a.test/1") is None
+    
+    def test_disk_tier_restores_after_restart(self, tmp_path):
+        """Test bodies persist on disk and are rebuilt through restore"""
+        path = tmp_path / "http" / "responses.sqlite"
+        with patch('config.settings.scrape_disk_cache_path', str(path)), \
+             patch('config.settings.scrape_disk_cache_ttl', 60), \
+             patch.object(cache_module, '_disk_store', DiskResponseStore()):
+            restore = Mock(side_effect=lambda url, body, ct: Mock(content=body, url=url, ct=ct))
+            ResponseCache(restore=restore).set(
+                "https://a.test/1",
+                Mock(content=b"<html/>", headers={"Content-Type": "text/html"})
+            )
+            
+            # Fresh memory tier, as after a process restart
+            restored = ResponseCache(restore=restore).get("https://a.test/1")
+            assert path.exists()
+            assert restored.content == b"<html/>"
+            assert restored.ct == "text/html"
+            restore.assert_called_once()
+            
+            assert ResponseCache(restore=restore).get("https://a.test/missing") is None
@@ -2,7 +2,7 @@
 
 import pytest
 from unittest.mock import Mock, patch
-from utils.compliance import ComplianceChecker
+from utils.compliance import ComplianceChecker, reserve_token
 
 
 class TestComplianceChecker:
@@ -60,6 +60,22 @@ class TestComplianceChecker:
         assert checker.should_throttle('example.com', 0) is False
         assert checker.should_throttle('example.com', 2) is True
     
+    def test_reserve_token_bucket(self):
+        """Test token bucket allows the burst then waits for one refill"""
+        buckets = {}
+        
+        with patch('utils.compliance.time.monotonic', return_value=100.0):
+            assert reserve_token(buckets, 'example.com', rate=2.0, burst=2.0) == 0.0
+            assert reserve_token(buckets, 'example.com', rate=2.0, burst=2.0) == 0.0
+            # Bucket empty: wait exactly one token's refill time
+            assert reserve_token(buckets, 'example.com', rate=2.0, burst=2.0) == pytest.approx(0.5)
+            # Other domains have their own bucket
+            assert reserve_token(buckets, 'other.com', rate=2.0, burst=2.0) == 0.0
+        
+        with patch('utils.compliance.time.monotonic', return_value=101.0):
+            # Refilled two tokens since the reserved slot at t=100.5 (capped at burst)
+            assert reserve_token(buckets, 'example.com', rate=2.0, burst=2.0) == 0.0
+    
     def test_log_compliance_violation(self):
         """Test compliance violation logging"""
         checker = ComplianceChecker()
@@ -64,6 +64,26 @@ class TestDatabaseManager:
         
         assert result_id > 0
     
+    def test_save_analysis_results_bulk(self, temp_db):
+        """Test saving analysis results for several tools at once"""
+        db = DatabaseManager(database_url=temp_db)
+        
+        saved = db.save_analysis_results_bulk([
+            {
+                "tool_name": name,
+                "session_id": "test-session",
+                "patterns": {"patterns": []},
+                "ai_analysis": {"analysis": "test"},
+                "product_ideas": []
+            }
+            for name in ("Tool A", "Tool B", "Tool C")
+        ])
+        
+        assert saved == 3
+        results = db.get_analysis_results(analysis_type="full")
+        assert {r["tool_name"] for r in results} == {"Tool A", "Tool B", "Tool C"}
+        assert db.save_analysis_results_bulk([]) == 0
+    
     def test_get_analysis_result(self, temp_db):
         """Test retrieving analysis result"""
         db = DatabaseManager(database_url=temp_db)
@@ -1,7 +1,7 @@
 """Tests for multi-source scraper"""
 
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 from scraper.multi_source_scraper import MultiSourceScraper
 
 
@@ -18,7 +18,7 @@ class TestMultiSourceScraper:
         scraper = MultiSourceScraper()
         
         # Mock all scrapers to return empty lists
-        with patch('scraper.multi_source_scraper.asyncio.run', return_value=[]):
+        with patch('scraper.playwright_scraper.scrape_with_playwright', new=AsyncMock(return_value=[])):
             with patch('scraper.reddit_scraper.RedditScraper') as mock_reddit:
                 mock_reddit.return_value.scrape_product_complaints.return_value = []
                 
@@ -54,3 +54,20 @@ class TestMultiSourceScraper:
             call_args = mock_reddit.scrape_product_complaints.call_args
             assert call_args.kwargs.get('date_from') == date_from
             assert call_args.kwargs.get('date_to') == date_to
+    
+    def test_run_source_returns_exceptions(self):
+        """Test that a failing source is reported, not raised"""
+        import asyncio
+        
+        def broken():
+            raise RuntimeError("boom")
+        
+        async def working():
+            return [{'text': 'ok'}]
+        
+        name, result = asyncio.run(MultiSourceScraper._run_source("Broken", broken))
+        assert name == "Broken"
+        assert isinstance(result, RuntimeError)
+        
+        assert asyncio.run(MultiSourceScraper._run_source("Async", working())) == ("Async", [{'text': 'ok'}])
+        assert asyncio.run(MultiSourceScraper._run_source("Sync", lambda: [1])) == ("Sync", [1])
@@ -1,12 +1,35 @@
 """Tests for scraper modules"""
 
+import asyncio
+import io
+import time
+
+import httpx
+import requests
+
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import AsyncMock, Mock, patch, MagicMock
 from bs4 import BeautifulSoup
 
-from scraper.base import BaseScraper
+from scraper.base import BaseScraper, make_api_session, read_capped
 from scraper.g2_scraper import G2Scraper
-from scraper.capterra_scraper import CapterraScraper
+from scraper import capterra_scraper
+from scraper.capterra_scraper import CapterraIdCache, CapterraScraper
+from scraper.g2_scraper_async import G2ScraperAsync
+from scraper import google_news_scraper
+from scraper.google_news_scraper import GoogleNewsScraper
+from scraper.github_scraper_async import GitHubScraperAsync
+from scraper.hackernews_scraper import parse_hit
+from scraper.hackernews_scraper_async import HackerNewsScraperAsync
+from scraper import base_async
+from scraper.base_async import get_shared_client, shutdown_parse_pool, shutdown_shared_client
+from scraper import dedupe
+from scraper.dns_cache import CachingNetworkBackend, clear_dns_cache, install_dns_cache
+from scraper import review_html
+from scraper.exceptions import ScraperNotFound, ScraperRateLimited
+from utils.retry import backoff_delay
+from scraper.user_agents import UA_HEADERS, USER_AGENTS, random_ua_headers
+import config
 
 
 class TestBaseScraper:
@@ -72,6 +95,157 @@ class TestBaseScraper:
         assert mock_delay.call_count == 2
 
 
+class TestReadCapped:
+    """Test streamed response size cap"""
+    
+    @patch('config.settings.scrape_max_response_bytes', 10)
+    def test_read_capped(self):
+        """Test body is joined under the cap and rejected over it"""
+        assert read_capped([b"<p>", b"</p>"], None, "https://a.test") == b"<p></p>"
+        
+        with pytest.raises(ValueError):
+            read_capped([b"0123456", b"789ab"], None, "https://a.test")
+        
+        # Declared Content-Length is rejected before reading
+        with pytest.raises(ValueError):
+            read_capped(iter(()), "11", "https://a.test")
+
+
+class TestMakeApiSession:
+    """Test the shared API session factory"""
+    
+    def test_make_api_session(self):
+        """Test headers, retry statuses and pool size are applied to the https adapter"""
+        session = make_api_session({"Accept": "application/json"}, pool_maxsize=16, status_forcelist=(429, 500))
+        adapter = session.get_adapter("https://api.test")
+        
+        assert session.headers["Accept"] == "application/json"
+        assert adapter.max_retries.total == 3
+        assert adapter.max_retries.status_forcelist == [429, 500]
+        assert adapter._pool_maxsize == 16
+
+
+class TestUserAgents:
+    """Test prebuilt User-Agent headers"""
+    
+    def test_random_ua_headers_from_pool(self):
+        """Test header mappings are prebuilt, read-only and cover the pool"""
+        assert len(UA_HEADERS) == len(USER_AGENTS)
+        headers = random_ua_headers()
+        assert headers in UA_HEADERS
+        assert headers["User-Agent"] in USER_AGENTS
+        with pytest.raises(TypeError):
+            headers["User-Agent"] = "x"
+
+
+class TestReviewHtml:
+    """Test shared review page parsing"""
+    
+    HTML = b"""
+    <html><head><script>var x = '<div class=review>';</script></head><body>
+        <a aria-label="Next page" href="?page=2">next</a>
+        <div class="review">
+            <p class="review-text">This tool is terrible. It lacks basic features.</p>
+            <span class="rating">1</span>
+            <time class="date">2024-01-01</time>
+        </div>
+        <article class="Review-Card">
+            <div class="body">Very disappointed with the user interface overall.</div>
+            <div class="star-rating">2 stars</div>
+        </article>
+        <div class="review">
+            <p class="review-text">Great product overall, would recommend it.</p>
+            <span class="rating">5</span>
+        </div>
+    </body></html>
+    """
+    
+    def test_parse_review_page(self):
+        """Test low ratings are kept and pagination is detected"""
+        selectors = review_html.ReviewSelectors(
+            review=("review", "rating"),
+            text=("text", "content", "review-text", "body")
+        )
+        page = review_html.parse_review_page(self.HTML, selectors, "G2", limit=10)
+        
+        assert [r["rating"] for r in page.reviews] == [1, 2]
+        assert page.reviews[0]["date"] == "2024-01-01"
+        assert page.has_next
+        assert review_html.parse_review_page(self.HTML, selectors, "G2", limit=1).reviews == page.reviews[:1]
+    
+    def test_next_url_keeps_filters(self):
+        """Test the next link is resolved against the page and keeps its filters"""
+        selectors = review_html.ReviewSelectors(review=("review",), text=("review-text",))
+        html = b'''<a aria-label="Previous page" href="?page=1">prev</a>
+            <a aria-label="Next page" href="?page=3">next</a>'''
+        page = review_html.parse_review_page(
+            html, selectors, "G2", limit=10, base_url="https://a.test/reviews?rating=1&rating=2&page=2"
+        )
+        
+        assert page.next_url == "https://a.test/reviews?rating=1&rating=2&page=3"
+        assert review_html.page_number(page.next_url) == 3
+        assert review_html.page_number("https://a.test/reviews") is None
+    
+    def test_next_url_on_numbered_paginator(self):
+        """Test numbered page links do not shadow the next link or send paging backwards"""
+        selectors = review_html.ReviewSelectors(review=("review",), text=("review-text",))
+        base_url = "https://a.test/reviews?page=2"
+        numbered = b'''<a aria-label="Page 1" href="?page=1">1</a>
+            <a aria-label="Page 2" href="?page=2">2</a>
+            <a aria-label="Page 3" href="?page=3">3</a>
+            <a aria-label="Page 4" href="?page=4">4</a>'''
+        with_next = numbered + b'<a aria-label="Next page" href="?page=3">next</a>'
+        
+        for parse in (review_html.parse_review_page, review_html._parse_lxml):
+            for html in (numbered, with_next):
+                page = parse(html, selectors, "G2", 10, base_url)
+                assert review_html.page_number(page.next_url) == 3
+        
+        last = b'<a aria-label="Page 1" href="?page=1">1</a><a aria-label="Page 2" href="?page=2">2</a>'
+        assert review_html.parse_review_page(last, selectors, "G2", 10, base_url).next_url is None
+    
+    @pytest.mark.skipif(not review_html.SELECTOLAX_AVAILABLE, reason="selectolax not installed")
+    def test_backends_agree(self):
+        """Test selectolax and lxml backends extract the same reviews"""
+        selectors = review_html.ReviewSelectors(
+            review=("review", "rating", "comment"),
+            text=("text", "content", "review-text", "body", "comment")
+        )
+        assert (
+            review_html._parse_selectolax(self.HTML, selectors, "Capterra", 10, "https://a.test/reviews?page=1")
+            == review_html._parse_lxml(self.HTML, selectors, "Capterra", 10, "https://a.test/reviews?page=1")
+        )
+
+
+class TestDedupe:
+    """Test per-scrape duplicate filtering"""
+    
+    def test_seen_texts(self):
+        """Test only the first occurrence of a text is new"""
+        seen = dedupe.SeenTexts()
+        
+        assert seen.add("Same complaint")
+        assert not seen.add("Same complaint")
+        assert seen.add("Other complaint")
+    
+    def test_hashlib_fallback(self):
+        """Test digests are stable 64-bit ints without xxhash"""
+        with patch.object(dedupe, "XXHASH_AVAILABLE", False):
+            digest = dedupe.text_digest("text")
+            assert digest == dedupe.text_digest("text")
+        assert 0 <= digest < 2 ** 64
+    
+    @patch('scraper.g2_scraper.G2Scraper._fetch')
+    def test_repeated_page_reviews_are_dropped(self, mock_fetch):
+        """Test a review repeated on the next page is only returned once"""
+        mock_fetch.return_value = Mock(content=TestReviewHtml.HTML)
+        
+        reviews = G2Scraper().scrape_reviews("Test Tool", tool_slug="test-tool", max_reviews=10)
+        
+        assert len(reviews) == 2
+        assert len({r["text"] for r in reviews}) == 2
+
+
 class TestG2Scraper:
     """Test G2 scraper"""
     
@@ -80,6 +254,21 @@ class TestG2Scraper:
         scraper = G2Scraper()
         assert isinstance(scraper, BaseScraper)
     
+    @patch('time.sleep')
+    def test_delay_from_presampled_ring(self, mock_sleep):
+        """Test delays come from the pre-sampled ring and stay in range"""
+        scraper = G2Scraper(delay_min=1, delay_max=2)
+        scraper._delay()
+        scraper._delay()
+        
+        delays = [call[0][0] for call in mock_sleep.call_args_list]
+        assert delays == scraper._delay_ring[:2]
+        assert all(1 <= d <= 2 for d in scraper._delay_ring)
+    
+    def test_shares_compliance_checker(self):
+        """Test scrapers reuse one robots.txt cache"""
+        assert G2Scraper().compliance is CapterraScraper().compliance
+    
     @patch('scraper.g2_scraper.G2Scraper._fetch')
     def test_scrape_reviews_no_slug(self, mock_fetch):
         """Test scraping with tool name only"""
@@ -154,6 +343,87 @@ class TestG2Scraper:
         assert reviews[0]["rating"] == 1
 
 
+    @patch('scraper.g2_scraper.G2Scraper._fetch')
+    def test_stops_after_pages_without_complaints(self, mock_fetch):
+        """Test paging stops after consecutive pages with no 1-2 star reviews"""
+        mock_fetch.return_value = Mock(content=b"""
+            <html><body>
+                <div class="review">
+                    <p class="review-text">Great product, works well for our whole team.</p>
+                    <span class="rating">5</span>
+                </div>
+                <a aria-label="Next page" href="?page=2">Next</a>
+            </body></html>
+        """)
+        
+        reviews = G2Scraper().scrape_reviews("Test Tool", tool_slug="test-tool", max_reviews=10)
+        
+        assert reviews == []
+        assert mock_fetch.call_count == review_html.MAX_EMPTY_PAGES
+        assert mock_fetch.call_args_list[0].args[0] == (
+            "https://www.g2.com/products/test-tool/reviews?rating=1&rating=2&sort=newest&page=1"
+        )
+    
+    @patch('scraper.g2_scraper.G2Scraper._fetch')
+    def test_iter_reviews_is_lazy(self, mock_fetch):
+        """Test reviews stream per page, so stopping early skips later pages"""
+        mock_fetch.return_value = Mock(content=TestReviewHtml.HTML)
+        
+        reviews = G2Scraper().iter_reviews("Test Tool", tool_slug="test-tool", max_reviews=10)
+        first = next(reviews)
+        
+        assert first["rating"] == 1
+        assert mock_fetch.call_count == 1
+    
+    @patch('scraper.g2_scraper.G2Scraper._fetch')
+    def test_slug_is_url_encoded(self, mock_fetch):
+        """Test reserved characters in the slug cannot leak into the query string"""
+        mock_fetch.return_value = Mock(content=b"<html><body></body></html>")
+        
+        G2Scraper().scrape_reviews("AT&T Tool", max_reviews=10)
+        
+        assert mock_fetch.call_args_list[0].args[0] == (
+            "https://www.g2.com/products/at%26t-tool/reviews?rating=1&rating=2&sort=newest&page=1"
+        )
+    
+    def _error_response(self, status_code, headers=None):
+        response = requests.Response()
+        response.status_code = status_code
+        response.url = "https://www.g2.com/products/x/reviews"
+        response.headers.update(headers or {})
+        response.raw = io.BytesIO(b"")
+        return response
+    
+    @patch('time.sleep')
+    def test_fetch_404_raises_not_found_without_retry(self, mock_sleep):
+        """Test a 404 surfaces as ScraperNotFound and is not retried"""
+        scraper = G2Scraper()
+        scraper.breaker.reset()  # Shared process-wide; earlier tests may have opened it
+        url = "https://www.g2.com/products/missing-404/reviews"
+        with patch.object(scraper, "_check_robots_txt", return_value=True), \
+             patch.object(scraper.session, "get", return_value=self._error_response(404)) as mock_get:
+            with pytest.raises(ScraperNotFound) as exc_info:
+                scraper._fetch(url)
+        
+        assert exc_info.value.status_code == 404
+        assert isinstance(exc_info.value, requests.exceptions.HTTPError)
+        assert mock_get.call_count == 1
+    
+    @patch('time.sleep')
+    def test_fetch_429_raises_rate_limited(self, mock_sleep):
+        """Test a 429 surfaces as ScraperRateLimited with Retry-After and is not retried"""
+        scraper = G2Scraper()
+        scraper.breaker.reset()  # Shared process-wide; earlier tests may have opened it
+        response = self._error_response(429, {"Retry-After": "30"})
+        with patch.object(scraper, "_check_robots_txt", return_value=True), \
+             patch.object(scraper.session, "get", return_value=response) as mock_get:
+            with pytest.raises(ScraperRateLimited) as exc_info:
+                scraper._fetch("https://www.g2.com/products/limited-429/reviews")
+        
+        assert exc_info.value.retry_after == 30.0
+        assert mock_get.call_count == 1
+
+
 class TestCapterraScraper:
     """Test Capterra scraper"""
     
@@ -198,3 +468,350 @@ class TestCapterraScraper:
         reviews = scraper.scrape_reviews("Unknown Tool", max_reviews=10)
         
         assert reviews == []
+    
+    def test_search_url_quotes_tool_name(self):
+        """Reserved characters in the tool name are percent-encoded"""
+        url = capterra_scraper.search_url("Monday.com & Co/HR #1?")
+        assert url == "https://www.capterra.com/search/Monday.com%20%26%20Co%2FHR%20%231%3F"
+
+
+class TestCapterraIdCache:
+    """Test Capterra product ID cache"""
+    
+    def test_persists_across_instances(self, tmp_path):
+        """Test resolved IDs are written to disk and keys are normalized"""
+        path = tmp_path / "ids" / "capterra_ids.json"
+        with patch('config.settings.capterra_id_cache_path', str(path)):
+            CapterraIdCache().set(" Slack ", "175")
+            assert path.exists()
+            assert CapterraIdCache().get("slack") == "175"
+            assert CapterraIdCache().get("Zoom") is None
+    
+    @patch('scraper.capterra_scraper.CapterraScraper._fetch')
+    def test_search_result_reused(self, mock_fetch):
+        """Test the search page is fetched once per tool name"""
+        mock_fetch.return_value = Mock(content=b'<html><a href="/p/4242/acme/">Acme</a></html>')
+        scraper = CapterraScraper()
+        with patch.object(capterra_scraper, 'capterra_id_cache', CapterraIdCache()):
+            assert scraper._resolve_tool_id("Acme CRM") == "4242"
+            assert scraper._resolve_tool_id("acme crm") == "4242"
+        assert mock_fetch.call_count == 1
+
+
+class TestDnsCache:
+    """Test cached DNS resolution for the async client"""
+    
+    def test_resolves_once_per_ttl(self):
+        """Test repeated connects reuse the resolved address"""
+        inner = Mock()
+        inner.connect_tcp = AsyncMock(return_value="stream")
+        backend = CachingNetworkBackend(inner, ttl=60)
+        
+        async def run():
+            loop = asyncio.get_running_loop()
+            with patch.object(loop, "getaddrinfo", wraps=loop.getaddrinfo) as lookup:
+                assert await backend.connect_tcp("localhost", 443) == "stream"
+                assert await backend.connect_tcp("localhost", 443) == "stream"
+                await backend.connect_tcp("127.0.0.1", 443)
+            return lookup.call_count
+        
+        clear_dns_cache()
+        assert asyncio.run(run()) == 1
+        hosts = [c.args[0] for c in inner.connect_tcp.call_args_list]
+        assert "localhost" not in hosts
+        assert hosts[-1] == "127.0.0.1"
+        clear_dns_cache()
+    
+    def test_installed_on_scraper_client(self):
+        """Test async scrapers' clients connect through the caching backend"""
+        scraper = G2ScraperAsync()
+        assert isinstance(scraper.client._transport._pool._network_backend, CachingNetworkBackend)
+        assert install_dns_cache(scraper.client._transport, 60)
+
+
+class TestG2ScraperAsync:
+    """Test async G2 scraper"""
+    
+    def test_connection_limits_from_settings(self):
+        """Test pool limits default to the SCRAPER_* settings"""
+        with patch('config.settings.scraper_max_conn', 42):
+            scraper = G2ScraperAsync()
+        
+        pool = scraper.client._transport._pool
+        assert scraper.max_connections == 42
+        assert pool._max_connections == 42
+        expected_keepalive = config.settings.scraper_max_keepalive
+        if base_async.HTTP2_AVAILABLE:
+            expected_keepalive = min(expected_keepalive, base_async.HTTP2_MAX_KEEPALIVE)
+        assert pool._max_keepalive_connections == expected_keepalive
+        assert pool._http2 == base_async.HTTP2_AVAILABLE
+        assert pool._keepalive_expiry == config.settings.scraper_keepalive_expiry
+    
+    def test_shared_client_not_closed_by_scraper(self):
+        """Test scrapers reuse the shared client and leave it open on exit"""
+        async def run():
+            client = await get_shared_client()
+            assert await get_shared_client() is client
+            
+            async with G2ScraperAsync(client=client) as scraper:
+                assert scraper.client is client
+            assert not client.is_closed
+            
+            await shutdown_shared_client()
+            assert client.is_closed
+        
+        asyncio.run(run())
+    
+    def test_shared_client_per_loop_closed_with_loop(self):
+        """Test each event loop gets its own client, closed when asyncio.run finishes"""
+        async def run():
+            client = await get_shared_client()
+            assert await get_shared_client() is client
+            return client
+        
+        first = asyncio.run(run())
+        second = asyncio.run(run())
+        
+        assert first is not second
+        assert first.is_closed and second.is_closed
+    
+    def test_owned_client_closed_on_exit(self):
+        """Test a scraper closes the client it created"""
+        async def run():
+            async with G2ScraperAsync() as scraper:
+                pass
+            return scraper.client
+        
+        assert asyncio.run(run()).is_closed
+    
+    def test_scrape_many(self):
+        """Test scrape_many bounds tools in flight and isolates failures"""
+        scraper = G2ScraperAsync()
+        in_flight = 0
+        peak = 0
+        
+        async def fake_scrape(tool_name, max_reviews=30, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if tool_name == "Broken":
+                raise ValueError(tool_name)
+            return [{"text": tool_name, "rating": 1}] * max_reviews
+        
+        tools = [
+            {"tool_name": "Slack", "tool_slug": "slack", "max_reviews": 2},
+            {"tool_name": "Broken"},
+            {"tool_name": "Zoom", "max_reviews": 1},
+            {"tool_name": "Asana", "max_reviews": 1},
+        ]
+        with patch.object(scraper, "scrape_reviews", side_effect=fake_scrape):
+            results = asyncio.run(scraper.scrape_many(tools, max_concurrent=2))
+        
+        assert list(results) == ["Slack", "Broken", "Zoom", "Asana"]
+        assert len(results["Slack"]) == 2
+        assert results["Broken"] == []
+        assert len(results["Zoom"]) == 1
+        assert peak == 2
+        assert base_async.SCRAPE_MANY_CONCURRENCY < config.settings.scraper_max_conn
+    
+    def test_fetch_honors_retry_after_and_tracks_congestion(self):
+        """Test 429s back off at least Retry-After and raise host congestion"""
+        calls = []
+        
+        def handler(request):
+            calls.append(request.url)
+            if len(calls) == 1:
+                return httpx.Response(429, headers={"Retry-After": "7"})
+            return httpx.Response(200, content=b"<html>ok</html>")
+        
+        sleeps = []
+        
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+        
+        async def run():
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                scraper = G2ScraperAsync(client=client)
+                with patch.object(scraper, "_check_robots_txt", return_value=True), \
+                     patch.object(scraper, "_delay"), \
+                     patch("scraper.base_async.asyncio.sleep", side_effect=fake_sleep):
+                    response = await scraper._fetch("https://backoff.test/reviews?page=1")
+                return scraper, response
+        
+        with patch('config.settings.scrape_response_cache_ttl', 0):
+            scraper, response = asyncio.run(run())
+        
+        assert response.content == b"<html>ok</html>"
+        assert len(calls) == 2
+        assert max(sleeps) >= 7
+        assert 0 < scraper._congestion["backoff.test"] < 1
+    
+    def test_parse_in_worker_process(self):
+        """Test review pages parsed in the worker pool match inline parsing"""
+        scraper = G2ScraperAsync()
+        selectors = review_html.ReviewSelectors(
+            review=("review", "rating"),
+            text=("text", "content", "review-text", "body")
+        )
+        
+        async def run():
+            return await scraper._parse_review_page(TestReviewHtml.HTML, selectors, "G2", 10, "https://a.test/r")
+        
+        try:
+            with patch('config.settings.scrape_parse_workers', 1):
+                offloaded = asyncio.run(run())
+                assert base_async._parse_pool is not None
+        finally:
+            shutdown_parse_pool()
+        
+        assert offloaded == review_html.parse_review_page(TestReviewHtml.HTML, selectors, "G2", 10, "https://a.test/r")
+        assert [r["rating"] for r in offloaded.reviews] == [1, 2]
+    
+    def test_backoff_delay_jitter_and_congestion(self):
+        """Test backoff is capped, jittered and scaled by congestion"""
+        with patch("utils.retry.random.uniform", return_value=0.0):
+            assert backoff_delay(0) == 1.0
+            assert backoff_delay(10) == 30.0
+            assert backoff_delay(1, congestion=0.5) == 3.0
+            assert backoff_delay(0, retry_after=12.0) == 12.0
+        assert 0.5 <= backoff_delay(0) <= 1.5
+
+
+class TestApiScrapersAsync:
+    """Test cases for the async GitHub and Hacker News scrapers"""
+    
+    def test_github_fetches_remaining_pages_from_link_header(self):
+        """Test search pages after the first are fetched concurrently, in order"""
+        requests_seen = []
+        
+        def handler(request):
+            requests_seen.append(request.url)
+            page = int(request.url.params["page"])
+            headers = {}
+            if page == 1:
+                headers["Link"] = '<https://api.github.com/search/issues?page=3>; rel="last"'
+            items = [
+                {"title": f"Issue {page}-{i}", "body": "Sync is broken and crashes on every save", "labels": []}
+                for i in range(100)
+            ]
+            return httpx.Response(200, json={"total_count": 300, "items": items}, headers=headers)
+        
+        async def run():
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                scraper = GitHubScraperAsync(client=client)
+                return await scraper.scrape_issues("Tool", "o", "r", max_issues=250)
+        
+        issues = asyncio.run(run())
+        
+        assert sorted(int(url.params["page"]) for url in requests_seen) == [1, 2, 3]
+        assert requests_seen[0].path == "/search/issues"
+        assert requests_seen[0].params["q"] == "repo:o/r is:issue label:bug,enhancement,feature-request"
+        assert len(issues) == 250
+        assert issues[0]["text"].startswith("Issue 1-0")
+        assert issues[-1]["text"].startswith("Issue 3-49")
+    
+    def test_github_quota_reset_too_far_stops_scraping(self):
+        """Test an exhausted X-RateLimit quota with a distant reset is not waited out"""
+        calls = []
+        
+        def handler(request):
+            calls.append(request.url)
+            headers = {
+                "X-RateLimit-Remaining": "0",
+                "X-RateLimit-Reset": str(int(time.time()) + 3600),
+                "Link": '<https://api.github.com/search/issues?page=2>; rel="last"'
+            }
+            return httpx.Response(200, json={"total_count": 0, "items": []}, headers=headers)
+        
+        async def run():
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                scraper = GitHubScraperAsync(client=client)
+                with pytest.raises(ScraperRateLimited):
+                    await scraper._get("https://api.github.com/search/issues")
+                    await scraper._get("https://api.github.com/search/issues")
+        
+        asyncio.run(run())
+        assert len(calls) == 1
+    
+    def test_hackernews_queries_run_concurrently(self):
+        """Test all search queries are issued and a failing one is skipped"""
+        in_flight = 0
+        peak = 0
+        
+        async def handler(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            query = request.url.params["query"]
+            if query.endswith(" vs"):
+                return httpx.Response(500)
+            text = f"{query}: terrible problem, we are switching away from this product now"
+            return httpx.Response(200, json={"hits": [{"comment_text": text}]})
+        
+        async def run():
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                scraper = HackerNewsScraperAsync(client=client)
+                return await scraper.scrape_discussions("Tool", max_items=10)
+        
+        discussions = asyncio.run(run())
+        
+        assert peak > 1
+        assert len(discussions) == 4
+        assert discussions[0]["text"].startswith("Tool alternative")
+        assert all(d["rating"] == 1 for d in discussions)
+    
+    @patch('config.settings.scrape_max_response_bytes', 1000)
+    def test_api_body_is_size_capped(self):
+        """Test oversized API bodies are rejected like the sync path's"""
+        body = b'{"hits": [' + b'{"title": "x"},' * 200 + b'{}]}'
+        
+        async def run():
+            transport = httpx.MockTransport(lambda request: httpx.Response(200, content=body))
+            async with httpx.AsyncClient(transport=transport) as client:
+                scraper = HackerNewsScraperAsync(client=client)
+                return await scraper._get("https://hn.algolia.com/api/v1/search")
+        
+        with pytest.raises(ValueError, match="exceeds 1000 bytes"):
+            asyncio.run(run())
+    
+    def test_hackernews_comment_markup_stripped(self):
+        """Test HN comment HTML is reduced to text with paragraph breaks"""
+        hit = {"comment_text": "<p>A terrible problem &amp; we are <i>switching</i> to <a href=\"x\">another</a> tool.<p>Next &#x2F; paragraph"}
+        
+        record = parse_hit(hit, "Tool")
+        
+        assert record["text"] == "A terrible problem & we are switching to another tool.\nNext / paragraph"
+
+
+class TestGoogleNewsScraper:
+    """Test the SerpAPI-backed Google News scraper"""
+    
+    @pytest.mark.parametrize("status", [401, 429, 503])
+    def test_error_status_does_not_log_api_key(self, status):
+        """Test failed SerpAPI calls log the status, never the keyed URL"""
+        client = httpx.Client(transport=httpx.MockTransport(lambda request: httpx.Response(status)))
+        scraper = GoogleNewsScraper.__new__(GoogleNewsScraper)
+        scraper.api_key = "SECRET123"
+        
+        with patch("scraper.google_news_scraper.get_serpapi_client", return_value=client), \
+             patch("scraper.google_news_scraper.logger") as mock_logger:
+            assert scraper._run_query("Tool problems", "Tool", None, None) == []
+        
+        assert mock_logger.error.call_args.kwargs["status_code"] == status
+        assert "SECRET123" not in str(mock_logger.mock_calls)
+    
+    def test_missing_api_key_is_not_cached(self, monkeypatch):
+        """Test a key set after a keyless lookup is picked up, then kept"""
+        monkeypatch.setattr(google_news_scraper, "_api_key", None)
+        monkeypatch.delenv("SERPAPI_API_KEY", raising=False)
+        assert google_news_scraper._load_api_key() is None
+        
+        monkeypatch.setenv("SERPAPI_API_KEY", "late-key")
+        assert google_news_scraper._load_api_key() == "late-key"
+        
+        monkeypatch.delenv("SERPAPI_API_KEY")
+        assert google_news_scraper._load_api_key() == "late-key"
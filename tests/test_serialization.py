@@ -0,0 +1,56 @@
+"""Tests for JSON serialization helpers"""
+
+import json
+from datetime import datetime
+from unittest.mock import patch
+
+from utils import serialization
+from utils.serialization import dumps_json, loads_json
+
+
+class TestDumpsJson:
+    """Test dumps_json"""
+    
+    def test_returns_bytes(self):
+        """Test output is UTF-8 JSON bytes"""
+        data = {"tool": "Salesforce", "count": 3}
+        result = dumps_json(data)
+        
+        assert isinstance(result, bytes)
+        assert json.loads(result) == data
+    
+    def test_indent(self):
+        """Test pretty-printed output"""
+        result = dumps_json({"a": [1, 2]}, indent=True)
+        assert b"\n  " in result
+    
+    def test_non_serializable_values_use_str(self):
+        """Test unknown types fall back to str()"""
+        when = datetime(2024, 1, 1)
+        result = json.loads(dumps_json({"when": when, "obj": object}))
+        
+        assert result["when"].startswith("2024-01-01")
+        assert result["obj"] == str(object)
+    
+    def test_stdlib_fallback(self):
+        """Test stdlib encoder is used when orjson is unavailable"""
+        with patch.object(serialization, "ORJSON_AVAILABLE", False):
+            result = dumps_json({"a": 1}, indent=True)
+        
+        assert json.loads(result) == {"a": 1}
+
+
+class TestLoadsJson:
+    """Test loads_json"""
+    
+    def test_round_trip(self):
+        """Test bytes and str documents decode to the original object"""
+        data = {"items": [{"title": "Bug", "comments": 2}], "total_count": 1}
+        
+        assert loads_json(dumps_json(data)) == data
+        assert loads_json(json.dumps(data)) == data
+    
+    def test_stdlib_fallback(self):
+        """Test stdlib decoder is used when orjson is unavailable"""
+        with patch.object(serialization, "ORJSON_AVAILABLE", False):
+            assert loads_json(b'{"a": [1, 2]}') == {"a": [1, 2]}
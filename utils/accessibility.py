@@ -1,16 +1,21 @@
 """Accessibility utilities for WCAG 2.2 compliance"""
 
-from typing import Dict, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional
 
 
-def get_aria_labels() -> Dict[str, str]:
+@lru_cache(maxsize=1)
+def get_aria_labels() -> Mapping[str, str]:
     """
     Get ARIA labels for common UI elements
     
+    Built once and shared, so the mapping is read-only.
+    
     Returns:
-        Dictionary of ARIA labels
+        Mapping of ARIA labels
     """
-    return {
+    return MappingProxyType({
         "api_key_input": "Enter your xAI API key",
         "tool_select": "Select B2B SaaS tools to analyze",
         "analysis_method": "Choose analysis method: semantic or standard",
@@ -22,7 +27,7 @@ def get_aria_labels() -> Dict[str, str]:
         "opportunities_tab": "Top 3 opportunities with roadmaps",
         "progress_bar": "Analysis progress indicator",
         "status_text": "Current analysis status",
-    }
+    })
 
 
 def get_keyboard_shortcuts() -> Dict[str, str]:
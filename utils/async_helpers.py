@@ -6,6 +6,7 @@ from functools import wraps
 
 from scraper.g2_scraper_async import G2ScraperAsync
 from scraper.capterra_scraper_async import CapterraScraperAsync
+from scraper.base_async import SCRAPE_MANY_CONCURRENCY, get_shared_client
 from utils.logging import get_logger
 from utils.monitoring import monitor_performance_async
 import config
@@ -49,11 +50,12 @@ async def scrape_tool_async(
         List of review dictionaries
     """
     reviews = []
+    client = await get_shared_client()
     
     async def scrape_g2():
         """Scrape G2 reviews"""
         try:
-            async with G2ScraperAsync() as scraper:
+            async with G2ScraperAsync(client=client) as scraper:
                 return await scraper.scrape_reviews(
                     tool_name,
                     tool_slug=tool_config.get("g2_slug"),
@@ -66,7 +68,7 @@ async def scrape_tool_async(
     async def scrape_capterra():
         """Scrape Capterra reviews"""
         try:
-            async with CapterraScraperAsync() as scraper:
+            async with CapterraScraperAsync(client=client) as scraper:
                 return await scraper.scrape_reviews(
                     tool_name,
                     tool_id=tool_config.get("capterra_id"),
@@ -112,46 +114,44 @@ async def scrape_tool_async(
 async def scrape_multiple_tools_async(
     tools: List[Dict[str, Any]],
     max_reviews_per_tool: int = 30,
-    max_concurrent: int = 3
+    max_concurrent: int = SCRAPE_MANY_CONCURRENCY
 ) -> Dict[str, List[Dict[str, Any]]]:
     """
     Scrape multiple tools in parallel with concurrency limit
     
+    Runs BaseAsyncScraper.scrape_many on the G2 and Capterra scrapers
+    concurrently and merges their reviews per tool (G2 first).
+    
     Args:
         tools: List of tool dictionaries with name and config
         max_reviews_per_tool: Maximum reviews per tool
-        max_concurrent: Maximum concurrent scraping operations
+        max_concurrent: Maximum tools each scraper works on at once
         
     Returns:
         Dictionary mapping tool names to review lists
     """
-    semaphore = asyncio.Semaphore(max_concurrent)
-    results = {}
-    
-    async def scrape_with_semaphore(tool_name: str, tool_config: Dict[str, Any]):
-        """Scrape with semaphore for concurrency control"""
-        async with semaphore:
-            return tool_name, await scrape_tool_async(tool_name, tool_config, max_reviews_per_tool)
-    
-    # Create tasks for all tools
-    tasks = [
-        scrape_with_semaphore(tool["name"], tool)
+    client = await get_shared_client()
+    g2_tools = [
+        {"tool_name": tool["name"], "tool_slug": tool.get("g2_slug"), "max_reviews": max_reviews_per_tool}
+        for tool in tools
+    ]
+    capterra_tools = [
+        {"tool_name": tool["name"], "tool_id": tool.get("capterra_id"), "max_reviews": max_reviews_per_tool}
         for tool in tools
     ]
     
-    # Execute all tasks
-    completed = await asyncio.gather(*tasks, return_exceptions=True)
-    
-    # Process results
-    for result in completed:
-        if isinstance(result, Exception):
-            logger.error("Tool scraping exception", error=str(result))
-            continue
-        
-        tool_name, reviews = result
-        results[tool_name] = reviews
+    # Each scraper bounds its own tool concurrency; G2 and Capterra run side by side
+    async with G2ScraperAsync(client=client) as g2_scraper, \
+            CapterraScraperAsync(client=client) as capterra_scraper:
+        g2_results, capterra_results = await asyncio.gather(
+            g2_scraper.scrape_many(g2_tools, max_concurrent),
+            capterra_scraper.scrape_many(capterra_tools, max_concurrent)
+        )
     
-    return results
+    return {
+        tool["name"]: g2_results.get(tool["name"], []) + capterra_results.get(tool["name"], [])
+        for tool in tools
+    }
 
 
 def scrape_tool_sync(
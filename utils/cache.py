@@ -3,12 +3,16 @@
 import time
 import hashlib
 import json
-from typing import Any, Optional, Callable, TypeVar
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Optional, Callable, Tuple, TypeVar
 from functools import wraps
 from datetime import datetime, timedelta
 from cachetools import TTLCache, LRUCache
 import os
 
+import config
 from utils.logging import get_logger
 from utils.monitoring import get_monitoring
 
@@ -128,6 +132,146 @@ class CacheManager:
         return hashlib.md5(key_str.encode()).hexdigest()
 
 
+class DiskResponseStore:
+    """
+    SQLite-backed store of response bodies keyed by URL
+    
+    Survives restarts so repeated scrapes of the same pages within the TTL
+    never reach the network. Built lazily from config.settings
+    (SCRAPE_DISK_CACHE_PATH / SCRAPE_DISK_CACHE_TTL); a TTL of 0 disables it.
+    Thread-safe.
+    """
+    
+    def __init__(self) -> None:
+        self._conn: Optional[sqlite3.Connection] = None
+        self._ttl = 0
+        self._disabled = False
+        self._lock = threading.Lock()
+    
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        if self._conn is None and not self._disabled:
+            self._ttl = config.settings.scrape_disk_cache_ttl
+            if self._ttl <= 0:
+                self._disabled = True
+                return None
+            try:
+                path = Path(config.settings.scrape_disk_cache_path)
+                path.parent.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(str(path), check_same_thread=False)
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS responses ("
+                    "url TEXT PRIMARY KEY, fetched_at REAL, content_type TEXT, body BLOB)"
+                )
+                conn.execute("DELETE FROM responses WHERE fetched_at < ?", (time.time() - self._ttl,))
+                conn.commit()
+                self._conn = conn
+            except sqlite3.Error as e:
+                logger.warning("Disk response cache unavailable", error=str(e))
+                self._disabled = True
+        return self._conn
+    
+    def get(self, url: str) -> Optional[Tuple[bytes, Optional[str]]]:
+        """(body, content type) stored for url within the TTL, or None"""
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return None
+            row = conn.execute(
+                "SELECT body, content_type FROM responses WHERE url = ? AND fetched_at >= ?",
+                (url, time.time() - self._ttl)
+            ).fetchone()
+        return (bytes(row[0]), row[1]) if row else None
+    
+    def set(self, url: str, body: bytes, content_type: Optional[str]) -> None:
+        """Store a response body for url"""
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)",
+                    (url, time.time(), content_type, body)
+                )
+                conn.commit()
+            except sqlite3.Error as e:
+                logger.debug("Could not write disk response cache", url=url, error=str(e))
+
+
+class ResponseCache:
+    """
+    Process-wide cache of fetched HTTP responses keyed by URL
+    
+    The in-memory tier is bounded by total body bytes rather than entry
+    count and built lazily on first use from config.settings
+    (SCRAPE_RESPONSE_CACHE_TTL / SCRAPE_RESPONSE_CACHE_BYTES); a TTL of 0
+    disables it. When a ``restore`` callable is given, bodies are also kept
+    in the shared DiskResponseStore and rebuilt into response objects with
+    ``restore(url, body, content_type)`` after a restart. Thread-safe.
+    """
+    
+    def __init__(
+        self,
+        restore: Optional[Callable[[str, bytes, Optional[str]], Any]] = None
+    ) -> None:
+        self._cache: Optional[TTLCache] = None
+        self._lock = threading.Lock()
+        self._restore = restore
+    
+    def _get_cache(self) -> Optional[TTLCache]:
+        if self._cache is None:
+            ttl = config.settings.scrape_response_cache_ttl
+            if ttl <= 0:
+                return None
+            self._cache = TTLCache(
+                maxsize=config.settings.scrape_response_cache_bytes,
+                ttl=ttl,
+                getsizeof=lambda response: len(response.content) or 1
+            )
+        return self._cache
+    
+    def _set_memory(self, url: str, response: Any) -> None:
+        with self._lock:
+            cache = self._get_cache()
+            if cache is None:
+                return
+            try:
+                cache[url] = response
+            except ValueError:
+                pass  # Single body larger than the whole cache
+    
+    def get(self, url: str) -> Optional[Any]:
+        """Cached response for url, or None"""
+        with self._lock:
+            cache = self._get_cache()
+            response = cache.get(url) if cache is not None else None
+        if response is not None or self._restore is None:
+            return response
+        
+        stored = _disk_store.get(url)
+        if stored is None:
+            return None
+        response = self._restore(url, *stored)
+        self._set_memory(url, response)
+        return response
+    
+    def set(self, url: str, response: Any) -> None:
+        """Cache a fully-read response (bodies larger than the cache are skipped)"""
+        self._set_memory(url, response)
+        if self._restore is not None:
+            _disk_store.set(url, response.content, response.headers.get("Content-Type"))
+    
+    def clear(self) -> None:
+        """Drop all in-memory cached responses"""
+        with self._lock:
+            if self._cache is not None:
+                self._cache.clear()
+
+
+# Shared on-disk tier for every ResponseCache with a restore callable
+_disk_store = DiskResponseStore()
+
+
 # Global cache instance
 _cache_manager = CacheManager()
 
@@ -1,13 +1,65 @@
 """Compliance module for ethical scraping practices"""
 
+import time
 import urllib.robotparser
-from typing import Optional, Dict, List
+from functools import lru_cache
+from typing import Optional, Dict, List, Tuple
 from urllib.parse import urlparse
 from utils.logging import get_logger
 
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=1024)
+def url_netloc(url: str) -> str:
+    """Network location (domain[:port]) of a URL, memoized for repeat fetches"""
+    return urlparse(url).netloc
+
+
+@lru_cache(maxsize=1024)
+def url_origin(url: str) -> str:
+    """Scheme and network location of a URL, e.g. https://www.g2.com"""
+    parsed = urlparse(url)
+    return f"{parsed.scheme}://{parsed.netloc}"
+
+
+def reserve_token(
+    buckets: Dict[str, Tuple[float, float]],
+    domain: str,
+    rate: float,
+    burst: float = 1.0
+) -> float:
+    """
+    Take one request token from a per-domain token bucket
+    
+    Tokens refill continuously at ``rate`` per second up to ``burst``, so
+    requests within the budget go out immediately and an overrun only waits
+    as long as it takes to refill a single token.
+    
+    Args:
+        buckets: Mutable map of domain -> (tokens, last monotonic timestamp)
+        domain: Domain being requested
+        rate: Allowed requests per second
+        burst: Maximum tokens a domain can accumulate
+        
+    Returns:
+        Seconds the caller must wait before sending (0.0 if none)
+    """
+    now = time.monotonic()
+    tokens, last = buckets.get(domain, (burst, now))
+    tokens = min(burst, tokens + (now - last) * rate)
+    
+    if tokens >= 1.0:
+        buckets[domain] = (tokens - 1.0, now)
+        return 0.0
+    
+    # Spend the token as soon as it exists; the bucket is empty at that moment
+    wait = (1.0 - tokens) / rate
+    buckets[domain] = (0.0, now + wait)
+    logger.debug("Throttling request", domain=domain, wait_seconds=wait)
+    return wait
+
+
 class ComplianceChecker:
     """Check robots.txt and enforce ethical scraping practices"""
     
@@ -28,11 +80,11 @@ class ComplianceChecker:
             True if allowed, False if disallowed
         """
         try:
-            parsed = urlparse(url)
-            base_url = f"{parsed.scheme}://{parsed.netloc}"
+            base_url = url_origin(url)
             
-            # Check cache
-            cache_key = f"{base_url}:{user_agent}"
+            # robots.txt is per site, not per user agent, so one parsed copy
+            # serves every rotated User-Agent
+            cache_key = base_url
             if cache_key in self.robots_cache:
                 rp = self.robots_cache[cache_key]
                 if rp is None:
@@ -81,6 +133,9 @@ class ComplianceChecker:
         """
         Check if requests should be throttled based on domain
         
+        Counter-based check kept for callers that track their own counts;
+        the scrapers pace requests with reserve_token() instead.
+        
         Args:
             domain: Domain name
             request_count: Number of requests made (tracked by caller)
@@ -91,8 +146,6 @@ class ComplianceChecker:
         """
         # Rate limiting: 1 request per second per domain
         # If we've made a request in this time window, throttle
-        # Note: This is a simple implementation - caller should reset count after delay
-        # For production, use a proper rate limiter with timestamps (e.g., Redis)
         if request_count >= 1:
             logger.debug("Throttling request", domain=domain, count=request_count)
             return True
@@ -2,17 +2,24 @@
 
 from typing import List, Dict, Any, Optional
 from datetime import datetime
-from sqlalchemy import create_engine, Column, Integer, String, Text, DateTime, JSON, Index
+from sqlalchemy import create_engine, insert, Column, Integer, String, Text, DateTime, JSON, Index
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 from utils.logging import get_logger
+from utils.serialization import dumps_json
 import os
+import threading
 
 logger = get_logger(__name__)
 
 Base = declarative_base()
 
 
+def _serialize_json_column(value: Any) -> str:
+    """Encode a JSON column value (numpy scalars and other non-JSON types included)"""
+    return dumps_json(value).decode("utf-8")
+
+
 class Review(Base):
     """Review/complaint database model"""
     __tablename__ = 'reviews'
@@ -61,7 +68,8 @@ class DatabaseManager:
             db_path = os.getenv("DATABASE_PATH", "b2b_analyzer.db")
             database_url = f"sqlite:///{db_path}"
         
-        self.engine = create_engine(database_url, echo=False)
+        # JSON columns are encoded once with orjson (when installed) instead of the stdlib encoder
+        self.engine = create_engine(database_url, echo=False, json_serializer=_serialize_json_column)
         self.SessionLocal = sessionmaker(bind=self.engine)
         
         # Create tables
@@ -209,6 +217,51 @@ class DatabaseManager:
         finally:
             session.close()
     
+    def save_analysis_results_bulk(self, rows: List[Dict[str, Any]]) -> int:
+        """
+        Save analysis results for several tools in a single transaction
+        
+        Args:
+            rows: Dicts with tool_name, session_id, patterns, ai_analysis
+                and product_ideas keys (one per tool)
+            
+        Returns:
+            Number of results saved
+        """
+        if not rows:
+            return 0
+        
+        session = self.get_session()
+        
+        try:
+            session.execute(
+                insert(AnalysisResult),
+                [
+                    {
+                        "tool_name": row["tool_name"],
+                        "analysis_type": "full",
+                        "result_data": {
+                            "session_id": row.get("session_id"),
+                            "patterns": row.get("patterns"),
+                            "ai_analysis": row.get("ai_analysis"),
+                            "product_ideas": row.get("product_ideas", [])
+                        }
+                    }
+                    for row in rows
+                ]
+            )
+            session.commit()
+            
+            logger.info("Analysis results saved", count=len(rows))
+            return len(rows)
+            
+        except Exception as e:
+            session.rollback()
+            logger.error("Error saving analysis results", error=str(e))
+            raise
+        finally:
+            session.close()
+    
     def get_analysis_results(
         self,
         tool_name: Optional[str] = None,
@@ -253,3 +306,21 @@ class DatabaseManager:
             
         finally:
             session.close()
+
+
+_db_manager: Optional[DatabaseManager] = None
+_db_manager_lock = threading.Lock()
+
+
+def get_db_manager() -> DatabaseManager:
+    """
+    Get the process-wide DatabaseManager (default database URL)
+    
+    Shared so the engine and its connection pool are created once.
+    """
+    global _db_manager
+    if _db_manager is None:
+        with _db_manager_lock:
+            if _db_manager is None:
+                _db_manager = DatabaseManager()
+    return _db_manager
@@ -2,6 +2,8 @@
 
 from typing import Callable, TypeVar, Optional, List
 from functools import wraps
+from email.utils import parsedate_to_datetime
+import random
 import time
 from tenacity import (
     retry,
@@ -17,13 +19,75 @@ logger = get_logger(__name__)
 
 T = TypeVar('T')
 
+# Jittered backoff defaults for HTTP fetches
+BACKOFF_BASE = 1.0  # seconds
+BACKOFF_CAP = 30.0  # seconds
+BACKOFF_JITTER = 0.5  # +/- fraction of the computed delay
+CONGESTION_ALPHA = 0.2  # EWMA weight of the latest response
+
+
+def backoff_delay(
+    attempt: int,
+    congestion: float = 0.0,
+    retry_after: Optional[float] = None,
+    base: float = BACKOFF_BASE,
+    cap: float = BACKOFF_CAP,
+    jitter: float = BACKOFF_JITTER
+) -> float:
+    """
+    Delay before the next retry: capped exponential with jitter
+    
+    The delay grows further with the host's recent rate-limit ratio
+    (congestion, 0-1) and never undercuts a server Retry-After.
+    
+    Args:
+        attempt: Zero-based attempt that just failed
+        congestion: Recent share of responses from this host that were 429s
+        retry_after: Seconds requested by the server, if any
+        base: Delay for the first retry (seconds)
+        cap: Upper bound before jitter (seconds)
+        jitter: Random spread as a fraction of the delay
+        
+    Returns:
+        Seconds to wait
+    """
+    delay = min(cap, base * (2 ** attempt)) * (1 + random.uniform(-jitter, jitter))
+    delay *= 1 + congestion
+    if retry_after is not None:
+        delay = max(delay, retry_after)
+    return delay
+
+
+def update_congestion(current: float, throttled: bool, alpha: float = CONGESTION_ALPHA) -> float:
+    """Fold one response into a host's EWMA rate-limit ratio"""
+    return current + alpha * ((1.0 if throttled else 0.0) - current)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header (delta-seconds or HTTP-date)
+    
+    Returns:
+        Seconds to wait, or None if absent or malformed
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
 
 def retry_with_backoff(
     max_attempts: int = 3,
     initial_wait: float = 1.0,
     max_wait: float = 60.0,
     exponential_base: float = 2.0,
-    retryable_exceptions: Optional[tuple] = None
+    retryable_exceptions: Optional[tuple] = None,
+    non_retryable_exceptions: tuple = ()
 ):
     """
     Decorator for retrying functions with exponential backoff
@@ -34,6 +98,8 @@ def retry_with_backoff(
         max_wait: Maximum wait time in seconds
         exponential_base: Base for exponential backoff
         retryable_exceptions: Tuple of exception types to retry on
+        non_retryable_exceptions: Exception types re-raised immediately even
+            if they match retryable_exceptions
         
     Example:
         @retry_with_backoff(max_attempts=5, initial_wait=2.0)
@@ -52,6 +118,8 @@ def retry_with_backoff(
             while attempt < max_attempts:
                 try:
                     return func(*args, **kwargs)
+                except non_retryable_exceptions:
+                    raise
                 except retryable_exceptions as e:
                     attempt += 1
                     last_exception = e
@@ -103,11 +171,12 @@ def retry_api_call(max_attempts: int = 3):
     )
 
 
-def retry_scraper(max_attempts: int = 3):
+def retry_scraper(max_attempts: int = 3, non_retryable: tuple = ()):
     """Retry decorator specifically for scraping operations"""
     return retry_with_backoff(
         max_attempts=max_attempts,
         initial_wait=3.0,
         max_wait=60.0,
-        retryable_exceptions=(ConnectionError, TimeoutError, Exception)
+        retryable_exceptions=(ConnectionError, TimeoutError, Exception),
+        non_retryable_exceptions=non_retryable
     )
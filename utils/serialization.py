@@ -0,0 +1,50 @@
+"""Fast JSON serialization with a stdlib fallback"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+if ORJSON_AVAILABLE:
+    _ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def dumps_json(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize an object to UTF-8 JSON bytes
+    
+    Uses orjson when installed, otherwise the stdlib encoder. Values that are
+    not natively serializable are converted with str().
+    
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with a two-space indent
+        
+    Returns:
+        Encoded JSON document
+    """
+    if ORJSON_AVAILABLE:
+        option = _ORJSON_OPTIONS | orjson.OPT_INDENT_2 if indent else _ORJSON_OPTIONS
+        return orjson.dumps(obj, option=option, default=str)
+    return json.dumps(obj, indent=2 if indent else None, default=str).encode("utf-8")
+
+
+def loads_json(data: Union[bytes, str]) -> Any:
+    """
+    Parse a JSON document (e.g. a raw HTTP response body)
+    
+    Uses orjson when installed, otherwise the stdlib decoder.
+    
+    Args:
+        data: JSON document as bytes or str
+        
+    Returns:
+        Decoded Python object
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)